@@ -17,11 +17,16 @@ from utils.chess_types import DirCls as D
 
 # One action could have multiple possible outcomes depending on selected tile.
 
-from chess.actions.outcome import Outcome
+from chess.actions.outcome import MoveRecord
 from chess.tiles.tile import Tile
 
+DEBUG_OUTCOMES: bool = False # Print skipped and replaced outcomes (outcomes are generated for every searched position).
+
 class Action(GlobalAccessObject):
-    name: str
+    __slots__ = ('piece', 'outcomes')
+    
+    name: str = 'Action' # Set to the class name for each subclass
+    can_capture: bool = True # False for actions which never capture (skipped when only captures are generated).
     piece: object
         
     # TODO: Tile -> Action?
@@ -30,15 +35,18 @@ class Action(GlobalAccessObject):
      # TODO: Avoid overwriting with multiple positions!
      #      Use a list?
      #      Or an 'insert' method which handles this?
-    outcomes: Dict[Tile, Outcome]
+    outcomes: Dict[Tile, MoveRecord]
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.name = cls.__name__
     
     def __init__(self, piece):
-        self.name = self.__class__.__name__
         self.piece = piece
-        self.outcomes: Dict[Tile, Outcome] = {}
+        self.outcomes: Dict[Tile, MoveRecord] = {}
         # self.action_count = 0
     
-    def add_outcome(self, tile: Tile, outcome: Outcome) -> bool:
+    def add_outcome(self, tile: Tile, outcome: MoveRecord) -> bool:
         """
         Add an outcome to the action.
         """
@@ -46,11 +54,11 @@ class Action(GlobalAccessObject):
         # TODO: Should still 'show' the possible outcome, but not allow it.
         # Skip if cannot afford the leadership cost?
         if self.board.get_leadership(self.piece.loyalty) - outcome.l_delta < 0:
-            print(f"Action: Not enough leadership to apply outcome {outcome} for tile {tile}.")
+            if DEBUG_OUTCOMES: print(f"Action: Not enough leadership to apply outcome {outcome} for tile {tile}.")
             return False
         
         # TODO: Remove this check?
-        if tile in self.outcomes:
+        if DEBUG_OUTCOMES and tile in self.outcomes:
             print(f"Action: Outcome already exists for tile {tile}.")
             print(f'\tReplacing with {outcome}.')
             print(f'\tPrevious outcome: {self.outcomes[tile]}')
@@ -64,7 +72,9 @@ class Action(GlobalAccessObject):
         """
         Update outcomes.
         """
-        self.outcomes.clear()
+        # NOTE: Replaced rather than cleared, so an undo record can restore the previous dict.
+        self.board.record(setattr, self, 'outcomes', self.outcomes)
+        self.outcomes = {}
         
     # # TODO: Would this be useful?
     # def realize(self, pos: Position):
@@ -107,4 +117,8 @@ class Action(GlobalAccessObject):
     
     @property
     def get_line(self) -> Callable:
-        return self.piece.get_line
\ No newline at end of file
+        return self.piece.get_line
+    
+    @property
+    def get_jumps(self) -> Callable:
+        return self.piece.get_jumps
\ No newline at end of file
@@ -1,18 +1,13 @@
-import pygame as pg
 import numpy as np
-from typing import Dict, Optional, Self, Union, Tuple, Callable, List
+from enum import IntEnum
+from typing import Dict, Optional, Self, Union, Tuple, Callable, List, NamedTuple
 
 from utils.chess_types import Position, Vector, Direction
 from utils.chess_types import Loyalty, PieceType
 from utils.chess_types import DirCls as D
+from utils.chess_types import vadd, vsub, vscale
 
-from globalref import GlobalAccessObject
-
-from utils.ui_utils import sprite_transform
-
-
-# TODO: Add 'captured pieces' property to outcomes.
-#       This way an outcome doesn't need to be a 'capture' to be flagged as such.
+from globalref import OBJREF, GlobalAccessObject
 
 
 # TODO: Add an outcome which represents a move with multiple possible targets?
@@ -20,27 +15,56 @@ from utils.ui_utils import sprite_transform
 #           Have actions take an input position and apply their effects directly.
 
 
+def truncate(lst: list, length: int) -> None:
+    """
+    Undo helper, removes everything appended to a list after it had the given length.
+    """
+    del lst[length:]
+
+
+class UndoRecord:
+    """
+    Journal of every state change made while applying an outcome.
+    Entries are (function, args) pairs which restore the previous state when called in reverse.
+    """
+    __slots__ = ('outcome', 'key', 'entries', 'dirty')
+    
+    outcome: object
+    key: int # Position key before the outcome was applied
+    entries: List[Tuple[Callable, tuple]]
+    dirty: Tuple[set, set] # Board dirty squares/factions before the outcome was applied
+    
+    def __init__(self, outcome: object, key: int):
+        self.outcome = outcome
+        self.key = key
+        self.entries = []
+    
+    def __len__(self):
+        return len(self.entries)
+
+
 
 class Outcome(GlobalAccessObject):
     """
     Represents a change in board state.
     """
+    __slots__ = ('piece', 'callback', 'l_delta', 'end_turn')
     
-    name: str
+    name: str = 'Outcome' # Set to the class name for each subclass
     piece: object
     callback: Callable
     
     # m_delta: int # TODO: Remove or implement? Probably not worth.
     l_delta: int
-    end_turn: bool = True
+    end_turn: bool
+    captured: Tuple[object] = () # Pieces removed by this outcome (any outcome can be flagged as a capture).
     
     # TODO: Store some info that could be used to preview the action?
     # prev_dict: Dict[Piece, Optional[Position]] = {}
     # TODO: Could also contain code to render this preview?
     #       With a lerp value?
     
-    _effect_sprite: Union[pg.Surface, None]
-    _hover_sprites: Union[Tuple[pg.Surface], None]
+    effect: Optional[str] = None # Name of the tile effect sprites (resolved by the UI)
     
     def __init__(self,
                  piece: object,
@@ -49,12 +73,15 @@ class Outcome(GlobalAccessObject):
                  end_turn: bool = True, # TODO: Should turns just end when you run out of leadership or 'actions'?
                 #  **kwargs
                  ):
-        self.name = self.__class__.__name__
         self.piece = piece
         self.callback = callback
         self.l_delta = l_delta
         self.end_turn = end_turn
     
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.name = cls.__name__
+    
     def realize(self) -> bool:
         """
         Apply this outcome to the board state.
@@ -64,59 +91,57 @@ class Outcome(GlobalAccessObject):
         self.board.update_leadership(self.l_delta)
         return self.end_turn
     
-    # TODO: This would be neat.
-    def preview(self, surf, lerp: float):
+    def apply(self) -> UndoRecord:
         """
-        Preview the action.
+        Realize this outcome on the board (ending the turn if needed).
+        Returns an undo record which Board.undo uses to restore the previous state exactly.
         """
-        pass
+        return self.board.apply(self)
     
-    def get_effect(self) -> Optional[pg.Surface]: # TODO: Add override arguments for board/ui?
+    def movements(self) -> List[Tuple[object, Position]]:
         """
-        Get the tile effect sprite for this outcome.
+        Returns (piece, target) for every piece this outcome moves.
         """
-        if self._effect_sprite is None: return None
-        ui = self.ui
-        img = sprite_transform(img=self._effect_sprite,
-                               rotate_by=ui.frame//(ui.fps//4),
-                               size=ui.tile_size)
-        return img
+        return []
     
-    def get_hover_effect(self) -> Optional[pg.Surface]:
-        if self._hover_sprites is None: return None
-        ui = self.ui
-        img = self._hover_sprites[ui.frame//(ui.fps//4)%len(self._hover_sprites)]
-        img = sprite_transform(img=img, size=ui.tile_size)
-        return img
+    # TODO: This would be neat.
+    def preview(self, surf, lerp: float):
+        """
+        Preview the action.
+        """
+        pass
 
 
 
 class Move(Outcome):
+    __slots__ = ('target',)
     target: Position
+    effect: str = 'Move'
     
     # LERP_MAX: float = 0.5 # TODO: Make this a constant?
     
     def __init__(self, piece, target: Position, **kwargs):
         super().__init__(piece=piece, **kwargs)
         self.target = target
-        self._effect_sprite = self.al.tile_effect_sprites['Move']
-        self._hover_sprites = self.al.tile_effect_sprites['blinds']['Move']
     
     def realize(self):
         self.piece.move(self.target)
         return super().realize()
     
+    def movements(self) -> List[Tuple[object, Position]]:
+        return [(self.piece, self.target)]
+    
     def preview(self, surf, lerp: float):
         pass
         
 class Capture(Move):
+    __slots__ = ('captured',)
     captured: Tuple[object] # Captured pieces.
+    effect: str = 'Capture'
     
     def __init__(self, piece, target: Position, captured: Union[object, Tuple[object]], **kwargs):
         super().__init__(piece=piece, target=target, **kwargs)
         self.captured = captured if isinstance(captured, tuple) else (captured,)
-        self._effect_sprite = self.al.tile_effect_sprites['Capture']
-        self._hover_sprites = self.al.tile_effect_sprites['blinds']['Capture']
         # NOTE: Set l_delta based on capture?
     
     def realize(self):
@@ -128,6 +153,7 @@ class Capture(Move):
 
 
 class Promote(Move): # TODO: Could be capture???
+    __slots__ = ('promoted_to',)
     promoted_to: PieceType
     def __init__(self, piece, target: Position, promoted_to: PieceType = PieceType.QUEEN, **kwargs):
         super().__init__(piece=piece, target=target, **kwargs)
@@ -144,30 +170,44 @@ class Promote(Move): # TODO: Could be capture???
 
 
 class Castle(Outcome):
+    __slots__ = ('rook_piece',)
     rook_piece: object
+    effect: str = 'Castle'
     
     def __init__(self, king_piece, rook_piece, l_delta: int = -1, **kwargs):
         super().__init__(piece=king_piece, l_delta=l_delta, **kwargs)
         # NOTE: self.piece is the king piece.
         self.rook_piece = rook_piece
-        self._effect_sprite = self.al.tile_effect_sprites['Castle']
-        self._hover_sprites = self.al.tile_effect_sprites['blinds']['Castle']
-
     
     def realize(self):
         # TODO: Should we really care if the king is in check?
-        vec = self.rook_piece.position - self.piece.position
-        vec = vec // abs(sum(vec)) # NOTE: Should work because it is a cardinal vector
-        self.piece.move(self.piece.position + vec*2)
-        self.rook_piece.move(self.piece.position - vec)
+        (_, king_target), (_, rook_target) = self.movements()
+        self.piece.move(king_target)
+        self.rook_piece.move(rook_target)
         return super().realize()
+    
+    def movements(self) -> List[Tuple[object, Position]]:
+        return castle_movements(self.piece, self.rook_piece)
+
+
+def castle_movements(king_piece, rook_piece) -> List[Tuple[object, Position]]:
+    """
+    Returns (piece, target) for the king and rook of a castle.
+    """
+    vec = vsub(rook_piece.position, king_piece.position)
+    step = abs(vec[0] + vec[1])
+    vec = (vec[0] // step, vec[1] // step) # NOTE: Should work because it is a cardinal vector
+    king_target = vadd(king_piece.position, vscale(vec, 2))
+    return [(king_piece, king_target), (rook_piece, vsub(king_target, vec))]
 
 
 class Summon(Outcome):
+    __slots__ = ('target', 'summoned', 'summon_loyalty')
     piece: object
     target: Position
     summoned: object
     summon_loyalty: Loyalty
+    effect: str = 'Summon'
     
     def __init__(self, piece, target: Position,
                  summoned: type, loyalty: Optional[Loyalty] = None,
@@ -176,9 +216,7 @@ class Summon(Outcome):
         self.target = target
         self.summoned = summoned
         self.summon_loyalty = loyalty if loyalty is not None else self.piece.loyalty
-        self._effect_sprite = self.al.tile_effect_sprites['Summon']
-        self._hover_sprites = self.al.tile_effect_sprites['blinds']['Summon']
-
+        
         # TODO: Make zombie cost 1 leadership per-turn?
         # Consume zombie or adjacent pieces to regain leadership? (Does this end turn?)
     
@@ -193,8 +231,10 @@ class MultiMove(Outcome):
     """
     Represents a move that moves multiple pieces.
     """
+    __slots__ = ('pieces', 'targets')
     pieces: List[object]
     targets: List[Position]
+    effect: str = 'Move'
     
     def __init__(self, pieces: List[object], targets: List[Position], **kwargs):
         super().__init__(piece=pieces[0], **kwargs)
@@ -202,31 +242,142 @@ class MultiMove(Outcome):
         assert len(pieces) == len(targets), "Number of pieces must match number of targets."
         self.pieces = pieces
         self.targets = targets
-        
-        self._effect_sprite = self.al.tile_effect_sprites['Move']
-        self._hover_sprites = self.al.tile_effect_sprites['blinds']['Move']
     
     def realize(self):
         for p, t in zip(self.pieces, self.targets):
             p.move(t)
         return super().realize()
+    
+    def movements(self) -> List[Tuple[object, Position]]:
+        return list(zip(self.pieces, self.targets))
 
 class MultiCapture(MultiMove):
     """
     Represents a move that moves multiple pieces and involves at least one capture..
     """
+    __slots__ = ('captured',)
     captured: List[object]  # Captured pieces.
+    effect: str = 'Capture'
     
     def __init__(self, pieces: List[object], targets: List[Position], captured: List[object], **kwargs):
         super().__init__(pieces=pieces, targets=targets, **kwargs)
         self.captured = captured
         self.pieces = self.pieces[::-1]
         self.targets = self.targets[::-1]
-        self._effect_sprite = self.al.tile_effect_sprites['Capture']
-        self._hover_sprites = self.al.tile_effect_sprites['blinds']['Capture']
     
     def realize(self):
         for p in self.captured:
             t = self.board.get_tile(p.position)
             t.piece = None
         return super().realize()
+
+
+
+# # # # # # # # # #
+# MOVE RECORDS
+#   Actions generate compact MoveRecords rather than Outcome objects.
+#   A record is only materialized into its Outcome when it is realized,
+#   so generating (and discarding) outcomes for every piece each update stays cheap.
+
+class OutcomeKind(IntEnum):
+    MOVE = 0
+    CAPTURE = 1
+    CASTLE = 2
+    SUMMON = 3
+    MULTI_MOVE = 4
+    MULTI_CAPTURE = 5
+
+
+OUTCOME_CLASSES: Dict[OutcomeKind, type] = {
+    OutcomeKind.MOVE: Move,
+    OutcomeKind.CAPTURE: Capture,
+    OutcomeKind.CASTLE: Castle,
+    OutcomeKind.SUMMON: Summon,
+    OutcomeKind.MULTI_MOVE: MultiMove,
+    OutcomeKind.MULTI_CAPTURE: MultiCapture,
+}
+
+
+class MoveRecord(NamedTuple):
+    """
+    Compact outcome of an action.
+    Supports the read-only Outcome interface (name, piece, captured, movements, apply, ...),
+    and builds the matching Outcome object with materialize().
+    """
+    kind: OutcomeKind
+    action: object                      # Generating action (record.piece is action.piece)
+    target: Optional[Position] = None
+    captured: Tuple[object, ...] = ()
+    l_delta: int = 0
+    callback: Optional[str] = None      # Name of an action method to call when realized
+    end_turn: bool = True
+    data: object = None                 # CASTLE: rook piece
+                                        # SUMMON: (summoned class, summon loyalty)
+                                        # MULTI_*: (pieces, targets), in the order given to the Outcome
+    
+    @property
+    def piece(self) -> object:
+        return self.action.piece
+    
+    @property
+    def name(self) -> str:
+        return OUTCOME_CLASSES[self.kind].name
+    
+    @property
+    def effect(self) -> Optional[str]:
+        return OUTCOME_CLASSES[self.kind].effect
+    
+    @property
+    def summon_loyalty(self) -> Optional[Loyalty]:
+        return self.data[1] if self.kind == OutcomeKind.SUMMON else None
+    
+    def movements(self) -> List[Tuple[object, Position]]:
+        """
+        Returns (piece, target) for every piece this outcome moves (see Outcome.movements).
+        """
+        kind = self.kind
+        if kind == OutcomeKind.MOVE or kind == OutcomeKind.CAPTURE:
+            return [(self.action.piece, self.target)]
+        if kind == OutcomeKind.CASTLE:
+            return castle_movements(self.action.piece, self.data)
+        if kind == OutcomeKind.MULTI_MOVE:
+            return list(zip(*self.data))
+        if kind == OutcomeKind.MULTI_CAPTURE:
+            return list(zip(self.data[0][::-1], self.data[1][::-1])) # MultiCapture moves the furthest piece first.
+        return []
+    
+    def materialize(self) -> Outcome:
+        """
+        Builds the Outcome object described by this record.
+        """
+        kind = self.kind
+        kwargs = {'l_delta': self.l_delta, 'end_turn': self.end_turn}
+        if self.callback is not None:
+            kwargs['callback'] = getattr(self.action, self.callback)
+        
+        piece = self.action.piece
+        if kind == OutcomeKind.MOVE:
+            return Move(piece, self.target, **kwargs)
+        if kind == OutcomeKind.CAPTURE:
+            return Capture(piece, self.target, self.captured, **kwargs)
+        if kind == OutcomeKind.CASTLE:
+            return Castle(piece, self.data, **kwargs)
+        if kind == OutcomeKind.SUMMON:
+            return Summon(piece, self.target, self.data[0], self.data[1], **kwargs)
+        if kind == OutcomeKind.MULTI_MOVE:
+            return MultiMove(list(self.data[0]), list(self.data[1]), **kwargs)
+        if kind == OutcomeKind.MULTI_CAPTURE:
+            return MultiCapture(list(self.data[0]), list(self.data[1]), list(self.captured), **kwargs)
+        raise ValueError(f"MoveRecord: Unknown outcome kind {kind}.")
+    
+    def realize(self) -> bool:
+        """
+        Materializes and realizes this outcome, returns True if the turn should end.
+        """
+        return self.materialize().realize()
+    
+    def apply(self) -> UndoRecord:
+        return OBJREF.BOARD.apply(self)
+    
+    def __repr__(self):
+        return f'{self.name}({self.action.piece} -> {self.target})'
@@ -1,5 +1,5 @@
 import numpy as np
-from typing import Optional, List, Union, Tuple, TypeAlias, Dict
+from typing import Optional, List, Union, Tuple, TypeAlias, Dict, Set, KeysView, Iterable
 
 from globalref import GlobalAccessObject
 
@@ -7,7 +7,7 @@ from chess.tiles.get_tile import get_tile_class
 from chess.tiles.tile import Tile
 
 from chess.units.get_piece import get_piece_class
-from chess.units.piece import ChessPiece
+from chess.units.piece import ChessPiece, GEN_STALE, GEN_CAPTURES, GEN_FULL
 
 from utils.chess_types import PieceType, TileType, Position, Vector
 from utils.chess_types import Loyalty, Direction
@@ -15,7 +15,11 @@ from utils.chess_types import Direction as D
 
 from utils.game_utils import write_json, read_state_json # DEBUG
 
-from chess.actions.outcome import Outcome
+from chess.actions.outcome import Outcome, MoveRecord, UndoRecord, truncate
+
+from chess.board_planes import BoardPlanes, FACINGS, decode_flags, decode_loyalty
+from chess.zobrist import ZobristKeys
+from chess.board_geometry import BoardGeometry
 
 # Chesstypes?
 BoardTiles: TypeAlias = np.ndarray[Tile]
@@ -23,18 +27,61 @@ BoardTiles: TypeAlias = np.ndarray[Tile]
 class Board(GlobalAccessObject):
     # Board Tiles (contains Pieces)
     _board: BoardTiles
+    _tiles_flat: List[Tile] # Tiles by flat square index (x * height + y)
+    _width: int
+    _height: int
+    
+    # Array-backed mirror of tiles and pieces, written through on every change.
+    _planes: BoardPlanes
+    
+    # Precomputed rays and jump targets for the tile layout (rebuilt when a tile is replaced).
+    _geometry: Optional[BoardGeometry] = None
+    
+    # Incrementally updated 64-bit position key.
+    _zobrist: ZobristKeys
+    _key: int
     
     # Game data
     move_history: List[Tuple[Position, Position]]
     turn_order: List[Loyalty]
-    turn: int # Number of turns taken OR skipped.
+    _turn: int # Number of turns taken OR skipped.
     # TODO: Need 'round number' to track cycles of turns.
     
     # CSV file references (TODO: DEPRECATE)
     _initial_tiles: str
     _initial_pieces: str
     
-    _checks: List[Tuple[ChessPiece, ChessPiece, Outcome]] # Checkee, checker, outcome
+    _checks: List[Tuple[ChessPiece, ChessPiece, MoveRecord]] # Checkee, checker, outcome
+    
+    # Undo records which have been applied but not yet undone (oldest first).
+    #   Changes are journaled into the newest one, including outcomes generated lazily after it was applied,
+    #   so records must be undone in reverse order.
+    _records: List[UndoRecord]
+    _journal: Optional[UndoRecord] = None # Newest open record (None when not recording).
+    _applying: bool = False
+    
+    # Dependency tracking for incremental move generation.
+    #   Each piece remembers which squares its actions read (piece._reads),
+    #   only pieces which read a changed square go stale on update.
+    #   Stale pieces regenerate lazily: fully when their outcomes are accessed,
+    #   or only their capturing actions when the attack maps are queried.
+    _readers: List[Set[ChessPiece]]     # Square -> pieces which read it
+    _dirty: Set[int]                    # Squares changed since the last update
+    _dirty_loyalties: Set[Loyalty]      # Factions whose leadership changed since the last update
+    _reading: Optional[Set[int]] = None # Squares read by the piece being regenerated
+    _hazard_tiles: Dict[int, Tile]      # Tiles which act on pieces during update (chasms, walls)
+    
+    # Attack maps, squares each faction can capture on.
+    #   Updated as pieces regenerate their outcomes, so check queries don't rescan outcomes.
+    #   Queries generate the captures of stale pieces first (see generate_attacks).
+    _attacks: Dict[ChessPiece, frozenset]           # Piece -> squares its outcomes capture on
+    _attack_counts: Dict[Loyalty, Dict[int, int]]   # Faction -> square -> number of attacking pieces
+    
+    # Live piece index, maintained as pieces are placed and removed.
+    #   Dicts are used as ordered sets.
+    _by_loyalty: Dict[Loyalty, Dict[ChessPiece, None]]
+    _by_type: Dict[PieceType, Dict[ChessPiece, None]]
+    _leaders: Dict[Loyalty, Dict[ChessPiece, None]]
     
     controlled_factions: Tuple[Loyalty, ...]
     turn_order: List[Loyalty]
@@ -69,7 +116,7 @@ class Board(GlobalAccessObject):
         # self.initial_board = self.board.copy() # Store initial piece positions? Or just rely on file...
         self.move_history: List[Tuple[Position, Position]] = [] # Deprecate?
         # self.faction_history: Dict[Loyalty, List[Tuple[int, ChessPiece]]] = {l: [] for l in Loyalty} # Deprecate?
-        self.history: List[Outcome] = [] # NOTE: List[Optional[Outcome]] now?
+        self.history: List[Union[MoveRecord, Outcome]] = [] # NOTE: List[Optional[Outcome]] now?
         
         self._checks = []
         
@@ -92,18 +139,33 @@ class Board(GlobalAccessObject):
         Returns all pieces from the given faction (defaults to current faction).
         """
         if loyalty is None: loyalty = self.current_turn
-        # return [t.piece for t in self if (t.piece is not None and t.piece.loyalty == loyalty)]
-        return [p for p in self.pieces if p.loyalty == loyalty]
+        return list(self._by_loyalty.get(loyalty, ()))
     
     def disloyal_pieces(self, loyalty: Optional[Loyalty] = None) -> List[ChessPiece]:
         """
         Returns all pieces not from to given faction (defaults to current faction).
         """
         if loyalty is None: loyalty = self.current_turn
-        return [p for p in self.pieces if p.loyalty != loyalty]
+        return [p for l, lp in self._by_loyalty.items() if l != loyalty for p in lp]
     
     def loyal_leaders(self, loyalty: Optional[Loyalty] = None) -> List[ChessPiece]:
-        return [p for p in self.loyal_pieces(loyalty) if p.is_leader]
+        if loyalty is None: loyalty = self.current_turn
+        return list(self._leaders.get(loyalty, ()))
+    
+    def typed_pieces(self, piece_type: PieceType, loyalty: Optional[Loyalty] = None) -> List[ChessPiece]:
+        """
+        Returns all pieces of the given type (optionally only from the given faction).
+        """
+        pieces = self._by_type.get(piece_type, ())
+        if loyalty is None: return list(pieces)
+        return [p for p in pieces if p.loyalty == loyalty]
+    
+    def piece_count(self, loyalty: Optional[Loyalty] = None) -> int:
+        """
+        Returns the number of pieces from the given faction (defaults to current faction).
+        """
+        if loyalty is None: loyalty = self.current_turn
+        return len(self._by_loyalty.get(loyalty, ()))
     
     def get_leadership(self, loyalty: Optional[Loyalty] = None) -> int:
         """
@@ -119,21 +181,70 @@ class Board(GlobalAccessObject):
         if loyalty is None: loyalty = self.current_turn
         if loyalty not in self.leadership_pts:
             raise ValueError(f"Loyalty {loyalty} not found in leadership points.")
-        self.leadership_pts[loyalty] = max(0, min(self.MAX_LEADERSHIP, self.leadership_pts[loyalty] + delta))
+        self.set_leadership(max(0, min(self.MAX_LEADERSHIP, self.leadership_pts[loyalty] + delta)), loyalty)
+    
+    def set_leadership(self, pts: int, loyalty: Loyalty) -> None:
+        old = self.leadership_pts[loyalty]
+        if pts == old: return
+        self.record(self.set_leadership, old, loyalty)
+        self.leadership_pts[loyalty] = pts
+        self._dirty_loyalties.add(loyalty) # NOTE: Affordable outcomes depend on leadership.
+        self._key ^= self._zobrist.leadership_key(loyalty, old) ^ self._zobrist.leadership_key(loyalty, pts)
     
-    def get_checks(self, loyalty: Optional[Loyalty] = None) -> List[Tuple[ChessPiece, ChessPiece, Outcome]]:
+    def get_checks(self, loyalty: Optional[Loyalty] = None) -> List[Tuple[ChessPiece, ChessPiece, MoveRecord]]:
+        """
+        Returns (leader, checker, outcome) for every leader of the given faction (defaults to current faction)
+        which another faction can capture.
+        """
+        if loyalty is None: loyalty = self.current_turn
+        leaders = self.loyal_leaders(loyalty)
+        if not leaders: return []
+        self.generate_attacks([f for f in self._by_loyalty if f != loyalty])
+        
         checks = []
-        ll = self.loyal_leaders(loyalty)
-        for p in self.disloyal_pieces(loyalty):
-            for l in ll:
-                # TODO: This could be made much more accurate.
-                check_oc = p.outcomes.get(self[l.position], None)
-                if check_oc is not None and check_oc.name == 'Capture': # and isinstance(check_oc, Capture):
-                    checks.append((l, p, check_oc))
-                    # TODO: Add an effect or highlight to show checking pieces?
-                    #       A preview system which has backtracking is becoming more necessary
+        for l in leaders:
+            sq = l._tile.index
+            if not any(sq in counts for f, counts in self._attack_counts.items() if f != l.loyalty): continue
+            for p, squares in list(self._attacks.items()):
+                if p.loyalty == l.loyalty or sq not in squares: continue
+                for check_oc in p.capture_outcomes.values():
+                    if l in check_oc.captured:
+                        checks.append((l, p, check_oc))
+                        break
+                # TODO: Add an effect or highlight to show checking pieces?
+                #       A preview system which has backtracking is becoming more necessary
         return checks
     
+    def attacked_by(self, loyalty: Loyalty) -> KeysView[int]:
+        """
+        Returns the squares (flat indices) the given faction can capture on.
+        """
+        self.generate_attacks((loyalty,))
+        return self._attack_counts.get(loyalty, {}).keys()
+    
+    def is_attacked(self, pos: Union[Position, int], by: Optional[Loyalty] = None) -> bool:
+        """
+        Returns True if the given faction (or any faction) can capture on the given position or square.
+        """
+        sq = pos if isinstance(pos, (int, np.integer)) else self._geometry.square(pos)
+        if by is not None:
+            self.generate_attacks((by,))
+            return sq in self._attack_counts.get(by, ())
+        self.generate_attacks()
+        return any(sq in counts for counts in self._attack_counts.values())
+    
+    def generate_attacks(self, loyalties: Optional[Iterable[Loyalty]] = None) -> int:
+        """
+        Generates the capturing outcomes of every stale piece from the given factions (defaults to every faction),
+        so their attack maps are complete.
+        Returns the number of pieces regenerated.
+        """
+        if loyalties is None: loyalties = list(self._by_loyalty)
+        stale = [p for l in loyalties for p in self._by_loyalty.get(l, ()) if p._level == GEN_STALE]
+        for p in sorted(stale, key=lambda p: p._tile.index):
+            self.regenerate(p, captures_only=True)
+        return len(stale)
+    
     def at_pos(self, pos: Position) -> Tuple[Optional[Tile], Optional[ChessPiece]]:
         """
         Returns the tile and piece at the given position.
@@ -146,10 +257,11 @@ class Board(GlobalAccessObject):
         """
         Returns the tile at the given position.
         """
-        if len(position) != 2:
-            raise ValueError("Position must be a tuple of (x, y).")
-        if 0 <= position[0] < self.width and 0 <= position[1] < self.height:
-            return self[*position]
+        x, y = position
+        if 0 <= x < self._width and 0 <= y < self._height:
+            idx = x * self._height + y
+            if self._reading is not None: self._reading.add(idx)
+            return self._tiles_flat[idx]
         return None
     # # #
     
@@ -158,19 +270,24 @@ class Board(GlobalAccessObject):
     # Turn logic
     def update(self, turn_changed: bool = False) -> None:
         """
-        Updates all pieces and board.  
+        Updates tiles and pieces.  
         Called at start of each turn.
+        Only pieces which read a changed square (or have never been updated) go stale,
+        their outcomes are regenerated when next needed.
         """
-        for tile in self:
+        for tile in list(self._hazard_tiles.values()):
             tile.update()
-            
-            if tile.piece is not None:
-                if turn_changed: tile.piece.turn_changed()
-                tile.piece.update()
         
+        if turn_changed:
+            for piece in self.pieces:
+                piece.turn_changed()
+        
+        self.refresh_outcomes()
+        
+        self.record(setattr, self, '_checks', self._checks)
         self._checks = self.get_checks() # TODO: Give outcomes a 'checking' flag which they can set?
     
-    def realize(self, outcome: Optional[Outcome]) -> bool:
+    def realize(self, outcome: Optional[Union[MoveRecord, Outcome]]) -> bool:
         """
         Realizes the outcome of an action.
         """
@@ -178,6 +295,7 @@ class Board(GlobalAccessObject):
         if outcome is None: return False
         end_turn = outcome.end_turn
         outcome.realize() # TODO: Have Outcomes store turn when generated?
+        self.record(truncate, self.history, len(self.history))
         self.history.append(outcome)
         if end_turn:
             self.next_turn()
@@ -200,11 +318,169 @@ class Board(GlobalAccessObject):
             lpoc = [True if p.outcomes else False for p in lp]
             if not lp or not any(lpoc):
                 return self.next_turn(loop_to=loop_to)
+    
+    def refresh_outcomes(self) -> int:
+        """
+        Marks every piece which read a changed square as stale (eager pieces are regenerated immediately).
+        Returns the number of stale pieces.
+        """
+        dirty, self._dirty = self._dirty, set()
+        dirty_loyalties, self._dirty_loyalties = self._dirty_loyalties, set()
+        
+        for p in [p for p in self._attacks if p._tile is None or p._tile.owner is not self]:
+            self.set_attacks(p, frozenset()) # Piece left the board.
+        
+        stale = {}
+        for p in self.pieces:
+            if p._reads is None or p.loyalty in dirty_loyalties:
+                stale[p] = None
+        
+        for idx in dirty:
+            p = self._tiles_flat[idx].piece
+            if p is not None: stale[p] = None
+            for r in list(self._readers[idx]):
+                if r._tile is not None and r._tile.owner is self:
+                    stale[r] = None
+                else: # Piece left the board, forget its reads.
+                    self.set_reads(r, None)
+        
+        for p in sorted(stale, key=lambda p: p._tile.index):
+            if p.eager:
+                self.regenerate(p)
+            else:
+                self.set_level(p, GEN_STALE)
+        return len(stale)
+    
+    def regenerate(self, piece: ChessPiece, captures_only: bool = False) -> None:
+        """
+        Regenerates the outcomes of a piece (or only its capturing actions) while tracking which squares it reads.
+        """
+        reads: Set[int] = set()
+        dirty = self._dirty
+        self._dirty = set()
+        self._reading = reads
+        try:
+            piece.update(captures_only=captures_only)
+        finally:
+            self._reading = None
+            changed, self._dirty = self._dirty, dirty
+        
+        # Pieces which change state while updating (e.g. zombies turning) are regenerated every update.
+        self._dirty.update(changed)
+        self.set_reads(piece, None if changed else frozenset(reads))
+        self.set_attacks(piece, frozenset(c._tile.index for oc in piece._outcomes.values()
+                                          for c in oc.captured if c._tile is not None))
+        self.set_level(piece, GEN_CAPTURES if captures_only else GEN_FULL)
+    
+    def set_reads(self, piece: ChessPiece, reads: Optional[frozenset]) -> None:
+        old = piece._reads
+        if old is reads: return
+        self.record(self.set_reads, piece, old)
+        if old:
+            for idx in old: self._readers[idx].discard(piece)
+        piece._reads = reads
+        if reads:
+            for idx in reads: self._readers[idx].add(piece)
+    
+    def set_level(self, piece: ChessPiece, level: int) -> None:
+        old = piece._level
+        if old == level: return
+        self.record(self.set_level, piece, old)
+        piece._level = level
+    
+    def set_attacks(self, piece: ChessPiece, squares: frozenset) -> None:
+        old = self._attacks.get(piece, frozenset())
+        if old == squares: return
+        self.record(self.set_attacks, piece, old)
+        counts = self._attack_counts.setdefault(piece.loyalty, {})
+        for sq in old - squares:
+            if counts[sq] == 1: del counts[sq]
+            else: counts[sq] -= 1
+        for sq in squares - old:
+            counts[sq] = counts.get(sq, 0) + 1
+        if squares: self._attacks[piece] = squares
+        else: del self._attacks[piece]
+    
+    def apply(self, outcome: Union[MoveRecord, Outcome]) -> UndoRecord:
+        """
+        Realizes an outcome while journaling every change it makes.
+        Returns an undo record, pass it to undo() to restore the previous state.
+        """
+        if self._applying:
+            raise ValueError("Board.apply: Cannot apply an outcome while another is being applied.")
+        record = UndoRecord(outcome, self._key)
+        record.dirty = (set(self._dirty), set(self._dirty_loyalties))
+        self._records.append(record)
+        self._journal = record
+        self._applying = True
+        try:
+            self.realize(outcome)
+        except BaseException:
+            self.close_record(record)
+            raise
+        finally:
+            self._applying = False
+        return record
+    
+    def undo(self, record: UndoRecord) -> None:
+        """
+        Restores the state from before the recorded outcome was applied.
+        Pieces, captured pieces, generated outcomes, history, leadership and turn are all restored.
+        Records must be undone in reverse order of application.
+        """
+        if not self._records or self._records[-1] is not record:
+            raise ValueError("Board.undo: Records must be undone in reverse order of application.")
+        self._journal = None # Restoring must not be journaled.
+        for fn, args in reversed(record.entries):
+            fn(*args)
+        self._dirty, self._dirty_loyalties = set(record.dirty[0]), set(record.dirty[1])
+        self.close_record(record)
+    
+    def close_record(self, record: UndoRecord) -> None:
+        """
+        Stops journaling into an undo record (and any newer records).
+        """
+        while self._records:
+            if self._records.pop() is record: break
+        self._journal = self._records[-1] if self._records else None
+    
+    def record(self, fn, *args) -> None:
+        """
+        Journals an undo step, if an outcome is currently being applied.
+        """
+        if self._journal is not None:
+            self._journal.entries.append((fn, args))
     # # #
     
     
     # # #
     # Properties
+    @property
+    def turn(self) -> int:
+        return self._turn
+    
+    @turn.setter
+    def turn(self, value: int):
+        self.record(setattr, self, 'turn', self._turn)
+        zk = self._zobrist
+        self._key ^= zk.turn_key(self._turn, self.turn_order) ^ zk.turn_key(value, self.turn_order)
+        self._turn = value
+    
+    @property
+    def geometry(self) -> BoardGeometry:
+        return self._geometry
+    
+    @property
+    def hazard_squares(self) -> KeysView[int]:
+        return self._hazard_tiles.keys()
+    
+    @property
+    def zobrist_key(self) -> int:
+        """
+        Returns the 64-bit Zobrist key of the current position.
+        """
+        return self._key
+    
     @property
     def current_turn(self) -> Loyalty:
         return self.turn_order[self.turn % len(self.turn_order)]
@@ -221,7 +497,7 @@ class Board(GlobalAccessObject):
         """
         Returns all pieces on the board.
         """
-        return [t.piece for t in self if t.piece is not None]
+        return [p for lp in self._by_loyalty.values() for p in lp]
     
     @property
     def shape(self) -> Tuple[int, int]: # NOTE: Reverse x and y for numpy.
@@ -229,16 +505,15 @@ class Board(GlobalAccessObject):
     
     @property
     def width(self) -> int:
-        return self.shape[0]
+        return self._width
     
     @property
     def height(self) -> int:
-        return self.shape[1]
+        return self._height
     # # #
     
     def __iter__(self):
-        for x, y in np.ndindex(self.shape):
-            yield self[x, y]
+        return iter(self._tiles_flat)
     
     def __getitem__(self, pos: Position) -> Union[Tile, BoardTiles]:
         # Add 2nd dimension to 1D slices and indices.
@@ -250,9 +525,80 @@ class Board(GlobalAccessObject):
     def __setitem__(self, pos: Position, value: Tile) -> None:
         # Add 2nd dimension to 1D slices and indices.
         if isinstance(pos, (slice, int, np.int64)): pos = (pos, slice(0, None))
+        if isinstance(value, Tile):
+            old = self._board[pos[1], pos[0]]
+            if isinstance(old, Tile): old.owner = None
+            self.adopt_tile(value)
         self._board[pos[1], pos[0]] = value
     
     
+    # # #
+    # Planes
+    def adopt_tile(self, tile: Tile) -> None:
+        """
+        Links a tile to this board and writes it into the planes.
+        """
+        x, y = tile.position
+        tile.owner = self
+        tile.index = idx = x * self.height + y
+        self._tiles_flat[idx] = tile
+        if type(tile).update is not Tile.update:
+            self._hazard_tiles[idx] = tile
+        else:
+            self._hazard_tiles.pop(idx, None)
+        self._key ^= self._zobrist.square_key(self._planes, idx)
+        self._planes.write_tile(idx, tile.tiletype)
+        self._planes.write_piece(idx, tile.piece)
+        self._key ^= self._zobrist.square_key(self._planes, idx)
+        if self._geometry is not None:
+            self.rebuild_geometry()
+    
+    def rebuild_geometry(self) -> None:
+        """
+        Rebuilds the ray and jump tables from the current tiles.
+        Terrain reads are folded into the tables, so every piece is regenerated.
+        """
+        self._geometry = BoardGeometry(self.width, self.height, self._tiles_flat)
+        for p in self.pieces:
+            self.set_reads(p, None)
+    
+    def piece_placed(self, tile: Tile, old: Optional[ChessPiece], new: Optional[ChessPiece]) -> None:
+        """
+        Called by a tile when its piece changes, keeps the piece index and planes in sync.
+        """
+        self.record(setattr, tile, 'piece', old)
+        if old is not None:
+            self._by_loyalty[old.loyalty].pop(old, None)
+            self._by_type[old.piece_type].pop(old, None)
+            if old.is_leader: self._leaders[old.loyalty].pop(old, None)
+        if new is not None:
+            self._by_loyalty.setdefault(new.loyalty, {})[new] = None
+            self._by_type.setdefault(new.piece_type, {})[new] = None
+            if new.is_leader: self._leaders.setdefault(new.loyalty, {})[new] = None
+        self.sync_square(tile)
+    
+    def sync_square(self, tile: Tile) -> None:
+        """
+        Writes the current contents of a tile into the planes (and the position key).
+        """
+        idx = tile.index
+        self._key ^= self._zobrist.square_key(self._planes, idx)
+        self._planes.write_piece(idx, tile.piece)
+        self._key ^= self._zobrist.square_key(self._planes, idx)
+        self._dirty.add(idx)
+    
+    def copy_planes(self) -> BoardPlanes:
+        """
+        Returns a copy of the board planes (a full snapshot of tiles and pieces).
+        """
+        return self._planes.copy()
+    
+    @property
+    def planes(self) -> BoardPlanes:
+        return self._planes
+    # # #
+    
+    
     def clear_cache(self) -> None:
         self.state_cache.clear()
     
@@ -260,10 +606,14 @@ class Board(GlobalAccessObject):
         """
         Generates a state dictionary of the current board and pieces.
         """
+        planes = self._planes
         state = {
-                'tiles': np.array([[tile.tiletype.value for tile in row] for row in self._board]).T,
-                'pieces': np.array([[tile.piece.piece_type.value if tile.piece else 0 for tile in row] for row in self._board]).T,
-                'piece_loyalties': np.array([[tile.piece.loyalty.value if tile.piece else 0 for tile in row] for row in self._board]).T,
+                'tiles': planes.tiles.astype(np.int32),
+                'pieces': planes.pieces.astype(np.int32),
+                'piece_loyalties': np.array([[decode_loyalty(c).value for c in row] for row in planes.loyalties.tolist()]),
+                'facings': planes.facings.copy(),
+                'move_counts': planes.move_counts.copy(),
+                'piece_flags': planes.flags.copy(),
                 # 'current_turn': self.current_turn.value,
                 'turn_order': [l.value for l in self.turn_order],
                 'turn': self.turn,
@@ -323,12 +673,35 @@ class Board(GlobalAccessObject):
     def load_state(self, state: Dict):
         # Load tiles
         self._board = board_constructor(state['tiles'])
-        self.turn = state['turn']
+        self._planes = BoardPlanes(self.shape)
+        self._zobrist = ZobristKeys.for_shape(self.shape)
+        self._key = 0
+        self._geometry = None
+        self._readers = [set() for _ in range(self._board.size)]
+        self._dirty = set()
+        self._dirty_loyalties = set()
+        self._records = []
+        self._journal = None
+        self._hazard_tiles = {}
+        self._attacks = {}
+        self._attack_counts = {}
+        self._by_loyalty = {}
+        self._by_type = {}
+        self._leaders = {}
+        self._width, self._height = self.shape
+        self._tiles_flat = [None] * self._board.size
+        for tile in self._board.flat:
+            self.adopt_tile(tile)
+        self._geometry = BoardGeometry(self.width, self.height, self._tiles_flat)
+        self._turn = state['turn']
         self.turn_order = [Loyalty(l) for l in state['turn_order']]
         self.leadership_pts = {Loyalty(l): pts for l, pts in state['leadership_pts'].items()}
         
         pieces = state['pieces']
         piece_loyalties = state['piece_loyalties']
+        facings = state.get('facings', None)
+        move_counts = state.get('move_counts', None)
+        piece_flags = state.get('piece_flags', None)
         
         # Load pieces
         for x, y in np.ndindex(self.shape):
@@ -340,11 +713,26 @@ class Board(GlobalAccessObject):
             # Select piece type based on value
             pc = get_piece_class(PieceType(abs(v)))
             piece = pc(loyalty=l, position=(x, y))
-            self[x, y].piece = piece
             
-            # TODO: Load piece data if available.
+            # Load piece data if available.
+            if facings is not None and facings[x][y] >= 0:
+                piece.facing = FACINGS[facings[x][y]]
+            if move_counts is not None:
+                piece.move_count = int(move_counts[x][y])
+            if piece_flags is not None:
+                for k, fv in decode_flags(int(piece_flags[x][y])).items():
+                    if hasattr(pc, k): setattr(piece, k, fv)
+            
+            self[x, y].piece = piece
         
+        self._key = self.compute_key()
         return True
+    
+    def compute_key(self) -> int:
+        """
+        Computes the position key from scratch (the incremental key should always match).
+        """
+        return self._zobrist.board_key(self._planes, self.turn, self.turn_order, self.leadership_pts)
 
 # TODO: Classmethod?
 #       Add a piece constructor?
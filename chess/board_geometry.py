@@ -0,0 +1,103 @@
+from functools import lru_cache
+from typing import Tuple, Dict, Sequence
+
+from utils.chess_types import Position, Vector, orient
+
+
+# Board directions used by sliding actions (cardinal + diagonal).
+RAY_VECTORS: Tuple[Vector, ...] = ((0, 1), (0, -1), (-1, 0), (1, 0),
+                                   (-1, 1), (1, 1), (-1, -1), (1, -1))
+
+
+@lru_cache(maxsize=None)
+def orient_vectors(vectors: Tuple[Vector, ...], facing: Vector) -> Tuple[Vector, ...]:
+    """
+    Orients facing-relative vectors [forward, right] into board vectors [x, y] (see ChessPiece.orient_vector).
+    """
+    return tuple(orient(v, facing) for v in vectors)
+
+
+class BoardGeometry:
+    """
+    Precomputed square tables for a board layout.
+    Rays stop before the first out-of-bounds, blocked or void tile, and jump targets skip them,
+    so actions can walk these tables without any bounds or terrain checks.
+    Squares are flat indices (x * height + y), matching the board planes.
+    """
+    
+    width: int
+    height: int
+    positions: Tuple[Position, ...]                     # Square -> (x, y)
+    blocked: Tuple[bool, ...]                           # Square -> blocked tile
+    passable: Tuple[bool, ...]                          # Square -> not blocked and not void
+    rays: Dict[Vector, Tuple[Tuple[int, ...], ...]]     # Board vector -> square -> ray squares
+    _jumps: Dict[Tuple[Vector, ...], Tuple[Tuple[int, ...], ...]] # Board vectors -> square -> targets
+    
+    def __init__(self, width: int, height: int, tiles: Sequence[object]):
+        self.width = width
+        self.height = height
+        self.positions = tuple((sq // height, sq % height) for sq in range(width * height))
+        self.blocked = tuple(t.is_blocked for t in tiles)
+        self.passable = tuple(not (t.is_blocked or t.is_void) for t in tiles)
+        self.rays = {v: tuple(self._build_ray(sq, v) for sq in range(width * height)) for v in RAY_VECTORS}
+        self._jumps = {}
+    
+    def square(self, position: Position) -> int:
+        """
+        Returns the flat index of a position, or -1 if it is out of bounds.
+        """
+        x, y = position
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return x * self.height + y
+        return -1
+    
+    def ray(self, sq: int, vector: Vector) -> Tuple[int, ...]:
+        """
+        Returns the passable squares from sq (exclusive) along a board vector.
+        """
+        rays = self.rays.get(vector, None)
+        if rays is None:
+            rays = self.rays[vector] = tuple(self._build_ray(s, vector) for s in range(self.width * self.height))
+        return rays[sq]
+    
+    def line(self, sq: int, vector: Vector) -> Tuple[int, ...]:
+        """
+        Returns the in-bounds squares from sq (exclusive) along a board vector, up to the first blocked tile.
+        Void tiles are included (for lines which jump gaps).
+        """
+        x, y = self.positions[sq]
+        line = []
+        while True:
+            x, y = x + vector[0], y + vector[1]
+            s = self.square((x, y))
+            if s < 0 or self.blocked[s]: break
+            line.append(s)
+        return tuple(line)
+    
+    def jumps(self, sq: int, vectors: Tuple[Vector, ...]) -> Tuple[int, ...]:
+        """
+        Returns the passable squares reached from sq by each board vector (in order).
+        """
+        table = self._jumps.get(vectors, None)
+        if table is None:
+            table = self._jumps[vectors] = tuple(self._build_jumps(s, vectors) for s in range(self.width * self.height))
+        return table[sq]
+    
+    def _build_ray(self, sq: int, vector: Vector) -> Tuple[int, ...]:
+        x, y = self.positions[sq]
+        ray = []
+        while True:
+            x, y = x + vector[0], y + vector[1]
+            s = self.square((x, y))
+            if s < 0 or not self.passable[s]: break
+            ray.append(s)
+        return tuple(ray)
+    
+    def _build_jumps(self, sq: int, vectors: Tuple[Vector, ...]) -> Tuple[int, ...]:
+        x, y = self.positions[sq]
+        targets = []
+        for vx, vy in vectors:
+            s = self.square((x + vx, y + vy))
+            if s >= 0 and self.passable[s]:
+                targets.append(s)
+        return tuple(targets)
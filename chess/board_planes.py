@@ -0,0 +1,115 @@
+import numpy as np
+from typing import Optional, Tuple, Dict
+
+from utils.chess_types import Loyalty, PieceType, TileType, Direction
+
+
+# # #
+# Plane encodings
+#   Loyalty values are multiples of 0.5, so they are doubled to fit an int8.
+#   Facing is stored as an index into FACINGS (-1 for no facing).
+#   Per-piece flags are packed into a single int8 bitfield.
+FACINGS: Tuple[Tuple[int, int], ...] = tuple(d.value for d in Direction) # N, E, S, W
+FACING_INDEX: Dict[Tuple[int, int], int] = {f: i for i, f in enumerate(FACINGS)}
+
+FLAG_EN_PASSANTABLE: int = 1 << 0
+FLAG_LURKING: int = 1 << 1
+JUMP_TIMER_SHIFT: int = 2
+JUMP_TIMER_MASK: int = 0b11 << JUMP_TIMER_SHIFT
+# # #
+
+
+def encode_loyalty(loyalty: Loyalty) -> int:
+    return int(loyalty.value * 2)
+
+def decode_loyalty(code: int) -> Loyalty:
+    return Loyalty(code / 2)
+
+def encode_facing(facing) -> int:
+    return FACING_INDEX.get(facing, -1)
+
+def encode_flags(piece) -> int:
+    """
+    Packs the per-piece flags of a piece into a plane value.
+    """
+    flags = 0
+    if getattr(piece, 'en_passantable', False): flags |= FLAG_EN_PASSANTABLE
+    if getattr(piece, 'is_lurking', False): flags |= FLAG_LURKING
+    flags |= (min(getattr(piece, 'jump_timer', 0), 3) << JUMP_TIMER_SHIFT)
+    return flags
+
+def decode_flags(flags: int) -> Dict[str, object]:
+    """
+    Unpacks a plane value into per-piece flag attributes.
+    """
+    return {'en_passantable': bool(flags & FLAG_EN_PASSANTABLE),
+            'is_lurking': bool(flags & FLAG_LURKING),
+            'jump_timer': (flags & JUMP_TIMER_MASK) >> JUMP_TIMER_SHIFT}
+
+
+class BoardPlanes:
+    """
+    Struct-of-arrays mirror of a board.
+    Each plane is indexed [x, y], and squares are addressed by flat index (x * height + y).
+    Planes are written through by Tile and ChessPiece whenever their state changes.
+    """
+
+    tiles: np.ndarray       # TileType value
+    pieces: np.ndarray      # PieceType value (0 = empty)
+    loyalties: np.ndarray   # Encoded Loyalty
+    facings: np.ndarray     # Index into FACINGS
+    move_counts: np.ndarray # Moves made by the piece
+    flags: np.ndarray       # Packed per-piece flags
+
+    PLANE_NAMES: Tuple[str, ...] = ('tiles', 'pieces', 'loyalties', 'facings', 'move_counts', 'flags')
+
+    def __init__(self, shape: Tuple[int, int]):
+        self.tiles = np.zeros(shape, dtype=np.int8)
+        self.pieces = np.zeros(shape, dtype=np.int8)
+        self.loyalties = np.zeros(shape, dtype=np.int8)
+        self.facings = np.full(shape, -1, dtype=np.int8)
+        self.move_counts = np.zeros(shape, dtype=np.int16)
+        self.flags = np.zeros(shape, dtype=np.int8)
+
+    def write_tile(self, idx: int, tiletype: TileType) -> None:
+        self.tiles.flat[idx] = tiletype.value
+
+    def write_piece(self, idx: int, piece: Optional[object]) -> None:
+        """
+        Writes the state of a piece (or an empty square) into the planes.
+        """
+        if piece is None:
+            self.pieces.flat[idx] = 0
+            self.loyalties.flat[idx] = 0
+            self.facings.flat[idx] = -1
+            self.move_counts.flat[idx] = 0
+            self.flags.flat[idx] = 0
+            return
+
+        self.pieces.flat[idx] = piece.piece_type.value
+        self.loyalties.flat[idx] = encode_loyalty(piece.loyalty)
+        self.facings.flat[idx] = encode_facing(piece.facing)
+        self.move_counts.flat[idx] = piece.move_count
+        self.flags.flat[idx] = encode_flags(piece)
+
+    def occupied(self, loyalty: Optional[Loyalty] = None) -> np.ndarray:
+        """
+        Returns flat indices of occupied squares (optionally only those of a faction).
+        """
+        mask = self.pieces != 0
+        if loyalty is not None:
+            mask &= self.loyalties == encode_loyalty(loyalty)
+        return np.flatnonzero(mask)
+
+    def copy(self) -> 'BoardPlanes':
+        """
+        Returns a copy of all planes.
+        """
+        planes = BoardPlanes.__new__(BoardPlanes)
+        for name in self.PLANE_NAMES:
+            setattr(planes, name, getattr(self, name).copy())
+        return planes
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.tiles.shape
@@ -5,7 +5,7 @@
 from utils.chess_types import Position
 from utils.chess_types import TileType#, Loyalty, Direction, Vector
 
-from chess.tiles.tile import Tile
+from chess.tiles.tile import Tile, DEBUG_TILES
 
 # TODO: 'Unstable' tiles?
 #       Collapse after being stepped on?
@@ -15,6 +15,7 @@ class ChasmTile(Tile):
     """
     Chasm tile subclass.
     """
+    __slots__ = ()
     # is_blocked: bool = True
     is_deadly: bool = True
 
@@ -28,5 +29,5 @@ class ChasmTile(Tile):
     def update(self):
         super().update()
         if self.piece is not None:
-            print(f'ChasmTile: {self.piece} fell to their death in the chasm')
+            if DEBUG_TILES: print(f'ChasmTile: {self.piece} fell to their death in the chasm')
             self.piece = None
\ No newline at end of file
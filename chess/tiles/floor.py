@@ -10,6 +10,7 @@ class FloorTile(Tile):
     """
     Floor tile subclass.
     """
+    __slots__ = ()
     def __init__(self,
                  position: Position,
                  tiletype: TileType = TileType.FLOOR):
@@ -1,37 +1,50 @@
-import pygame as pg
 import numpy as np
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Dict, Tuple
 
 from globalref import GlobalAccessObject
 
 from utils.chess_types import PieceType, Vector, Position
 from utils.chess_types import TileType, Loyalty, Direction, Vector
 
+DEBUG_TILES: bool = False # Print pieces destroyed by tiles (tiles update for every searched position).
+
 
 class Tile(GlobalAccessObject):
+    __slots__ = ('position', 'tiletype', '_piece', '_sprite', 'owner', 'index')
+    
     position: Position
-    sprite: Optional[object] # TODO: Use a sprite typealias or pg type or property?
+    _sprite: Optional[object] # Sprite override, tiles without one share the flyweight sprites below.
     
     tiletype: TileType
-    piece: Optional[PieceType]
+    _piece: Optional[PieceType]
     # objects: List[ChessObject] # TODO: implement?
     
+    # Owning board and flat square index, set when the board adopts this tile.
+    owner: Optional[object]
+    index: int
+    
     is_blocked: bool = False
     is_deadly: bool = False
     is_void: bool = False
     
+    # (TileType, checker parity) -> Sprite, shared by every tile and resolved from the asset loader when first drawn.
+    _sprites: Dict[Tuple[TileType, int], object] = {}
+    
     def __init__(self,
                  position: Position,
                  tiletype: TileType = TileType.DEFAULT,
-                 sprite: Optional[pg.Surface] = None,
+                 sprite: Optional[object] = None,
                  # TODO: Biome, which decides sprite based on terrain/coords/rng?
                  ):
         self.position: Position = position
         
-        self.sprite = self.get_tile_sprite(tiletype, position) if sprite is None else sprite
+        self._sprite = sprite
         
         self.tiletype: TileType = tiletype
-        self.piece: Optional[PieceType] = None
+        self._piece: Optional[PieceType] = None
+        
+        self.owner = None
+        self.index = -1
         
         # self.objects: List[ChessObject] = [] # TODO: implement?
     
@@ -65,13 +78,53 @@ class Tile(GlobalAccessObject):
             
     #     self.objects.remove(obj)
     
+    @property
+    def piece(self) -> Optional[PieceType]:
+        return self._piece
+    
+    @piece.setter
+    def piece(self, value: Optional[PieceType]):
+        """
+        Places a piece on this tile, keeping the owning board in sync.
+        """
+        old = self._piece
+        if old is value: return
+        if old is not None and old._tile is self:
+            old._tile = None
+        self._piece = value
+        if value is not None:
+            value._tile = self
+        if self.owner is not None:
+            self.owner.piece_placed(self, old, value)
+    
+    def sync(self):
+        """
+        Writes this tile's state through to the owning board.
+        """
+        if self.owner is not None:
+            self.owner.sync_square(self)
+    
     def update(self):
         pass
     
     def __repr__(self):
         return f"Tile({self.position} : {self.tiletype.name}) -> ({self.piece})"# : {self.objects})"
     
-    def get_tile_sprite(self, tiletype: TileType, position: Position) -> pg.Surface:
+    @property
+    def sprite(self) -> object:
+        if self._sprite is not None:
+            return self._sprite
+        k = (self.tiletype, int(self.position[0] % 2 == self.position[1] % 2))
+        sprite = self._sprites.get(k, None)
+        if sprite is None:
+            sprite = self._sprites[k] = self.get_tile_sprite(self.tiletype, self.position)
+        return sprite
+    
+    @sprite.setter
+    def sprite(self, value: object):
+        self._sprite = value
+    
+    def get_tile_sprite(self, tiletype: TileType, position: Position) -> object:
         """
         Get the sprite for a given tile type and position.
         """
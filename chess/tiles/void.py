@@ -11,6 +11,7 @@ class VoidTile(Tile):
     """
     Void tile subclass.
     """
+    __slots__ = ()
     
     is_void: bool = True
     # is_blocked: bool = False
@@ -5,12 +5,13 @@
 from utils.chess_types import Position
 from utils.chess_types import TileType#, Loyalty, Direction, Vector
 
-from chess.tiles.tile import Tile
+from chess.tiles.tile import Tile, DEBUG_TILES
 
 class WallTile(Tile):
     """
     Wall tile subclass.
     """
+    __slots__ = ()
     is_blocked: bool = True
     def __init__(self,
                  position: Position,
@@ -21,5 +22,5 @@ class WallTile(Tile):
     def update(self):
         super().update()
         if self.piece is not None:
-            print(f'WallTile: {self.piece} was crushed by an obstacle.')
+            if DEBUG_TILES: print(f'WallTile: {self.piece} was crushed by an obstacle.')
             self.piece = None
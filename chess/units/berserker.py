@@ -5,15 +5,17 @@ from utils.chess_types import Position, Vector
 from utils.chess_types import DirCls as D
 from utils.chess_types import Loyalty, PieceType
 
-from chess.units.piece import ChessPiece
+from chess.units.piece import ChessPiece, SyncedAttr
 from chess.actions.action import Action
-from chess.actions.outcome import Move, Capture, MultiMove, MultiCapture
+from chess.actions.outcome import MoveRecord, OutcomeKind as K
 
 # TODO: Simplify, when moving between 2 pieces all three are destroyed?
 class BerserkerMoveOnly(Action):
     """
     Represents a move action for a Berserker.
     """
+    __slots__ = ()
+    can_capture: bool = False
     
     def flag_enpassant(self):
         self.piece.en_passantable = True
@@ -24,13 +26,14 @@ class BerserkerMoveOnly(Action):
                               length=2,
                               enemy_ok=False)
         for i, (pos, t, p) in enumerate(poss_moves):
-            self.add_outcome(t, Move(self.piece, pos, callback = self.flag_enpassant if i==1 else lambda: None))
+            self.add_outcome(t, MoveRecord(K.MOVE, self, pos, callback='flag_enpassant' if i==1 else None))
 
 
 class BerserkerCaptureOnly(Action):
     """
     Represents a capture action for a Berserker.
     """
+    __slots__ = ()
     
     def a_warriors_death(self):
         """
@@ -42,11 +45,11 @@ class BerserkerCaptureOnly(Action):
         super().update()
         for v in (D.f_l, D.f_r):
             for pos, t, p in self.get_line(v, length=1, can_move=False):
-                self.add_outcome(t, Capture(self.piece, pos, p))
+                self.add_outcome(t, MoveRecord(K.CAPTURE, self, pos, (p,)))
                 
                 # Berserkers can capture 2 pieces at once diagonally, but die in the process.
                 for posD, tD, pD in self.get_line(v, start=pos, length=1, can_move=False):
-                    self.add_outcome(tD, Capture(self.piece, posD, (p, pD, self.piece), l_delta=-1, callback=self.a_warriors_death))
+                    self.add_outcome(tD, MoveRecord(K.CAPTURE, self, posD, (p, pD, self.piece), l_delta=-1, callback='a_warriors_death'))
 
 
 # class PawnPassant(Action):
@@ -148,16 +151,13 @@ class BerserkerCaptureOnly(Action):
 
 # Allow en-passant?
 class Berserker(ChessPiece):
-    en_passantable: bool
+    __slots__ = ('_en_passantable',)
+    ACTIONS = (BerserkerMoveOnly, BerserkerCaptureOnly) # PawnPassant, ShieldWallAdvance, ChainCapture
+    en_passantable: bool = SyncedAttr(False)
     
     def __init__(self, loyalty: Loyalty, position):
         super().__init__(loyalty=loyalty, piece_type=PieceType.BERSERKER, position=position)
         self.en_passantable = False
-        self.actions.append(BerserkerMoveOnly(self))
-        self.actions.append(BerserkerCaptureOnly(self))
-        # self.actions.append(PawnPassant(self))
-        # self.actions.append(ShieldWallAdvance(self))
-        # self.actions.append(ChainCapture(self))
 
     def turn_changed(self):
         if self.board.current_turn == self.loyalty:
@@ -6,23 +6,25 @@ from utils.chess_types import Loyalty, PieceType
 
 from chess.units.piece import ChessPiece
 from chess.actions.action import Action
-from chess.actions.outcome import Move, Capture
+from chess.actions.outcome import MoveRecord, OutcomeKind as K
 
 
 class BishopCapture(Action):
     """
     Represents a move/capture action for a bishop.
     """
+    __slots__ = ()
     def update(self):
         super().update()
         
         for v in D.diagonal: # Cardinal vectors
             for pos, t, p in self.get_line(v, length=7, enemy_ok=True):
-                oc = Move(self.piece, pos) if p is None else Capture(self.piece, pos, p)
+                oc = MoveRecord(K.MOVE, self, pos) if p is None else MoveRecord(K.CAPTURE, self, pos, (p,))
                 self.add_outcome(t, oc)
 
 
 class Bishop(ChessPiece):
+    __slots__ = ()
+    ACTIONS = (BishopCapture,)
     def __init__(self, loyalty: Loyalty, position):
         super().__init__(loyalty=loyalty, piece_type=PieceType.BISHOP, position=position)
-        self.actions.append(BishopCapture(self))
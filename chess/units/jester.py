@@ -2,25 +2,30 @@ import numpy as np
 from typing import Tuple
 
 from utils.chess_types import Position, Vector
-from utils.chess_types import DirCls as D
+from utils.chess_types import DirCls as D, vadd
 from utils.chess_types import Loyalty, PieceType
 
 from chess.units.piece import ChessPiece
 from chess.actions.action import Action
-from chess.actions.outcome import Move, Capture
+from chess.actions.outcome import MoveRecord, OutcomeKind as K
+from chess.board_geometry import orient_vectors
+
+
+JESTER_VECTORS: Tuple[Vector] = (vadd(D.f, D.f_l), vadd(D.f, D.f_r))
 
 
 class JesterDiagonal(Action):
     """
     Represents a diagonal move/capture action for a jester.
     """
+    __slots__ = ()
     def update(self):
         super().update()
         if self.move_count % 2 == 0:
             return
         for v in D.diagonal: # Cardinal vectors
             for pos, t, p in self.get_line(v, length=2, enemy_ok=True): # NOTE: Testing limited length
-                self.add_outcome(t, Move(self.piece, pos) if p is None else Capture(self.piece, pos, p))
+                self.add_outcome(t, MoveRecord(K.MOVE, self, pos) if p is None else MoveRecord(K.CAPTURE, self, pos, (p,)))
 
 
 # class JesterCardinal(Action):
@@ -39,34 +44,30 @@ class JesterJump(Action):
     """
     Represents an L-shaped move/capture action for a jester.
     """
-    VECTORS: Tuple[Vector] = (D.f+D.f_l, D.f+D.f_r)
+    __slots__ = ()
+    VECTORS: Tuple[Vector] = JESTER_VECTORS
+    JUMP_VECTORS: Tuple[Vector] = tuple(v for d in D.cardinal for v in orient_vectors(JESTER_VECTORS, d))
     
     def update(self):
         super().update()
         if self.move_count % 2 == 1:
             return
-        for d in D.cardinal: # Cardinal vectors
-            for v in self.VECTORS: # Knight vectors
-                pos, t, p = self.at_vec(self.orient_vector(v, d))
-                if t is None: continue # OOB tile
-                if t.is_blocked: continue # Blocked tile
-                if t.is_void: continue # Void tile
-                
-                if p is None:
-                    self.outcomes[t] = Move(self.piece, pos)
-                elif p.loyalty != self.loyalty: # No friendly fire
-                    self.outcomes[t] = Capture(self.piece, pos, p)
+        for pos, t, p in self.get_jumps(self.JUMP_VECTORS): # Knight vectors in each cardinal direction
+            if p is None:
+                self.outcomes[t] = MoveRecord(K.MOVE, self, pos)
+            elif p.loyalty != self.loyalty: # No friendly fire
+                self.outcomes[t] = MoveRecord(K.CAPTURE, self, pos, (p,))
 
 
 class Jester(ChessPiece):
+    __slots__ = ()
+    ACTIONS = (JesterDiagonal, JesterJump) # JesterCardinal
     def __init__(self, loyalty: Loyalty, position):
         super().__init__(loyalty=loyalty, piece_type=PieceType.JESTER, position=position)
-        self.actions.append(JesterDiagonal(self))
-        # self.actions.append(JesterCardinal(self))
-        self.actions.append(JesterJump(self))
     
     @property
     def sprite(self):
-        if isinstance(self._sprite, tuple):
-            return self._sprite[(1+self.move_count) % 2]
-        return self._sprite
+        sprites = self.sprites
+        if isinstance(sprites, tuple):
+            return sprites[(1+self.move_count) % 2]
+        return sprites
@@ -7,7 +7,7 @@ from utils.chess_types import Loyalty, PieceType
 from chess.units.piece import ChessPiece
 
 from chess.actions.action import Action
-from chess.actions.outcome import Move, Capture, Castle
+from chess.actions.outcome import MoveRecord, OutcomeKind as K
 
 
 # TODO: Add some logic for checks and whatnot?
@@ -15,17 +15,20 @@ class KingCapture(Action):
     """
     Represents a move/capture action for a king.
     """
+    __slots__ = ()
     def update(self):
         super().update()
         
         for v in D.cardiagonal: # Cardinal vectors
             for pos, t, p in self.get_line(v, length=1, enemy_ok=True):
-                self.add_outcome(t, Move(self.piece, pos) if p is None else Capture(self.piece, pos, p))
+                self.add_outcome(t, MoveRecord(K.MOVE, self, pos) if p is None else MoveRecord(K.CAPTURE, self, pos, (p,)))
 
 class KingCastle(Action):
     """
     Represents a castling action for a king.
     """
+    __slots__ = ()
+    can_capture: bool = False
     def update(self):
         super().update()
         
@@ -40,12 +43,12 @@ class KingCastle(Action):
                 if p.piece_type != PieceType.ROOK: continue
                 if p.loyalty != self.loyalty: continue
                 if p.move_count > 0: continue
-                self.outcomes[t] = Castle(self.piece, p)
+                self.outcomes[t] = MoveRecord(K.CASTLE, self, l_delta=-1, data=p)
 
 
 class King(ChessPiece):
+    __slots__ = ()
+    ACTIONS = (KingCapture, KingCastle)
     is_leader: bool = True
     def __init__(self, loyalty: Loyalty, position):
         super().__init__(loyalty=loyalty, piece_type=PieceType.KING, position=position)
-        self.actions.append(KingCapture(self))
-        self.actions.append(KingCastle(self))
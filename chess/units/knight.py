@@ -2,40 +2,37 @@ import numpy as np
 from typing import Tuple
 
 from utils.chess_types import Position, Vector
-from utils.chess_types import DirCls as D
+from utils.chess_types import DirCls as D, vadd
 from utils.chess_types import Loyalty, PieceType
 
 from chess.units.piece import ChessPiece
 from chess.actions.action import Action
-from chess.actions.outcome import Move, Capture
+from chess.actions.outcome import MoveRecord, OutcomeKind as K
 
 
 class KnightJump(Action):
     """
     Represents a move/capture action for a knight.
     """
-    VECTORS: Tuple[Vector] = (D.f+D.f_l, D.f+D.f_r,
-                              D.r+D.f_r, D.r+D.b_r,
-                              D.b+D.b_l, D.b+D.b_r,
-                              D.l+D.f_l, D.l+D.b_l)
+    __slots__ = ()
+    VECTORS: Tuple[Vector] = (vadd(D.f, D.f_l), vadd(D.f, D.f_r),
+                              vadd(D.r, D.f_r), vadd(D.r, D.b_r),
+                              vadd(D.b, D.b_l), vadd(D.b, D.b_r),
+                              vadd(D.l, D.f_l), vadd(D.l, D.b_l))
 
     def update(self):
         super().update()
-        for v in self.VECTORS: # Knight vectors
-            pos, t, p = self.at_vec(v)
-            if t is None: continue # OOB tile
-            if t.is_blocked: continue # Blocked tile
-            if t.is_void: continue # Void tile
-            
+        for pos, t, p in self.get_jumps(self.VECTORS): # Knight vectors (OOB, blocked and void tiles skipped)
             if p is None:
-                self.add_outcome(t,  Move(self.piece, pos))
+                self.add_outcome(t, MoveRecord(K.MOVE, self, pos))
             elif p.loyalty != self.loyalty: # No friendly fire
-                self.add_outcome(t, Capture(self.piece, pos, p))
+                self.add_outcome(t, MoveRecord(K.CAPTURE, self, pos, (p,)))
 
 
 
 
 class Knight(ChessPiece):
+    __slots__ = ()
+    ACTIONS = (KnightJump,)
     def __init__(self, loyalty: Loyalty, position):
         super().__init__(loyalty=loyalty, piece_type=PieceType.KNIGHT, position=position)    
-        self.actions.append(KnightJump(self))
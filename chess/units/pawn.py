@@ -2,17 +2,19 @@ import numpy as np
 from typing import Tuple
 
 from utils.chess_types import Position, Vector
-from utils.chess_types import DirCls as D
+from utils.chess_types import DirCls as D, vadd
 from utils.chess_types import Loyalty, PieceType
 
-from chess.units.piece import ChessPiece
+from chess.units.piece import ChessPiece, SyncedAttr
 from chess.actions.action import Action
-from chess.actions.outcome import Move, Capture, MultiMove, MultiCapture
+from chess.actions.outcome import MoveRecord, OutcomeKind as K
 
 class PawnMoveOnly(Action):
     """
     Represents a move action for a pawn.
     """
+    __slots__ = ()
+    can_capture: bool = False
     
     def flag_enpassant(self):
         self.piece.en_passantable = True
@@ -23,20 +25,21 @@ class PawnMoveOnly(Action):
                               length=2 if self.move_count == 0 else 1,
                               enemy_ok=False)
         for i, (pos, t, p) in enumerate(poss_moves):
-            self.add_outcome(t, Move(self.piece, pos, callback = self.flag_enpassant if i==1 else lambda: None))
+            self.add_outcome(t, MoveRecord(K.MOVE, self, pos, callback='flag_enpassant' if i==1 else None))
 
 
 class PawnCaptureOnly(Action):
     """
     Represents a capture action for a pawn.
     """
+    __slots__ = ()
     def update(self):
         super().update()
         for v in (D.f_l, D.f_r):
             for pos, t, p in self.get_line(v,
                                           length=1,
                                           can_move=False):
-                self.add_outcome(t, Capture(self.piece, pos, p))
+                self.add_outcome(t, MoveRecord(K.CAPTURE, self, pos, (p,)))
                 break
 
 
@@ -44,6 +47,7 @@ class PawnPassant(Action):
     """
     Represents an en passant capture action for a pawn.
     """
+    __slots__ = ()
     
     def update(self):
         super().update()
@@ -53,7 +57,7 @@ class PawnPassant(Action):
                                            can_move=False):
                 if isinstance(p, Pawn) and p.loyalty != self.piece.loyalty and p.en_passantable:
                     for posD, tD, pD in self.get_line(dv, length=1, can_move=True, enemy_ok=False):
-                        self.add_outcome(tD, Capture(self.piece, posD, p, l_delta=2))
+                        self.add_outcome(tD, MoveRecord(K.CAPTURE, self, posD, (p,), l_delta=2))
                         # break
                     
 class ShieldWallAdvance(Action):
@@ -61,6 +65,8 @@ class ShieldWallAdvance(Action):
     Represents a special action for pawns to advance in a shield wall formation.
     This is a custom action that allows pawns to move forward in a coordinated manner.
     """
+    __slots__ = ()
+    can_capture: bool = False
     
     def update(self):
         super().update()
@@ -77,8 +83,7 @@ class ShieldWallAdvance(Action):
         piece_targets.append(pos)
         
         for dx in (D.l, D.r):  # Move pawns up to one square left and right
-            dx = self.orient_vector(dx)
-            dpos = self.piece.position + dx
+            dpos = vadd(self.piece.position, self.orient_vector(dx))
             dt, dp = self.board.at_pos(dpos)
             if dt is None or dp is None:
                 continue
@@ -95,13 +100,14 @@ class ShieldWallAdvance(Action):
             piece_targets.append(pos)
             
         if len(advancing_pieces) < 2: return # Only advance when at least one adjacent pawn can come with.
-        self.add_outcome(self.board[self.piece.position], MultiMove(advancing_pieces, piece_targets, callback=lambda: None))  # Execute the advance action
+        self.add_outcome(self.board[self.piece.position], MoveRecord(K.MULTI_MOVE, self, data=(tuple(advancing_pieces), tuple(piece_targets))))  # Execute the advance action
 
 class ChainCapture(Action):
     """
     Represents a chain capture action for pawns.
     This allows diagonally connected pawns to capture together, staying connected while shifting in the direction of the chain.
     """
+    __slots__ = ()
     
     def update(self):
         super().update()
@@ -131,23 +137,21 @@ class ChainCapture(Action):
             if target_tile is None: # Cannot act if no target or pawn_chain
                 continue
             
-            self.add_outcome(target_tile, MultiCapture(pawn_chain, target_chain,
-                                                     captured=[target_tile.piece], callback=lambda: None,
-                                                     l_delta=-(len(pawn_chain) - 1)))
+            self.add_outcome(target_tile, MoveRecord(K.MULTI_CAPTURE, self,
+                                                     captured=(target_tile.piece,),
+                                                     l_delta=-(len(pawn_chain) - 1),
+                                                     data=(tuple(pawn_chain), tuple(target_chain))))
         # TODO: Shift all pawns in order of furthest to self.piece.
     
 
 class Pawn(ChessPiece):
-    en_passantable: bool
+    __slots__ = ('_en_passantable',)
+    ACTIONS = (PawnMoveOnly, PawnCaptureOnly, PawnPassant, ShieldWallAdvance, ChainCapture)
+    en_passantable: bool = SyncedAttr(False)
     
     def __init__(self, loyalty: Loyalty, position):
         super().__init__(loyalty=loyalty, piece_type=PieceType.PAWN, position=position)
         self.en_passantable = False
-        self.actions.append(PawnMoveOnly(self))
-        self.actions.append(PawnCaptureOnly(self))
-        self.actions.append(PawnPassant(self))
-        self.actions.append(ShieldWallAdvance(self))
-        self.actions.append(ChainCapture(self))
 
     def turn_changed(self):
         if self.board.current_turn == self.loyalty:
@@ -1,34 +1,76 @@
-import pygame as pg
 import numpy as np
 from typing import List, Optional, Self, Dict, Tuple, Union
 
 from utils.chess_types import Position, Vector, Direction
 from utils.chess_types import Loyalty, PieceType, InitFacing
 from utils.chess_types import DirCls as D
+from utils.chess_types import ORIENTED, orient, vadd, vsub
 
 from globalref import OBJREF, GlobalAccessObject
 
+from chess.actions.outcome import truncate
+from chess.board_geometry import orient_vectors
+
+
+# Outcome generation levels (ChessPiece._level).
+GEN_STALE: int = 0      # Outcomes must be regenerated before use.
+GEN_CAPTURES: int = 1   # Only capturing actions were generated (enough for the attack maps).
+GEN_FULL: int = 2       # Every action was generated.
 
-class ChessPiece(GlobalAccessObject):
-    name: str
 
-    piece_type: PieceType = PieceType.NONE
-    loyalty: Loyalty = Loyalty.NONE
+class SyncedAttr:
+    """
+    Piece attribute which writes through to the board planes when set.
+    """
+    def __init__(self, default=None):
+        self.default = default
     
-    actions: List[object]
-    _outcomes: Optional[Dict[object, object]]
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.attr = '_' + name
+    
+    def __get__(self, obj, objtype=None):
+        if obj is None: return self
+        return getattr(obj, self.attr, self.default)
+    
+    def __set__(self, obj, value):
+        tile = obj._tile
+        if tile is not None and tile.owner is not None:
+            tile.owner.record(setattr, obj, self.name, getattr(obj, self.attr, self.default))
+        setattr(obj, self.attr, value)
+        if tile is not None:
+            tile.sync()
+
+
+class ChessPiece(GlobalAccessObject):
+    __slots__ = ('loyalty', 'piece_type', 'actions', '_outcomes',
+                 '_facing', '_position', '_tile', '_reads', '_level',
+                 '_move_count', 'position_history', 'move_history')
+    
+    # Per-type data, shared by every piece of a class.
+    name: str = 'ChessPiece'                            # Set to the class name for each subclass
+    ACTIONS: Tuple[type, ...] = ()                      # Action classes, instanced for each piece
+    _sprites: Dict[Tuple[Loyalty, PieceType], object] = {} # Surface (or tuple of surfaces), resolved from the asset loader when first drawn.
     
-    _sprite: Union[pg.Surface, Tuple[pg.Surface]]
+    piece_type: PieceType
+    loyalty: Loyalty
     
-    facing: Direction # +0- X, +0- Y
+    actions: Tuple[object, ...]
+    _outcomes: Optional[Dict[object, object]]
+    
+    facing: Direction = SyncedAttr() # +0- X, +0- Y
     
     _position: tuple[int, int]
+    _tile: Optional[object] # Tile currently holding this piece
+    _reads: Optional[frozenset] # Squares read when outcomes were last generated (None = never or volatile)
+    _level: int # Generation level of the current outcomes (see GEN_*)
     
-    move_count: int # TODO: Rethink this whole situation
+    move_count: int = SyncedAttr(0) # TODO: Rethink this whole situation
     position_history: List[Position]
     move_history: List[Vector]
     
     is_leader: bool = False
+    eager: bool = False # Regenerated during every board update, for pieces whose generation changes their state.
     
     # TODO: Morale?
     
@@ -36,22 +78,26 @@ class ChessPiece(GlobalAccessObject):
     #       Global reference instead?
     #       Or pass it in as needed?
     
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.name = cls.__name__
+    
     def __init__(self,
                  loyalty: Loyalty=Loyalty.NONE,
                  position: Position = (0, 0),
                  piece_type: PieceType=PieceType.NONE,):
-        self.name = self.__class__.__name__
-        
-        self.actions: List[object] = []
+        self._tile = None
+        self._reads = None
+        self._level = GEN_STALE
         
         self.loyalty: Loyalty = loyalty
         self.piece_type: PieceType = piece_type
         
-        self._sprite = self.al.piece_sprites.get(self.loyalty, {}).get(self.piece_type, self.al.DEFAULT_PIECE_SPRITE)
+        self.actions: Tuple[object, ...] = tuple(a(self) for a in self.ACTIONS)
         
-        self.facing = np.asarray(InitFacing[self.loyalty])
+        self.facing = InitFacing[self.loyalty]
         
-        self._position: Position = np.asarray(position) # TODO: Would this be good to store in piece?
+        self.position = position # TODO: Would this be good to store in piece?
         self.move_count: int = 0
         
         # Should track a turn-stamped history of positions?
@@ -69,26 +115,44 @@ class ChessPiece(GlobalAccessObject):
         Called when the turn changes.
         """
         
-    def update(self):
+    def update(self, captures_only: bool = False):
         """
-        Update all actions for this piece.
+        Update all actions for this piece (or only the actions which can capture).
+        Use Board.regenerate to keep read tracking and attack maps in sync.
         """
-        self._outcomes = None # Delete cached outcomes?
+        self.board.record(setattr, self, '_outcomes', self._outcomes)
+        outcomes = {}
         for action in self.actions:
+            if captures_only and not action.can_capture: continue
             action.update()
+            outcomes.update(action.outcomes)
+        self._outcomes = outcomes
 
     # returns: Tile -> Outcome
     @property
     def outcomes(self) -> Dict[object, object]:
         """
         Returns possible action outcomes for this piece.
+        Outcomes are generated on first access after the piece goes stale.
+        """
+        if self._level != GEN_FULL and self.on_board:
+            self._tile.owner.regenerate(self)
+        return self._outcomes if self._outcomes is not None else {}
+    
+    @property
+    def capture_outcomes(self) -> Dict[object, object]:
+        """
+        Returns the action outcomes which capture.
+        A stale piece only generates its capturing actions.
         """
-        if self._outcomes is None:
-            self._outcomes = {}
-            for action in self.actions:
-                self._outcomes.update(action.outcomes)
-                
-        return self._outcomes
+        if self._level == GEN_STALE and self.on_board:
+            self._tile.owner.regenerate(self, captures_only=True)
+        if not self._outcomes: return {}
+        return {t: oc for t, oc in self._outcomes.items() if oc.captured}
+    
+    @property
+    def on_board(self) -> bool:
+        return self._tile is not None and self._tile.owner is not None
     #
     # # # # # # # # # #
     
@@ -107,7 +171,12 @@ class ChessPiece(GlobalAccessObject):
         self.moved_to(position)
     
     def moved_to(self, position: Position):
-        vector = position - self.position
+        position = (int(position[0]), int(position[1]))
+        vector = vsub(position, self._position)
+        
+        self.board.record(setattr, self, 'position', self._position)
+        self.board.record(truncate, self.position_history, len(self.position_history))
+        self.board.record(truncate, self.move_history, len(self.move_history))
         
         self.position = position
         self.position_history.append(position)
@@ -133,26 +202,29 @@ class ChessPiece(GlobalAccessObject):
                  jump_gap: bool = False) -> List[Tuple[Position, Optional[object], Optional[Self]]]:
         """
         Get a line of (pos, tile, piece) tuples in the given direction.
+        Walks the precomputed rays of the board geometry.
         """
+        board = self.board
+        geometry = board.geometry
+        line_dir = self.orient_vector(line_dir)
+        sq = self.square_on(board, start)
+        if sq < 0: return []
+        
+        squares = geometry.line(sq, line_dir) if jump_gap else geometry.ray(sq, line_dir)
+        tiles = board._tiles_flat
+        reading = board._reading
+        
         line = []
-        for i in range(1, length+1):
-            v = line_dir * i
-            pos, tile, piece = self.at_vec(v, start)
-            
-            
-            if tile is None or tile.is_void:
-                if jump_gap:
-                    continue
-                else:
-                    break
-            
-            if tile.is_blocked:
-                break
+        for s in squares[:length]:
+            tile = tiles[s]
+            if reading is not None: reading.add(s)
+            if tile.is_void: continue # Only in line when jumping gaps
             
+            piece = tile.piece
             if piece is not None: # If piece on tile
                 if piece.loyalty == self.loyalty:
                     if ally_ok:
-                        line.append((pos, tile, tile.piece))
+                        line.append((geometry.positions[s], tile, piece))
                     if jump_ally:
                         continue
                     else:
@@ -160,7 +232,7 @@ class ChessPiece(GlobalAccessObject):
                     
                 else: # Enemy piece
                     if enemy_ok:
-                        line.append((pos, tile, piece))
+                        line.append((geometry.positions[s], tile, piece))
                     if jump_enemy:
                         continue
                     else:
@@ -168,40 +240,83 @@ class ChessPiece(GlobalAccessObject):
                     
             else: # If no piece on tile
                 if can_move:
-                    line.append((pos, tile, None))
+                    line.append((geometry.positions[s], tile, None))
                 else:
                     continue
         return line
     
+    def get_jumps(self, vectors: Tuple[Vector, ...]) -> List[Tuple[Position, object, Optional[Self]]]:
+        """
+        Get (pos, tile, piece) tuples at each of the given vectors, skipping OOB, blocked and void tiles.
+        """
+        board = self.board
+        geometry = board.geometry
+        tiles = board._tiles_flat
+        reading = board._reading
+        
+        sq = self.square_on(board)
+        if sq < 0: return []
+        
+        jumps = []
+        for s in geometry.jumps(sq, orient_vectors(vectors, self.facing)):
+            tile = tiles[s]
+            if reading is not None: reading.add(s)
+            jumps.append((geometry.positions[s], tile, tile.piece))
+        return jumps
+    
+    def square_on(self, board: object, start: Optional[Position]=None) -> int:
+        """
+        Get the flat square index of start (or of this piece) on the board, -1 if out of bounds.
+        """
+        if start is None:
+            if self._tile is not None and self._tile.owner is board:
+                return self._tile.index
+            start = self.position
+        return board.geometry.square(start)
+    
     def at_vec(self, vector: Vector, start: Optional[Position]=None) -> Tuple[Position, Optional[object], Optional[Self]]:
         """
         Get the tile and piece at the given vector.
         """
         if start is None: start = self.position
-        pos = start + self.orient_vector(vector)
+        pos = vadd(start, self.orient_vector(vector))
         return pos, *self.board.at_pos(pos)
     
-    # TODO: Add as board method or start a utilities file.
-    def orient_vector(self, vector: Vector, facing: Optional[Direction]=None) -> Vector: # TODO: Matrix multiplication solution?
+    def orient_vector(self, vector: Vector, facing: Optional[Direction]=None) -> Vector:
         # Input vector is relative to facing: [forward/backward, right/left]
         #   [+ is forward, + is right]
         # Output vector is in board coords: [x, y]
         facing = self.facing if facing is None else facing
-        return vector * facing[1] + vector[::-1] * facing[0]
+        oriented = ORIENTED.get(facing, None)
+        if oriented is not None:
+            v = oriented.get(vector, None)
+            if v is not None: return v
+        return orient(vector, facing)
     #
     # # #
     
     @property
-    def sprite(self) -> pg.Surface:
-        return self._sprite
+    def sprites(self) -> object:
+        """
+        The sprite asset for this piece (a tuple for pieces with several states).
+        """
+        k = (self.loyalty, self.piece_type)
+        sprite = self._sprites.get(k, None)
+        if sprite is None:
+            sprite = self._sprites[k] = self.al.piece_sprites.get(self.loyalty, {}).get(self.piece_type, self.al.DEFAULT_PIECE_SPRITE)
+        return sprite
+    
+    @property
+    def sprite(self) -> object:
+        return self.sprites
     
     @property
     def position(self) -> Position:
-        return np.array(self._position, dtype=int)
+        return self._position
     
     @position.setter
     def position(self, value: Position):
-        self._position = np.array(value, dtype=int)
+        self._position = (int(value[0]), int(value[1]))
     
     def __repr__(self):
         return f'{self.loyalty.name} {self.name}'
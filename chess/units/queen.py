@@ -6,23 +6,25 @@ from utils.chess_types import Loyalty, PieceType
 
 from chess.units.piece import ChessPiece
 from chess.actions.action import Action
-from chess.actions.outcome import Move, Capture
+from chess.actions.outcome import MoveRecord, OutcomeKind as K
 
 
 class QueenCapture(Action):
     """
     Represents a move/capture action for a queen.
     """
+    __slots__ = ()
     def update(self):
         super().update()
         
         for v in D.cardiagonal: # Cardinal vectors
             for pos, t, p in self.get_line(v, length=7, enemy_ok=True):
-                self.add_outcome(t, Move(self.piece, pos) if p is None else Capture(self.piece, pos, p))
+                self.add_outcome(t, MoveRecord(K.MOVE, self, pos) if p is None else MoveRecord(K.CAPTURE, self, pos, (p,)))
 
 
 
 class Queen(ChessPiece):
+    __slots__ = ()
+    ACTIONS = (QueenCapture,)
     def __init__(self, loyalty: Loyalty, position):
-        super().__init__(loyalty=loyalty, piece_type=PieceType.QUEEN, position=position)
-        self.actions.append(QueenCapture(self))
\ No newline at end of file
+        super().__init__(loyalty=loyalty, piece_type=PieceType.QUEEN, position=position)
\ No newline at end of file
@@ -0,0 +1,87 @@
+import numpy as np
+from typing import Dict, Tuple, List
+
+from utils.chess_types import Loyalty, PieceType
+
+
+# Fixed seed, keys must match between boards (and processes) of the same shape.
+ZOBRIST_SEED: int = 0x5EED_C4E55
+
+N_TILETYPES: int = 5        # TileType value + 1
+N_PIECETYPES: int = len(PieceType)
+N_LOYALTIES: int = 5        # Encoded loyalty (value * 2)
+N_FACINGS: int = 5          # Facing index + 1
+N_MOVE_STATES: int = 4      # (has moved, odd move count)
+N_FLAGS: int = 128          # Packed int8 flags
+N_TURNS: int = 64           # Turn order index
+N_LEADERSHIP: int = 16      # Leadership points
+
+
+class ZobristKeys:
+    """
+    Random 64-bit keys for every board feature, shared between boards of the same shape.
+    Keys are stored as nested python lists of ints, which xor faster than numpy scalars.
+    """
+
+    _cache: Dict[Tuple[int, int], 'ZobristKeys'] = {}
+
+    tiles: List[List[int]]
+    pieces: List[List[List[int]]]
+    facings: List[List[int]]
+    moves: List[List[int]]
+    flags: List[List[int]]
+    turns: List[int]
+    leadership: List[List[int]]
+
+    def __init__(self, shape: Tuple[int, int]):
+        n_sq = shape[0] * shape[1]
+        rng = np.random.default_rng(ZOBRIST_SEED)
+
+        def keys(*dims) -> list:
+            return rng.integers(0, 2**64, size=dims, dtype=np.uint64, endpoint=False).tolist()
+
+        self.tiles = keys(n_sq, N_TILETYPES)
+        self.pieces = keys(n_sq, N_PIECETYPES, N_LOYALTIES)
+        self.facings = keys(n_sq, N_FACINGS)
+        self.moves = keys(n_sq, N_MOVE_STATES)
+        self.flags = keys(n_sq, N_FLAGS)
+        self.turns = keys(N_TURNS)
+        self.leadership = keys(N_LOYALTIES, N_LEADERSHIP)
+
+    @classmethod
+    def for_shape(cls, shape: Tuple[int, int]) -> 'ZobristKeys':
+        keys = cls._cache.get(shape, None)
+        if keys is None:
+            keys = cls._cache[shape] = cls(shape)
+        return keys
+
+    def square_key(self, planes, idx: int) -> int:
+        """
+        Key of everything on a single square (tile and piece state).
+        """
+        key = self.tiles[idx][planes.tiles.flat[idx] + 1]
+        pt = planes.pieces.flat[idx]
+        if pt == 0: return key
+        mc = int(planes.move_counts.flat[idx])
+        return (key
+                ^ self.pieces[idx][pt][planes.loyalties.flat[idx]]
+                ^ self.facings[idx][planes.facings.flat[idx] + 1]
+                ^ self.moves[idx][min(mc, 1) | ((mc & 1) << 1)]
+                ^ self.flags[idx][planes.flags.flat[idx]])
+
+    def turn_key(self, turn: int, turn_order: List[Loyalty]) -> int:
+        return self.turns[turn % len(turn_order) % N_TURNS]
+
+    def leadership_key(self, loyalty: Loyalty, pts: int) -> int:
+        return self.leadership[int(loyalty.value * 2)][max(0, min(pts, N_LEADERSHIP - 1))]
+
+    def board_key(self, planes, turn: int, turn_order: List[Loyalty], leadership_pts: Dict[Loyalty, int]) -> int:
+        """
+        Computes a full key from scratch.
+        """
+        key = self.turn_key(turn, turn_order)
+        for idx in range(planes.tiles.size):
+            key ^= self.square_key(planes, idx)
+        for l, pts in leadership_pts.items():
+            key ^= self.leadership_key(l, pts)
+        return key
@@ -0,0 +1,112 @@
+import sys
+import time
+import argparse
+import tracemalloc
+from typing import Optional, Dict, List
+
+from engine.perft import scenarios, load_board
+
+
+# BENCH:
+#   Measures the cost of Board.update() on the saved scenarios,
+#   including the outcomes of the faction to move (which are generated lazily).
+#       full : every piece is marked stale, so all needed outcomes are regenerated.
+#       ply  : an outcome is applied and undone, so only affected pieces regenerate.
+#   Allocations are traced with tracemalloc (peak = transient bytes, blocks = net blocks still allocated).
+#   Regenerations counts the pieces (re)generated per update.
+#   Timing is measured in a separate untraced pass.
+#
+#   Run from the repository root:
+#       python -m engine.bench standard zombie -n 200
+
+
+DEFAULT_ITERATIONS = 100
+
+
+def turn_outcomes(board) -> None:
+    for p in board.loyal_pieces():
+        p.outcomes
+
+
+def full_update(board) -> None:
+    for p in board.pieces:
+        board.set_reads(p, None)
+    board.update()
+    turn_outcomes(board)
+
+
+def ply_update(board, outcomes: List[object], i: int) -> None:
+    record = board.apply(outcomes[i % len(outcomes)])
+    turn_outcomes(board)
+    board.undo(record)
+
+
+def count_regenerations(board) -> List[int]:
+    """
+    Wraps board.regenerate to count calls, returns the (mutable) counter.
+    """
+    counter = [0]
+    regenerate = board.regenerate
+    def counting(*args, **kwargs):
+        counter[0] += 1
+        return regenerate(*args, **kwargs)
+    board.regenerate = counting
+    return counter
+
+
+def bench(scenario: str, mode: str, iterations: int) -> Dict[str, float]:
+    """
+    Returns time, peak traced bytes, net traced blocks and regenerated pieces per update.
+    """
+    board = load_board(scenario)
+    outcomes = [oc for p in board.loyal_pieces() for oc in p.outcomes.values()]
+    counter = count_regenerations(board)
+    if mode == 'full':
+        step = lambda i: full_update(board)
+    else:
+        step = lambda i: ply_update(board, outcomes, i)
+    
+    step(0) # Warm caches (geometry tables, orientation cache).
+    
+    counter[0] = 0
+    t = time.perf_counter()
+    for i in range(iterations):
+        step(i)
+    seconds = time.perf_counter() - t
+    regenerated = counter[0]
+    
+    tracemalloc.start()
+    peak = 0
+    before = tracemalloc.take_snapshot()
+    for i in range(iterations):
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        step(i)
+        peak += tracemalloc.get_traced_memory()[1] - current
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    
+    blocks = sum(s.count_diff for s in after.compare_to(before, 'lineno'))
+    return {'us': seconds / iterations * 1e6,
+            'peak_kib': peak / iterations / 1024,
+            'blocks': blocks / iterations,
+            'regenerated': regenerated / iterations}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark Board.update() time and allocations.')
+    parser.add_argument('scenarios', nargs='*', help='Scenario names (default: all saved states).')
+    parser.add_argument('-n', '--iterations', type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument('-m', '--mode', choices=('full', 'ply', 'both'), default='both')
+    args = parser.parse_args(argv)
+    
+    modes = ('full', 'ply') if args.mode == 'both' else (args.mode,)
+    for scenario in (args.scenarios or scenarios()):
+        for mode in modes:
+            r = bench(scenario, mode, args.iterations)
+            print(f"{scenario:<12} {mode:<5} {r['us']:>9.1f} us/update  {r['peak_kib']:>8.1f} KiB peak  {r['blocks']:>8.1f} blocks retained  {r['regenerated']:>6.1f} regenerations")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,7 +6,7 @@ from engine.bots.bot import Bot
 from utils.chess_types import Loyalty, PieceType, TileType
 from chess.units.piece import ChessPiece
 
-from chess.actions.outcome import Move, Capture
+from chess.actions.outcome import OutcomeKind
 from chess.actions.action import Action
 
 class AggroBot(Bot):
@@ -20,7 +20,7 @@ class AggroBot(Bot):
         """
         self.assert_turn() # TODO: Debug? Remove once logic is good.
         
-        all_ocs = self.outcomes
+        all_ocs = self.safe_outcomes()
         rand_p_order = np.random.permutation([p for p, k in all_ocs.items() if k])
         
         # TODO: Look for checks!
@@ -30,7 +30,7 @@ class AggroBot(Bot):
             # Filter to only Capture outcomes, select randomly.
 
             p_ocs = all_ocs[piece]
-            caps = [t for t, _oc in p_ocs.items() if isinstance(_oc, Capture)]
+            caps = [t for t, _oc in p_ocs.items() if _oc.kind == OutcomeKind.CAPTURE]
             if not caps: continue
             
             tile = np.random.choice(caps)
@@ -70,7 +70,7 @@ class AggroValueBot(Bot):
         print(self.count_material(), 'AggroValueBot material count.')
         # cache_idx = self.board.cache_state()
         
-        all_ocs = self.outcomes
+        all_ocs = self.safe_outcomes()
         rand_p_order = np.random.permutation([p for p, k in all_ocs.items() if k])
         
         # TODO: Look for checks!
@@ -79,7 +79,7 @@ class AggroValueBot(Bot):
         for piece in rand_p_order:
             # Filter to only Capture outcomes, select randomly.
             p_ocs = all_ocs[piece]
-            caps.extend([(t, oc, sum(self.piece_values.get(p.piece_type, 0) * (-1 if p.loyalty == self.loyalty else 1) for p in oc.captured)) for t, oc in p_ocs.items() if isinstance(oc, Capture)])
+            caps.extend([(t, oc, sum(self.piece_values.get(p.piece_type, 0) * (-1 if p.loyalty == self.loyalty else 1) for p in oc.captured)) for t, oc in p_ocs.items() if oc.kind == OutcomeKind.CAPTURE])
         
         # If there are captures, select the one with the highest value.
         if caps:
@@ -1,13 +1,16 @@
 import numpy as np
+from concurrent.futures import Future
 from typing import Optional, Tuple, List, Dict
 
 from utils.chess_types import Loyalty, PieceType, TileType
 from chess.units.piece import ChessPiece
 from chess.tiles.tile import Tile
-from chess.actions.outcome import Outcome, Move, Capture
+from chess.actions.outcome import MoveRecord
 
 from globalref import GlobalAccessObject
 
+from engine.legal import legal_outcomes
+
 
 # BOT TURN LOGIC:
 
@@ -37,6 +40,9 @@ class Bot(GlobalAccessObject):
     """
 
     loyalty: Loyalty
+    preview: Optional[object] = None # Channel with the best line while thinking (see engine/preview.py)
+    preview_moves: Dict[int, Tuple[Tile, MoveRecord]] = {} # {code: (tile, outcome)} of the position being thought about
+    can_ponder: bool = False # ponder() thinks during other factions' turns (see GameManager.next_bot)
     
     piece_values: Dict[PieceType, float] = {
         PieceType.PAWN: 1.0,
@@ -80,6 +86,26 @@ class Bot(GlobalAccessObject):
     def play(self) -> Tuple[Optional[Tile], Optional[ChessPiece]]:
         raise NotImplementedError("This method should be implemented by subclasses.")
 
+    def start_play(self) -> Future:
+        """
+        Start choosing an outcome without blocking the game loop, returns a future (tile, outcome) to poll.
+        Bots which decide quickly play at once.
+        """
+        job = Future()
+        job.set_result(self.play())
+        return job
+
+    def ponder(self) -> None:
+        """ Start thinking during another faction's turn (bots which can't ponder ignore this). """
+        pass
+    
+    def stop_pondering(self) -> None:
+        pass
+    
+    def shutdown(self) -> None:
+        """ Release background workers when the game ends. """
+        pass
+
 
     # TODO: More thinking on player turn leads to more depth during bot eval?
     #       Use some threading to allow bot to think constantly?
@@ -96,7 +122,7 @@ class Bot(GlobalAccessObject):
     # Have bots consider moves of certain pieces?
     #   Overlook other pieces?
     #   How much value should be placed on 'morale'?
-    def eval_outcome(self, outcome: Outcome, depth: int = 0) -> float:
+    def eval_outcome(self, outcome: MoveRecord, depth: int = 0) -> float:
         """
         Evaluate the outcome of a move.
         This is a placeholder for actual evaluation logic.
@@ -105,8 +131,15 @@ class Bot(GlobalAccessObject):
         
     # TODO: Is depth worth considering here?
     #       Or focus on 'immediate' check avoidance.
-    def safe_outcomes(self, depth: int = 0) -> Dict[ChessPiece, Dict[Tile, Outcome]]:
-        pass
+    def safe_outcomes(self, depth: int = 0) -> Dict[ChessPiece, Dict[Tile, MoveRecord]]:
+        """
+        Outcomes which do not leave one of the bot's leaders capturable.
+        Falls back to all outcomes if none are safe (the leader is lost anyway).
+        """
+        safe = legal_outcomes(self.board, self.loyalty)
+        if not any(safe.values()):
+            return self.outcomes
+        return safe
     
     def count_material(self, l: Optional[Loyalty]=None) -> float:
         """
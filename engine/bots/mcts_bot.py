@@ -0,0 +1,283 @@
+import math
+import time
+import random
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional, Tuple, List, Dict
+
+from engine.bots.bot import Bot
+from engine.search import team, leader_teams
+from engine.move_ordering import MoveOrdering
+from engine.transposition import encode_move, NO_MOVE
+from engine.parallel_search import make_executor, serialize_board, root_moves
+from engine.lazy_smp import smp_setup
+
+from utils.chess_types import Loyalty
+from chess.tiles.tile import Tile
+from chess.actions.outcome import MoveRecord
+
+
+# MCTS:
+#   Monte Carlo tree search over Board.apply/undo (no state copies or cache_state).
+#       selection : UCT, each node's value is from the point of view of the team which played its outcome.
+#       widening  : a node only expands WIDEN_C * visits ^ WIDEN_ALPHA children, best ordered outcomes first.
+#       rollout   : capture-first random play (like AggroBot), up to ROLLOUT_PLIES or until a team loses its leaders.
+#       reward    : each team's material lead over its best opponent, squashed to [0, 1].
+#   Runs for a number of iterations and/or milliseconds, and plays the most visited root outcome.
+#   In the game the search runs in a worker process (see start_play), so the frame loop keeps drawing.
+
+
+UCT_C: float = 1.4
+WIDEN_C: float = 2.0
+WIDEN_ALPHA: float = 0.5
+ROLLOUT_PLIES: int = 8
+REWARD_SCALE: float = 3.0       # Material lead (in pawns) of a 73% reward.
+
+
+class MCTSNode:
+    """
+    Search tree node, reached by playing outcome from its parent.
+    """
+    __slots__ = ('outcome', 'parent', 'team', 'children', 'untried', 'visits', 'value')
+    
+    outcome: Optional[MoveRecord]
+    parent: Optional['MCTSNode']
+    team: Optional[int]                     # Team which played outcome (None at the root)
+    children: List['MCTSNode']
+    untried: Optional[List[MoveRecord]]     # Ordered outcomes not expanded yet (None until first expanded)
+    visits: int
+    value: float                            # Sum of rewards for team
+    
+    def __init__(self, outcome: Optional[MoveRecord] = None, parent: Optional['MCTSNode'] = None, team: Optional[int] = None):
+        self.outcome = outcome
+        self.parent = parent
+        self.team = team
+        self.children = []
+        self.untried = None
+        self.visits = 0
+        self.value = 0.0
+    
+    def can_expand(self) -> bool:
+        return bool(self.untried) and len(self.children) < WIDEN_C * max(1, self.visits) ** WIDEN_ALPHA
+    
+    def select(self) -> 'MCTSNode':
+        """
+        Returns the child with the highest UCT score.
+        """
+        log_n = math.log(max(1, self.visits))
+        return max(self.children, key=lambda c: c.value / c.visits + UCT_C * math.sqrt(log_n / c.visits))
+
+
+def mcts_worker(data: bytes, key: int, loyalty: Loyalty, iterations: Optional[int], time_limit_ms: Optional[float],
+                rng_state: object) -> Tuple[int, Dict[str, float], object]:
+    """
+    Runs one decision of an MCTSBot on a rebuilt board in a worker process.
+    Returns (best code, last_stats, rng state after the search).
+    """
+    board, _tt = smp_setup(data, key, None)
+    bot = MCTSBot(loyalty, iterations, time_limit_ms)
+    bot.rng.setstate(rng_state)
+    _tile, oc = bot.play()
+    return (encode_move(board, oc) if oc is not None else NO_MOVE), bot.last_stats, bot.rng.getstate()
+
+
+class MCTSBot(Bot):
+    """
+    Plays the most visited root outcome of a Monte Carlo tree search.
+    """
+    
+    iterations: Optional[int]           # Iterations per decision (None for no limit)
+    time_limit_ms: Optional[float]      # Milliseconds per decision (None for no limit)
+    rng: random.Random
+    last_stats: Dict[str, float]        # Rollouts, seconds and rollouts/s of the last decision
+    executor: Optional[ProcessPoolExecutor] # Worker process for start_play, started on first use
+    
+    def __init__(self,
+                 loyalty: Loyalty,
+                 iterations: Optional[int] = None,
+                 time_limit_ms: Optional[float] = 2000.0,
+                 seed: Optional[int] = None):
+        super().__init__(loyalty)
+        if iterations is None and time_limit_ms is None:
+            raise ValueError("MCTSBot: Set iterations, time_limit_ms or both.")
+        self.iterations = iterations
+        self.time_limit_ms = time_limit_ms
+        self.rng = random.Random(seed)
+        self.last_stats = {}
+        self.executor = None
+    
+    # # #
+    # Rewards
+    def rewards(self, teams: Tuple[int, ...]) -> Dict[int, float]:
+        """
+        Each team's material lead over its best opponent, squashed to [0, 1].
+        """
+        values = self.piece_values
+        material = {t: 0.0 for t in teams}
+        for p in self.board.pieces:
+            t = team(p.loyalty)
+            if t in material:
+                material[t] += values.get(p.piece_type, 0.0)
+        if len(material) < 2: return {t: 0.5 for t in material}
+        rewards = {}
+        for t, m in material.items():
+            lead = m - max(o for u, o in material.items() if u != t)
+            rewards[t] = 1.0 / (1.0 + math.exp(-lead / REWARD_SCALE))
+        return rewards
+    
+    def game_over(self, leaders: Tuple[int, ...]) -> bool:
+        """
+        True if a team which had leaders at the root has lost them all.
+        """
+        return len(leader_teams(self.board)) < len(leaders)
+    #
+    # # #
+    
+    # # #
+    # Search
+    def node_outcomes(self, ordering: MoveOrdering) -> List[MoveRecord]:
+        board = self.board
+        return ordering.order([oc for p in board.loyal_pieces() for oc in p.outcomes.values()], 0)
+    
+    def rollout(self, leaders: Tuple[int, ...]) -> List[object]:
+        """
+        Plays capture-first random outcomes, returns the undo records (in order).
+        """
+        board = self.board
+        rng = self.rng
+        records = []
+        for _ in range(ROLLOUT_PLIES):
+            if self.game_over(leaders): break
+            pieces = board.loyal_pieces()
+            captures = [oc for p in pieces for oc in p.capture_outcomes.values()]
+            if captures:
+                oc = rng.choice(captures)
+            else:
+                oc = None
+                rng.shuffle(pieces)
+                for p in pieces:
+                    ocs = p.outcomes
+                    if ocs:
+                        oc = rng.choice(list(ocs.values()))
+                        break
+                if oc is None: break
+            records.append(board.apply(oc))
+        return records
+    
+    def search(self, root_ocs: List[MoveRecord]) -> MCTSNode:
+        """
+        Runs MCTS iterations from the current position, returns the root.
+        """
+        board = self.board
+        ordering = MoveOrdering(board, self.piece_values)
+        teams = tuple(sorted({team(p.loyalty) for p in board.pieces}))
+        leaders = leader_teams(board)
+        
+        root = MCTSNode()
+        root.untried = ordering.order(root_ocs, 0)
+        deadline = time.perf_counter() + self.time_limit_ms / 1000 if self.time_limit_ms is not None else math.inf
+        i = 0
+        while (self.iterations is None or i < self.iterations) and time.perf_counter() < deadline:
+            i += 1
+            node = root
+            records = []
+            
+            # Selection and expansion.
+            while True:
+                if node.untried is None:
+                    node.untried = [] if self.game_over(leaders) else self.node_outcomes(ordering)
+                if node.can_expand():
+                    oc = node.untried.pop(0)
+                    child = MCTSNode(oc, node, team(board.current_turn))
+                    node.children.append(child)
+                    records.append(board.apply(oc))
+                    node = child
+                    break
+                if not node.children: break
+                node = node.select()
+                records.append(board.apply(node.outcome))
+            
+            # Rollout.
+            rollout = self.rollout(leaders)
+            rewards = self.rewards(teams)
+            for record in reversed(rollout):
+                board.undo(record)
+            for record in reversed(records):
+                board.undo(record)
+            
+            # Backpropagation.
+            while node is not None:
+                node.visits += 1
+                if node.team is not None:
+                    node.value += rewards.get(node.team, 0.5)
+                node = node.parent
+        return root
+    #
+    # # #
+    
+    def play(self) -> Tuple[Optional[Tile], Optional[MoveRecord]]:
+        """
+        Searches the current position and returns the most visited (tile, outcome).
+        """
+        self.assert_turn()
+        
+        tiles = {}
+        for ocs in self.safe_outcomes().values():
+            for t, oc in ocs.items():
+                tiles[oc] = t
+        if not tiles:
+            print(f'MCTSBot {self.loyalty} has no moves.')
+            return None, None
+        
+        t = time.perf_counter()
+        root = self.search(list(tiles))
+        seconds = time.perf_counter() - t
+        
+        self.last_stats = {'rollouts': root.visits, 'seconds': seconds, 'rollouts_per_s': root.visits / seconds if seconds > 0 else 0.0}
+        if not root.children:
+            # No iteration completed (e.g. a tiny time limit), play the first ordered outcome.
+            oc = root.untried[0]
+            print(f'MCTSBot {self.loyalty}: no rollouts in {seconds:.2f}s, {oc} (first ordered)')
+            return tiles[oc], oc
+        
+        best = max(root.children, key=lambda c: c.visits)
+        print(f'MCTSBot {self.loyalty}: {root.visits} rollouts in {seconds:.2f}s ({self.last_stats["rollouts_per_s"]:.0f} rollouts/s), '
+              f'{best.outcome} ({best.visits} visits, {best.value / best.visits:.2f})')
+        return tiles[best.outcome], best.outcome
+    
+    def start_play(self) -> Future:
+        """
+        Starts the search in a worker process, returns a future (tile, outcome) for the game loop to poll.
+        The worker returns the best outcome's code, which is looked up in the outcomes the board already generated.
+        """
+        self.assert_turn()
+        job = Future()
+        board = self.board
+        by_code = root_moves(board)
+        if not by_code:
+            print(f'MCTSBot {self.loyalty} has no moves.')
+            job.set_result((None, None))
+            return job
+        
+        if self.executor is None:
+            self.executor = make_executor(1)
+        future = self.executor.submit(mcts_worker, serialize_board(board), board.zobrist_key, self.loyalty,
+                                      self.iterations, self.time_limit_ms, self.rng.getstate())
+        
+        def finish(f):
+            try:
+                code, self.last_stats, rng_state = f.result()
+            except BaseException as e: # Includes cancellation at shutdown.
+                job.set_exception(e)
+                return
+            self.rng.setstate(rng_state) # Continue the worker's random sequence in the next decision.
+            job.set_result(by_code.get(code, (None, None)))
+        future.add_done_callback(finish)
+        return job
+    
+    def shutdown(self) -> None:
+        """
+        Stops the worker process.
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
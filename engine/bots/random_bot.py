@@ -21,7 +21,7 @@ class RandomBot(Bot):
         """
         self.assert_turn() # TODO: Debug? Remove once logic is good.
         
-        all_ocs = self.outcomes
+        all_ocs = self.safe_outcomes()
         evals = []
         # best_oc = None
         for piece in np.random.permutation(list(all_ocs.keys())):
@@ -0,0 +1,288 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Tuple, Dict
+
+from engine.bots.bot import Bot
+from engine.search import SearchResult, QS_MAX_DEPTH, AUTO_WIDTH
+from engine.multi_search import SEARCH_STRATEGIES
+from engine.transposition import TranspositionTable, SharedTranspositionTable, encode_move, DEFAULT_SIZE_MB, BOUND_EXACT
+from engine.move_ordering import MoveOrdering
+from engine.parallel_search import ParallelSearch, make_executor, serialize_board, root_moves
+from engine.lazy_smp import LazySMPSearch, search_worker
+from engine.ponder import ponder_worker
+from engine.preview import PreviewChannel
+
+from utils.chess_types import Loyalty
+from chess.tiles.tile import Tile
+from chess.actions.outcome import MoveRecord
+
+
+PARALLEL_MODES: Tuple[str, ...] = ('root', 'smp')   # Root split (engine/parallel_search.py) or Lazy SMP (engine/lazy_smp.py)
+
+
+class SearchBot(Bot):
+    """
+    Plays the best outcome found by an alpha-beta search (see engine/search.py).
+    """
+    
+    strategy: str                           # Key of SEARCH_STRATEGIES ('paranoid' or 'maxn')
+    max_depth: int
+    time_limit: Optional[float]             # Seconds per decision, None for no limit
+    last_result: Optional[SearchResult]     # Result of the last search (nodes, depth, score)
+    tt: Optional[TranspositionTable]        # Kept between decisions
+    ordering: Optional[MoveOrdering]        # Kept between decisions (history), built on the first search
+    workers: int                            # Worker processes for a parallel search (1 searches in this process)
+    parallel: str                           # Key of PARALLEL_MODES
+    executor: Optional[object]              # Process pool, started on the first parallel search
+    shared_tt: Optional[SharedTranspositionTable]   # Lazy SMP and pondering table, replaces tt once created
+    ponder_future: Optional[Future]         # Running ponder job (see engine/ponder.py), None once stopped
+    thinker: Optional[ThreadPoolExecutor]   # Thread waiting on parallel searches started by start_play
+    preview: Optional[PreviewChannel]       # Best line of the running search, created on the first start_play
+    
+    def __init__(self,
+                 loyalty: Loyalty,
+                 max_depth: int = 4,
+                 time_limit: Optional[float] = 2.0,
+                 tt_size_mb: float = DEFAULT_SIZE_MB,
+                 strategy: str = 'paranoid',
+                 workers: int = 1,
+                 parallel: str = 'root'):
+        super().__init__(loyalty)
+        if strategy not in SEARCH_STRATEGIES:
+            raise ValueError(f"SearchBot: Unknown search strategy {strategy}, expected one of {tuple(SEARCH_STRATEGIES)}.")
+        if parallel not in PARALLEL_MODES:
+            raise ValueError(f"SearchBot: Unknown parallel mode {parallel}, expected one of {PARALLEL_MODES}.")
+        self.strategy = strategy
+        self.max_depth = max_depth
+        self.time_limit = time_limit
+        self.last_result = None
+        self.tt = TranspositionTable(tt_size_mb) if tt_size_mb > 0 else None
+        self.ordering = None
+        self.workers = workers
+        self.parallel = parallel
+        self.executor = None
+        self.shared_tt = None
+        self.ponder_future = None
+        self.thinker = None
+        self.preview = None
+    
+    def play(self) -> Tuple[Optional[Tile], Optional[MoveRecord]]:
+        """
+        Searches the current position and returns the best (tile, outcome).
+        """
+        self.assert_turn()
+        self.stop_pondering()
+        
+        result = self.ponder_hit(self.snapshot_moves())
+        if result is not None:
+            self.last_result = result
+            print(f'SearchBot {self.loyalty}: ponder hit, depth {result.depth}, score {result.score:.2f}')
+            return result.tile, result.outcome
+        
+        if self.workers > 1:
+            return self.play_parallel()
+        
+        tt = self.shared_tt if self.shared_tt is not None else self.tt
+        if tt is not None:
+            tt.reset_stats()
+        if self.ordering is None or self.ordering.board is not self.board:
+            self.ordering = MoveOrdering(self.board, self.piece_values)
+        search = SEARCH_STRATEGIES[self.strategy](self.board, self.loyalty, self.piece_values, self.max_depth, self.time_limit, tt, self.ordering)
+        search.preview = self.preview
+        result = self.last_result = search.run()
+        print(f'SearchBot {self.loyalty}: depth {result.depth}, score {result.score:.2f}, {result.nodes} nodes in {result.seconds:.2f}s ({result.nps:.0f} nodes/s)')
+        if tt is not None:
+            stats = tt.stats()
+            print(f"\ttt: {stats['hit_rate']:.0%} hits, {stats['overwrites']} overwrites, {stats['filled']:.1%} filled")
+        
+        if result.outcome is None:
+            print(f'SearchBot {self.loyalty} has no moves.')
+        return result.tile, result.outcome
+    
+    def start_play(self) -> Future:
+        """
+        Starts the search without blocking, returns a future (tile, outcome) for the game loop to poll.
+        Serial searches run in a worker process (through the shared table), parallel searches are waited on by a thread.
+        The position is snapshot here, and workers generate the root outcomes and return the best one's code,
+        so nothing touches the board while the game keeps drawing it.
+        """
+        self.assert_turn()
+        self.stop_pondering()
+        job = Future()
+        board = self.board
+        key = board.zobrist_key
+        by_code = self.snapshot_moves()
+        preview = self.preview_channel()
+        preview.clear(key)
+        
+        result = self.ponder_hit(by_code)
+        if result is not None:
+            self.last_result = result
+            print(f'SearchBot {self.loyalty}: ponder hit, depth {result.depth}, score {result.score:.2f}')
+            preview.publish(key, result.depth, result.score, (encode_move(board, result.outcome),))
+            job.set_result((result.tile, result.outcome))
+            return job
+        
+        if not by_code:
+            print(f'SearchBot {self.loyalty} has no moves.')
+            job.set_result((None, None))
+            return job
+        data = serialize_board(board)
+        if self.executor is None:
+            self.executor = make_executor(self.workers) # Started here, not from the thinker thread.
+        
+        if self.workers > 1:
+            if self.thinker is None:
+                self.thinker = ThreadPoolExecutor(max_workers=1)
+            return self.thinker.submit(self.play_parallel, data, key, by_code)
+        
+        tt = self.shared_table() if self.strategy == 'paranoid' else None
+        if tt is not None:
+            tt.new_search() # Only the owner ages the table, the worker attaches to it.
+        params = (self.piece_values, QS_MAX_DEPTH, AUTO_WIDTH)
+        t = time.perf_counter()
+        future = self.executor.submit(search_worker, data, key, params,
+                                      tt.name if tt is not None else None, self.strategy, self.max_depth, self.time_limit, preview.name)
+        
+        def finish(f):
+            try:
+                score, code, depth, nodes, qnodes = f.result()
+            except BaseException as e: # Includes cancellation at shutdown.
+                job.set_exception(e)
+                return
+            tile, oc = by_code.get(code, (None, None)) # No code without root outcomes.
+            result = self.last_result = SearchResult(oc, tile, score, depth, nodes, time.perf_counter() - t, qnodes)
+            if oc is None:
+                print(f'SearchBot {self.loyalty} has no moves.')
+            else:
+                print(f'SearchBot {self.loyalty}: depth {result.depth}, score {result.score:.2f}, {result.nodes} nodes in {result.seconds:.2f}s ({result.nps:.0f} nodes/s, in the background)')
+            job.set_result((tile, oc))
+        future.add_done_callback(finish)
+        return job
+    
+    def play_parallel(self, data: Optional[bytes] = None, key: Optional[int] = None,
+                      by_code: Optional[Dict[int, Tuple[Tile, MoveRecord]]] = None) -> Tuple[Optional[Tile], Optional[MoveRecord]]:
+        """
+        Searches in worker processes, either splitting the root outcomes (each worker keeps its own transposition table),
+        or with Lazy SMP (every worker searches the whole tree through one shared table, kept between decisions).
+        The position can be passed in (see start_play, which also starts the executor), else it is taken from the board.
+        """
+        if self.executor is None:
+            self.executor = make_executor(self.workers)
+        tt_size_mb = self.tt.nbytes / (1024 * 1024) if self.tt is not None else 0
+        if self.parallel == 'smp':
+            search = LazySMPSearch(self.board, self.loyalty, self.piece_values, self.max_depth, self.time_limit,
+                                   self.workers, self.shared_table(), executor=self.executor)
+        else:
+            search = ParallelSearch(self.board, self.loyalty, self.piece_values, self.max_depth, self.time_limit,
+                                    self.workers, self.strategy, tt_size_mb, executor=self.executor)
+        search.preview = self.preview
+        result = self.last_result = search.run(data, key, by_code)
+        print(f'SearchBot {self.loyalty}: depth {result.depth}, score {result.score:.2f}, {result.nodes} nodes in {result.seconds:.2f}s ({result.nps:.0f} nodes/s, {self.workers} workers)')
+        if self.parallel == 'smp':
+            print(f'\tnodes per worker {search.worker_nodes}, depths {search.worker_depths}')
+        
+        if result.outcome is None:
+            print(f'SearchBot {self.loyalty} has no moves.')
+        return result.tile, result.outcome
+    
+    def shared_table(self) -> SharedTranspositionTable:
+        """
+        Returns the shared table, created (as large as tt) on first use.
+        """
+        if self.shared_tt is None:
+            tt_size_mb = self.tt.nbytes / (1024 * 1024) if self.tt is not None else DEFAULT_SIZE_MB
+            self.shared_tt = SharedTranspositionTable(tt_size_mb)
+        return self.shared_tt
+    
+    def snapshot_moves(self) -> Dict[int, Tuple[Tile, MoveRecord]]:
+        """
+        Returns the {code: (tile, outcome)} map of the position about to be searched, and keeps it as preview_moves.
+        """
+        self.preview_moves = root_moves(self.board)
+        return self.preview_moves
+    
+    def preview_channel(self) -> PreviewChannel:
+        """
+        Returns the preview channel, created on first use (the UI polls it, see ChessUI.update_preview).
+        """
+        if self.preview is None:
+            self.preview = PreviewChannel()
+        return self.preview
+    
+    # # #
+    # Pondering
+    @property
+    def can_ponder(self) -> bool:
+        return self.strategy == 'paranoid'
+    
+    def ponder(self) -> None:
+        """
+        Starts searching the likely replies of the faction to move in a worker process (see engine/ponder.py).
+        Only the paranoid search stores its results in the table, so max-n bots don't ponder.
+        """
+        if not self.can_ponder: return
+        self.stop_pondering()
+        if self.executor is None:
+            self.executor = make_executor(self.workers)
+        tt = self.shared_table()
+        tt.new_search()
+        tt.ponder_job += 1
+        board = self.board
+        params = (self.piece_values, QS_MAX_DEPTH, AUTO_WIDTH)
+        self.ponder_future = self.executor.submit(ponder_worker, serialize_board(board), board.zobrist_key, params,
+                                                  tt.name, self.loyalty, self.max_depth, tt.ponder_job)
+        self.ponder_future.add_done_callback(self.pondered)
+    
+    def stop_pondering(self) -> None:
+        """
+        Stops the ponder job without waiting for it (its searches check the table's ponder job every few nodes).
+        A search submitted next may wait in the pool for its worker, but the game loop doesn't.
+        """
+        if self.ponder_future is None: return
+        self.shared_tt.ponder_job += 1
+        self.ponder_future = None
+    
+    def pondered(self, future: Future) -> None:
+        """
+        Reports a finished ponder job (called by the pool when the job ends).
+        """
+        if future.cancelled(): return
+        try:
+            print(f'SearchBot {self.loyalty}: pondered {future.result()} replies.')
+        except Exception as e:
+            print(f'SearchBot {self.loyalty}: pondering failed ({e}).')
+    
+    def ponder_hit(self, by_code: Dict[int, Tuple[Tile, MoveRecord]]) -> Optional[SearchResult]:
+        """
+        Returns the stored result of the current position if it was searched exactly to max_depth (e.g. while pondering).
+        The stored move is looked up in the root outcomes by code (see root_moves).
+        """
+        if self.shared_tt is None: return None
+        t = time.perf_counter()
+        entry = self.shared_tt.probe(self.board.zobrist_key)
+        if entry is None: return None
+        depth, bound, score, move = entry
+        if bound != BOUND_EXACT or depth < self.max_depth or move not in by_code: return None
+        tile, oc = by_code[move]
+        return SearchResult(oc, tile, score, depth, 0, time.perf_counter() - t)
+    #
+    # # #
+    
+    def shutdown(self) -> None:
+        """
+        Stops pondering and the worker processes of parallel searches, and frees the shared table and preview channel.
+        """
+        self.stop_pondering()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        if self.thinker is not None:
+            self.thinker.shutdown(wait=False, cancel_futures=True)
+            self.thinker = None
+        if self.shared_tt is not None:
+            self.shared_tt.close()
+            self.shared_tt = None
+        if self.preview is not None:
+            self.preview.close()
+            self.preview = None
@@ -1,5 +1,6 @@
 import pygame as pg
 import numpy as np
+from concurrent.futures import Future
 from typing import Optional, Union, Tuple, List, Dict
 
 from globalref import GlobalAccessObject
@@ -7,7 +8,7 @@ from globalref import GlobalAccessObject
 from chess.board import Board
 from chess.units.piece import ChessPiece
 from chess.tiles.tile import Tile
-from chess.actions.outcome import Outcome
+from chess.actions.outcome import MoveRecord
 
 from engine.bots.bot import Bot
 from engine.bots.random_bot import RandomBot
@@ -22,7 +23,10 @@ class GameManager(GlobalAccessObject):
     
     auto_turn_timer: int
     auto_tile: Optional[Tile]
-    auto_oc: Optional[Outcome]
+    auto_oc: Optional[MoveRecord]
+    ponder_key: Optional[int]  # Position the next bot is pondering (None if not pondering)
+    bot_job: Optional[Future]  # Bot decision in progress (see Bot.start_play)
+    thinking_frames: int  # Frames drawn while the bot job runs
     FRAME_CLOCK: pg.time.Clock = pg.time.Clock()
     
     bots: Dict[Loyalty, Bot]
@@ -32,7 +36,10 @@ class GameManager(GlobalAccessObject):
     def __init__(self, bots: Optional[Dict[Loyalty, Bot]] = None):
         self.auto_turn_timer: int = -1
         self.auto_tile: Optional[Tile] = None
-        self.auto_oc: Optional[Outcome] = None
+        self.auto_oc: Optional[MoveRecord] = None
+        self.ponder_key: Optional[int] = None
+        self.bot_job: Optional[Future] = None
+        self.thinking_frames: int = 0
         
         self.bots = self.init_bots(bots)
     
@@ -45,9 +52,12 @@ class GameManager(GlobalAccessObject):
         # Main game loop
         while self.ih.running:
             
-            # Handle bot turns
+            # Handle bot turns, the next bot ponders during player turns
             if not self.board.controlled_turn:
+                self.stop_pondering()
                 self.run_bot()
+            else:
+                self.ponder()
             
             # Handle user input
             self.ih.locked_board = not self.board.controlled_turn
@@ -57,18 +67,30 @@ class GameManager(GlobalAccessObject):
             # self.ui.update()? # TODO: Seperate assembling and drawing frame?
             self.ui.draw()
             self.wait()
+        
+        self.stop_pondering()
+        for bot in self.bots.values():
+            bot.shutdown()
     
     def run_bot(self): # TODO: Improve to use meaningful bots.
-        """ Allow bots to make moves. """
+        """ Allow bots to make moves, the frame loop keeps running while they think. """
         if not self.locked_board:
             # self.auto_tile, self.auto_oc = self.board.random_outcome()
-            self.auto_tile, self.auto_oc = self.bots[self.board.current_turn].play() # type: ignore
+            # Start thinking, then poll the job once per frame until the bot has decided.
+            if self.bot_job is None:
+                self.bot_job = self.bots[self.board.current_turn].start_play()
+                self.thinking_frames = 0
+            if not self.bot_job.done():
+                self.thinking_frames += 1
+                return
+            self.auto_tile, self.auto_oc = self.bot_job.result() # type: ignore
+            self.bot_job = None
             
-            # Show selected piece + outcomes
+            # Show selected piece + outcomes, frames spent thinking count towards THINKING_FRAMES
             if self.auto_oc is not None:
                 self.ui.s_piece = self.auto_oc.piece
                 self.ui.h_piece = self.auto_oc.piece
-                self.auto_turn_timer = self.THINKING_FRAMES + self.PREVIEW_FRAMES
+                self.auto_turn_timer = max(self.THINKING_FRAMES - self.thinking_frames, 0) + self.PREVIEW_FRAMES
             else:
                 self.auto_turn_timer = 0
 
@@ -83,6 +105,38 @@ class GameManager(GlobalAccessObject):
             self.ui.s_tile = None
 
 
+    def ponder(self):
+        """ Let the bot which moves after the player think while the player deliberates. """
+        key = self.board.zobrist_key
+        if key == self.ponder_key: return # Already pondering this position.
+        self.stop_pondering()
+        self.ponder_key = key
+        bot = self.next_bot()
+        if bot is not None:
+            bot.ponder()
+    
+    def stop_pondering(self):
+        if self.ponder_key is None: return
+        for bot in self.bots.values():
+            bot.stop_pondering()
+        self.ponder_key = None
+    
+    def next_bot(self) -> Optional[Bot]:
+        """
+        Return the first bot after the current turn which can ponder (skipping factions without pieces,
+        and bots which can't, e.g. the AUTO faction moving before it), or None if a player moves first.
+        """
+        board = self.board
+        order = board.turn_order
+        i = order.index(board.current_turn)
+        for loyalty in order[i + 1:] + order[:i]:
+            if not board.loyal_pieces(loyalty): continue
+            if loyalty in board.controlled_factions: return None
+            bot = self.bots.get(loyalty)
+            if bot is not None and bot.can_ponder:
+                return bot
+        return None
+    
     def init_bots(self, bots: Optional[Dict[Loyalty, Bot]] = None) -> Dict[Loyalty, Bot]:
         """
         Initialize the bots for the game.
@@ -0,0 +1,192 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Dict, List, Tuple
+
+from utils.chess_types import Loyalty, PieceType
+from chess.actions.outcome import MoveRecord
+
+from engine.search import Search, SearchResult, QS_MAX_DEPTH, AUTO_WIDTH
+from engine.multi_search import SEARCH_STRATEGIES
+from engine.transposition import SharedTranspositionTable, encode_move, NO_MOVE, DEFAULT_SIZE_MB
+from engine.preview import PreviewChannel
+from engine.parallel_search import default_workers, make_executor, serialize_board, deserialize_board, root_moves
+
+
+# LAZY SMP:
+#   Every worker process runs its own iterative deepening search of the same position,
+#   and they all share one transposition table in shared memory (see SharedTranspositionTable).
+#   Workers don't split the tree, they share it through the table: an entry stored by one worker
+#   gives the others cutoffs and best moves, so together they search deeper than one would.
+#
+#   Workers are staggered so they don't walk the tree in lockstep:
+#       odd workers start at depth 2 (one iteration ahead of the even ones),
+#       every worker but the first searches the root outcomes after the best one in a rotated order.
+#   Worker 0 is the main search, when it finishes (maximum depth or deadline) the table's stop flag ends the others.
+#   The result of the deepest completed iteration is played, ties go to the lowest worker.
+#
+#   Unlike the root split (engine/parallel_search.py), this also scales on narrow positions with few root outcomes.
+#   Max-n scores can't be stored in the table, so Lazy SMP always runs the paranoid search.
+
+
+# # #
+# Worker process
+_smp: Dict[str, object] = {}    # Attached table and preview channel, rebuilt board (per position)
+
+
+def smp_setup(data: bytes, key: int, tt_name: Optional[str]) -> Tuple[object, Optional[SharedTranspositionTable]]:
+    """
+    Returns the worker's board for a position (rebuilt if the position changed) and the attached shared table.
+    """
+    tt = _smp.get('tt')
+    if tt_name is not None and (tt is None or tt.name != tt_name):
+        if tt is not None: tt.close()
+        tt = _smp['tt'] = SharedTranspositionTable(name=tt_name)
+    if _smp.get('key') != key:
+        _smp.update(key=key, board=deserialize_board(data))
+    return _smp['board'], tt if tt_name is not None else None
+
+
+def smp_preview(name: Optional[str]) -> Optional[PreviewChannel]:
+    """
+    Returns the worker's attachment to a preview channel (None without one).
+    """
+    if name is None: return None
+    preview = _smp.get('preview')
+    if preview is None or preview.name != name:
+        if preview is not None: preview.close()
+        preview = _smp['preview'] = PreviewChannel(name)
+    return preview
+
+
+def search_worker(data: bytes, key: int, params: Tuple, tt_name: Optional[str], strategy: str,
+                  max_depth: int, time_limit: Optional[float], preview_name: Optional[str] = None) -> Tuple[float, int, int, int, int]:
+    """
+    Runs one search of a position through the shared table (a bot thinking without blocking the game),
+    publishing its best line to a preview channel.
+    Returns (score, best code, completed depth, nodes, quiescence nodes).
+    """
+    board, tt = smp_setup(data, key, tt_name)
+    piece_values, qs_depth, auto_width = params
+    search = SEARCH_STRATEGIES[strategy](board, board.current_turn, piece_values, max_depth, time_limit, tt,
+                                         qs_depth=qs_depth, auto_width=auto_width)
+    search.preview = smp_preview(preview_name)
+    r = search.run()
+    code = encode_move(board, r.outcome) if r.outcome is not None else NO_MOVE
+    return r.score, code, r.depth, r.nodes, r.qnodes
+
+
+def smp_worker(data: bytes, key: int, params: Tuple, tt_name: str, index: int, max_depth: int,
+               deadline: Optional[float], preview_name: Optional[str] = None) -> Tuple[float, int, int, int, int]:
+    """
+    Searches a position with the shared table as worker index (the main worker publishes to the preview channel).
+    Returns (score, best code, completed depth, nodes, quiescence nodes).
+    """
+    board, tt = smp_setup(data, key, tt_name)
+    
+    piece_values, qs_depth, auto_width = params
+    time_limit = max(0.0, deadline - time.time()) if deadline is not None else None
+    search = Search(board, board.current_turn, piece_values, max_depth, time_limit, tt, qs_depth=qs_depth, auto_width=auto_width)
+    search.abort = lambda: tt.stopped
+    search.preview = smp_preview(preview_name)
+    tt.reset_stats()
+    r = search.run(first_depth=1 + index % 2, skew=index)
+    code = encode_move(board, r.outcome) if r.outcome is not None else NO_MOVE
+    return r.score, code, r.depth, r.nodes, r.qnodes
+#
+# # #
+
+
+class LazySMPSearch:
+    """
+    Lazy SMP search, worker processes searching one position through a shared transposition table.
+    """
+    
+    board: object
+    loyalty: Loyalty
+    piece_values: Dict[PieceType, float]
+    max_depth: int
+    time_limit: Optional[float]     # Seconds per decision, None for no limit
+    workers: int
+    qs_depth: int
+    auto_width: int
+    tt: SharedTranspositionTable    # Kept between searches if passed in
+    executor: ProcessPoolExecutor
+    preview: Optional[PreviewChannel]   # Receives the main worker's best line
+    
+    nodes: int
+    qnodes: int
+    worker_nodes: List[int]         # Nodes searched by each worker in the last search
+    worker_depths: List[int]        # Depth completed by each worker in the last search
+    
+    def __init__(self,
+                 board: object,
+                 loyalty: Loyalty,
+                 piece_values: Dict[PieceType, float],
+                 max_depth: int = 4,
+                 time_limit: Optional[float] = 2.0,
+                 workers: Optional[int] = None,
+                 tt: Optional[SharedTranspositionTable] = None,
+                 tt_size_mb: float = DEFAULT_SIZE_MB,
+                 qs_depth: int = QS_MAX_DEPTH,
+                 auto_width: int = AUTO_WIDTH,
+                 executor: Optional[ProcessPoolExecutor] = None):
+        self.board = board
+        self.loyalty = loyalty
+        self.piece_values = piece_values
+        self.max_depth = max_depth
+        self.time_limit = time_limit
+        self.workers = workers if workers is not None else default_workers()
+        self.qs_depth = qs_depth
+        self.auto_width = auto_width
+        self.tt = tt if tt is not None else SharedTranspositionTable(tt_size_mb)
+        self.executor = executor if executor is not None else make_executor(self.workers)
+        self.nodes = 0
+        self.qnodes = 0
+        self.worker_nodes = []
+        self.worker_depths = []
+        self.preview = None
+    
+    def run(self, data: Optional[bytes] = None, key: Optional[int] = None,
+            by_code: Optional[Dict[int, Tuple[object, MoveRecord]]] = None) -> SearchResult:
+        """
+        Searches with every worker until worker 0 reaches the maximum depth or the deadline.
+        The position (serialize_board data, zobrist key and root_moves) can be passed in,
+        so the board isn't touched (e.g. from a background thread).
+        """
+        tt = self.tt
+        t = time.perf_counter()
+        deadline = time.time() + self.time_limit if self.time_limit is not None else None
+        
+        if data is None:
+            board = self.board
+            data, key, by_code = serialize_board(board), board.zobrist_key, root_moves(board)
+        
+        tt.new_search()
+        tt.stopped = False
+        params = (self.piece_values, self.qs_depth, self.auto_width)
+        job = (data, key, params, tt.name)
+        preview_name = self.preview.name if self.preview is not None else None
+        futures = [self.executor.submit(smp_worker, *job, i, self.max_depth, deadline, preview_name if i == 0 else None)
+                   for i in range(self.workers)]
+        try:
+            results = [futures[0].result()]
+        finally:
+            tt.stopped = True # The main search is done, stop the helpers.
+        results += [f.result() for f in futures[1:]]
+        
+        self.worker_nodes = [r[3] for r in results]
+        self.worker_depths = [r[2] for r in results]
+        self.nodes = sum(self.worker_nodes)
+        self.qnodes = sum(r[4] for r in results)
+        
+        best = max(range(len(results)), key=lambda i: (results[i][2], results[i][1] in by_code, -i))
+        score, code, depth, _nodes, _qnodes = results[best]
+        tile, oc = by_code.get(code, (None, None)) # No code without root outcomes.
+        return SearchResult(oc, tile, score, depth, self.nodes, time.perf_counter() - t, self.qnodes)
+    
+    def shutdown(self) -> None:
+        """
+        Stops the worker processes and frees the shared table.
+        """
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.tt.close()
@@ -0,0 +1,125 @@
+from typing import Optional, Dict, List, Set
+
+from utils.chess_types import Loyalty
+from chess.units.piece import ChessPiece
+from chess.tiles.tile import Tile
+from chess.actions.outcome import MoveRecord, OutcomeKind
+
+
+# LEGALITY FILTER:
+#   An outcome is illegal if it leaves a leader of the moving faction capturable by another faction.
+#
+#   Most outcomes are cleared statically:
+#       Pieces only go stale when a square they read changes (see Board.refresh_outcomes),
+#       so only opponents which read a square the outcome changes can gain a new attack.
+#       Of those, an attack on a (stationary) leader can only open along a pin ray:
+#       the changed square lies between the opponent and the leader on one of the 8 directions.
+#
+#   Everything else (leader moves, checks, foreign summons, volatile opponents) is verified
+#   exactly by applying the outcome and undoing it.
+
+
+def changed_squares(board, outcome: MoveRecord) -> Set[int]:
+    """
+    Returns the squares an outcome writes to (moved piece origins and targets, captured pieces, summons).
+    """
+    geometry = board.geometry
+    squares = set()
+    for p, target in outcome.movements():
+        squares.add(p._tile.index)
+        squares.add(geometry.square(target))
+    for p in outcome.captured:
+        squares.add(p._tile.index)
+    if outcome.kind == OutcomeKind.SUMMON:
+        squares.add(geometry.square(outcome.target))
+    squares.discard(-1)
+    return squares
+
+
+def is_exposed(board, loyalty: Loyalty) -> bool:
+    """
+    Returns True if any other faction can capture a leader of the given faction.
+    """
+    threats = [f for f in Loyalty if f != loyalty]
+    return any(board.is_attacked(l._tile.index, f) for l in board.loyal_leaders(loyalty) for f in threats)
+
+
+def verify_outcome(board, outcome: MoveRecord, loyalty: Loyalty) -> bool:
+    """
+    Exact legality check, applies the outcome and tests if a leader can be captured afterwards.
+    """
+    record = outcome.apply()
+    try:
+        return not is_exposed(board, loyalty)
+    finally:
+        board.undo(record)
+
+
+def opens_pin_ray(board, watcher: ChessPiece, squares: Set[int], leader_squares: Set[int]) -> bool:
+    """
+    Returns True if a changed square could open a line from the watcher to a leader.
+    Changed squares which are not on a line from the watcher (jump targets, chained reads) always count.
+    """
+    geometry = board.geometry
+    wx, wy = geometry.positions[watcher._tile.index]
+    for sq in squares:
+        x, y = geometry.positions[sq]
+        dx, dy = x - wx, y - wy
+        if not (dx == 0 or dy == 0 or abs(dx) == abs(dy)):
+            return True
+        d = ((dx > 0) - (dx < 0), (dy > 0) - (dy < 0))
+        if not leader_squares.isdisjoint(geometry.ray(sq, d)):
+            return True
+    return False
+
+
+def legal_outcomes(board, loyalty: Optional[Loyalty] = None) -> Dict[ChessPiece, Dict[Tile, MoveRecord]]:
+    """
+    Returns the outcomes of each piece of the given faction (defaults to current faction)
+    which do not leave one of its leaders capturable.
+    """
+    if loyalty is None: loyalty = board.current_turn
+    pieces = board.loyal_pieces(loyalty)
+    leaders = board.loyal_leaders(loyalty)
+    if not leaders:
+        return {p: dict(p.outcomes) for p in pieces}
+    
+    leader_squares = {l._tile.index for l in leaders}
+    watchers = board.disloyal_pieces(loyalty)
+    board.generate_attacks({w.loyalty for w in watchers}) # Watcher reads are only known once they are generated.
+    hazards = set(board.hazard_squares) # Hazard tiles can change any square they hold during the update.
+    
+    # Checks and opponents which change while updating (e.g. zombies turning, sentry jump timers)
+    #   can't be cleared statically.
+    verify_all = (is_exposed(board, loyalty)
+                  or any(w._reads is None or getattr(w, 'jump_timer', 0) > 0 for w in watchers))
+    
+    legal = {}
+    for p in pieces:
+        safe = {}
+        for t, oc in p.outcomes.items():
+            if verify_all or needs_verify(board, oc, loyalty, watchers, leader_squares, hazards):
+                if not verify_outcome(board, oc, loyalty): continue
+            safe[t] = oc
+        legal[p] = safe
+    return legal
+
+
+def needs_verify(board, outcome: MoveRecord, loyalty: Loyalty,
+                 watchers: List[ChessPiece], leader_squares: Set[int], hazards: Set[int]) -> bool:
+    """
+    Returns True if an outcome can't be cleared statically.
+    """
+    if outcome.kind == OutcomeKind.SUMMON and outcome.summon_loyalty != loyalty:
+        return True
+    if any(p.is_leader for p, _ in outcome.movements()):
+        return True
+    
+    squares = changed_squares(board, outcome) | hazards
+    for w in watchers:
+        if w._tile.index in squares:
+            continue # Captured (or swapped out) watchers only lose attacks.
+        touched = squares.intersection(w._reads)
+        if touched and opens_pin_ray(board, w, touched, leader_squares):
+            return True
+    return False
@@ -0,0 +1,121 @@
+from typing import Dict, List
+
+from utils.chess_types import PieceType
+from chess.actions.outcome import MoveRecord, OutcomeKind
+
+from engine.transposition import encode_move, target_square, NO_MOVE
+
+
+# MOVE ORDERING:
+#   Ranks outcomes so a tree search tries the likely best first (and cuts off sooner):
+#       1. The stored best move (transposition table).
+#       2. Captures by MVV-LVA, most valuable victims first, then cheapest attacker.
+#       3. Castle and Summon outcomes.
+#       4. Killer moves, quiet outcomes which caused a cutoff at the same ply.
+#       5. Other quiet outcomes, by butterfly history (piece type x target square).
+#   Friendly captured pieces (e.g. a Berserker's own death) count against the victims,
+#   captures which lose material are ordered with the quiet outcomes.
+
+
+TT_SCORE: float = 1e9
+CAPTURE_SCORE: float = 1e6
+SPECIAL_SCORE: float = 5e5
+KILLER_SCORE: float = 4e5
+HISTORY_MAX: float = 3e5        # History is halved when an entry reaches this (stays below killers).
+
+N_KILLERS: int = 2
+MAX_PLY: int = 64
+
+
+class MoveOrdering:
+    """
+    Orders outcomes with MVV-LVA, killer slots and a history table, updated by search cutoffs.
+    """
+    
+    board: object
+    piece_values: Dict[PieceType, float]
+    killers: List[List[int]]        # Ply -> move codes (most recent first)
+    history: List[List[float]]      # PieceType value -> target square -> cutoff score
+    
+    def __init__(self, board: object, piece_values: Dict[PieceType, float]):
+        self.board = board
+        self.piece_values = piece_values
+        self.killers = [[NO_MOVE] * N_KILLERS for _ in range(MAX_PLY)]
+        self.history = [[0.0] * (board.width * board.height) for _ in PieceType]
+    
+    def new_search(self) -> None:
+        """
+        Clears the killers and ages the history (positions change between searches).
+        """
+        for k in self.killers:
+            k[:] = [NO_MOVE] * N_KILLERS
+        self.age_history()
+    
+    def age_history(self) -> None:
+        for row in self.history:
+            row[:] = [h / 2 for h in row]
+    
+    def capture_gain(self, oc: MoveRecord) -> float:
+        """
+        Value of the pieces an outcome captures, friendly victims count against it.
+        """
+        values = self.piece_values
+        loyalty = oc.piece.loyalty
+        return sum(values.get(p.piece_type, 0.0) * (-1 if p.loyalty == loyalty else 1) for p in oc.captured)
+    
+    def mvv_lva(self, oc: MoveRecord) -> float:
+        """
+        Victim value (x10) less attacker value.
+        """
+        return 10 * self.capture_gain(oc) - self.piece_values.get(oc.piece.piece_type, 0.0)
+    
+    def score(self, oc: MoveRecord, code: int, killers: List[int]) -> float:
+        if oc.captured:
+            value = self.mvv_lva(oc)
+            if value > 0: return CAPTURE_SCORE + value
+            return value
+        if oc.kind == OutcomeKind.CASTLE or oc.kind == OutcomeKind.SUMMON:
+            return SPECIAL_SCORE
+        if code in killers:
+            return KILLER_SCORE - killers.index(code)
+        sq = target_square(self.board, oc)
+        return self.history[oc.piece.piece_type.value][sq] if sq >= 0 else 0.0
+    
+    def scores(self, outcomes: List[MoveRecord], ply: int, tt_move: int = NO_MOVE) -> List[float]:
+        """
+        Returns the ordering score of each outcome (higher is searched first).
+        """
+        board = self.board
+        killers = self.killers[ply] if ply < MAX_PLY else ()
+        scores = []
+        for oc in outcomes:
+            code = encode_move(board, oc)
+            scores.append(TT_SCORE if code == tt_move else self.score(oc, code, killers))
+        return scores
+    
+    def order(self, outcomes: List[MoveRecord], ply: int, tt_move: int = NO_MOVE) -> List[MoveRecord]:
+        """
+        Returns the outcomes sorted best first (ties keep their generation order).
+        """
+        scores = self.scores(outcomes, ply, tt_move)
+        return [outcomes[i] for i in sorted(range(len(outcomes)), key=scores.__getitem__, reverse=True)]
+    
+    def cutoff(self, oc: MoveRecord, ply: int, depth: int) -> None:
+        """
+        Records a quiet outcome which caused a beta cutoff (killer slot and history).
+        """
+        if oc.captured: return
+        board = self.board
+        if ply < MAX_PLY:
+            code = encode_move(board, oc)
+            killers = self.killers[ply]
+            if killers[0] != code:
+                killers.insert(0, code)
+                killers.pop()
+        
+        sq = target_square(board, oc)
+        if sq < 0: return
+        row = self.history[oc.piece.piece_type.value]
+        row[sq] += depth * depth
+        if row[sq] >= HISTORY_MAX:
+            self.age_history()
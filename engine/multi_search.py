@@ -0,0 +1,161 @@
+from typing import Optional, Dict, List, Tuple
+
+from utils.chess_types import Loyalty, PieceType
+from chess.actions.outcome import MoveRecord
+
+from engine.search import Search, INF, LEADERSHIP_VALUE, team
+
+
+# MULTI-FACTION SEARCH:
+#   Search strategies for turn orders with more than two teams (see engine/search.py for teams).
+#       paranoid : every other team minimizes the searching team's score (Search, alpha-beta pruning).
+#       maxn     : every team maximizes its own component of a score vector (MaxNSearch).
+#
+#   Max-n scores are material shares: each team's material (and leadership) over the total, summing to MAX_SUM.
+#   Because the sum is bounded, max-n can prune:
+#       immediate : a team which reaches MAX_SUM can't do better, its remaining outcomes are skipped.
+#       shallow   : if the team to move already guarantees itself s, a child where another team reaches
+#                   MAX_SUM - s leaves at most s for the parent, so the child's remaining outcomes are skipped.
+#   Consecutive moves by one team (auto turns, ambushes) pass their parent's bound through unchanged.
+#   Leaves are extended through winning captures (each team may stand pat), up to qs_depth plies.
+#   Shallow pruning can't prune as deep as alpha-beta, so captures which don't gain material are skipped.
+#   Scores are not stored in the transposition table (they are vectors), so max-n runs without one.
+
+
+MAX_SUM: float = 1.0
+
+
+class MaxNSearch(Search):
+    """
+    Max-n search with immediate and shallow pruning, over the teams of the turn order.
+    Scores are the searching team's share of the material (0 to MAX_SUM).
+    """
+    
+    _players: Dict[int, int]    # Team -> score vector index
+    
+    def __init__(self,
+                 board: object,
+                 loyalty: Loyalty,
+                 piece_values: Dict[PieceType, float],
+                 max_depth: int = 4,
+                 time_limit: Optional[float] = 2.0,
+                 tt: Optional[object] = None,
+                 *args, **kwargs):
+        super().__init__(board, loyalty, piece_values, max_depth, time_limit, None, *args, **kwargs)
+        self._players = {t: i for i, t in enumerate(sorted({team(l) for l in Loyalty}))}
+    
+    # # #
+    # Evaluation
+    def evaluate_vector(self) -> List[float]:
+        """
+        Each team's share of the material and leadership.
+        """
+        board = self.board
+        values = self.piece_values
+        players = self._players
+        material = [0.0] * len(players)
+        for p in board.pieces:
+            material[players[team(p.loyalty)]] += values.get(p.piece_type, 0.0)
+        for l, pts in board.leadership_pts.items():
+            material[players[team(l)]] += LEADERSHIP_VALUE * pts
+        total = sum(material)
+        if total <= 0: return material
+        return [m * MAX_SUM / total for m in material]
+    
+    def evaluate(self) -> float:
+        return self.evaluate_vector()[self._players[self._team]]
+    
+    def game_over_vector(self) -> Optional[List[float]]:
+        """
+        Returns the score vector if the searching team lost its leaders, or if a single contender is left.
+        Contenders are the searching team and the teams which had leaders when the search started.
+        """
+        if not self._teams: return None
+        remaining = self.leader_teams()
+        alive = [t for t in set(self._teams) | {self._team} if t in remaining or t not in self._teams]
+        if self._team not in alive:
+            v = self.evaluate_vector()
+            v[self._players[self._team]] = 0.0
+            return v
+        if len(alive) == 1:
+            v = [0.0] * len(self._players)
+            v[self._players[alive[0]]] = MAX_SUM
+            return v
+        return None
+    #
+    # # #
+    
+    # # #
+    # Search
+    def maxn(self, depth: int, bound: float) -> List[float]:
+        """
+        Returns the score vector of the current position.
+        The team to move stops searching once its score reaches bound (its parent won't choose this node).
+        """
+        self.tick()
+        board = self.board
+        over = self.game_over_vector()
+        if over is not None:
+            return over
+        
+        i = self._players[team(board.current_turn)]
+        quiet = depth <= 0
+        if quiet:
+            self.qnodes += 1
+            best = self.evaluate_vector() # Stand pat.
+            if best[i] >= bound or depth <= -self.qs_depth:
+                return best
+            ordering = self.ordering
+            outcomes = [oc for p in board.loyal_pieces() for oc in p.capture_outcomes.values() if ordering.capture_gain(oc) > 0]
+            outcomes = ordering.order(outcomes, self.ply)
+        else:
+            best = None
+            outcomes = self.node_outcomes()
+            if not outcomes:
+                return self.evaluate_vector()
+        
+        for oc in outcomes:
+            v = self.child_vector(oc, i, depth - 1, bound, best[i] if best is not None else 0.0)
+            if best is None or v[i] > best[i]:
+                best = v
+                if best[i] >= bound:
+                    if not quiet:
+                        self.ordering.cutoff(oc, self.ply, depth)
+                    break
+        return best
+    
+    def child_vector(self, oc: MoveRecord, i: int, depth: int, bound: float, best: float) -> List[float]:
+        """
+        Applies an outcome and returns its score vector.
+        The child inherits the bound if the same team moves again, otherwise it gets the shallow pruning bound.
+        """
+        board = self.board
+        record = board.apply(oc)
+        self.ply += 1
+        try:
+            j = self._players[team(board.current_turn)]
+            return self.maxn(depth, bound if j == i else MAX_SUM - best)
+        finally:
+            self.ply -= 1
+            board.undo(record)
+    
+    def search_root(self, moves: List[Tuple[object, MoveRecord]], depth: int, alpha: float = -INF, beta: float = INF) -> Tuple[float, int]:
+        """
+        Searches root outcomes, returns the best score for the searching team and its index (the window is unused).
+        """
+        i = self._players[self._team]
+        best, best_i = -INF, 0
+        for k, (t, oc) in enumerate(moves):
+            v = self.child_vector(oc, i, depth - 1, INF, max(best, 0.0))
+            if v[i] > best:
+                best, best_i = v[i], k
+                if best >= MAX_SUM: break # Immediate pruning, nothing beats a win.
+        return best, best_i
+    #
+    # # #
+
+
+SEARCH_STRATEGIES: Dict[str, type] = {
+    'paranoid': Search,
+    'maxn': MaxNSearch,
+}
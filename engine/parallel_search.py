@@ -0,0 +1,254 @@
+import os
+import time
+import pickle
+from multiprocessing import resource_tracker
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Dict, List, Tuple
+
+from globalref import OBJREF
+from utils.chess_types import Loyalty, PieceType
+from chess.actions.outcome import MoveRecord
+
+from engine.search import Search, SearchResult, SearchTimeout, INF, QS_MAX_DEPTH, AUTO_WIDTH, is_mate
+from engine.multi_search import SEARCH_STRATEGIES
+from engine.transposition import TranspositionTable, encode_move, NO_MOVE, DEFAULT_SIZE_MB
+from engine.preview import PreviewChannel
+
+
+# PARALLEL SEARCH:
+#   Splits the root outcomes of a search across a process pool.
+#   Workers never receive the live Board (its Tile/Piece graph and action callbacks don't pickle),
+#   they rebuild it from the serialized Board.get_state() planes (a few KB), and keep it until the position changes.
+#   Each worker also keeps its own transposition table between searches.
+#
+#   Every iteration of iterative deepening:
+#       the ordered root outcomes are dealt round-robin into one chunk per worker (so each gets some of the best ones),
+#       every chunk is searched within an aspiration window around the previous score,
+#       if the best result falls outside the window, every chunk is searched again with a full window.
+#   Workers stop at the per-move deadline, and an unfinished iteration is discarded.
+#
+#   Outcomes are matched between processes by encode_move codes, a worker generates and orders the root outcomes,
+#   and the best code is looked up in the outcomes the board already has (see root_moves).
+
+
+ASPIRATION_WINDOW: float = 0.5      # Half width of the aspiration window (in pawns).
+
+
+def default_workers() -> int:
+    return max(1, os.cpu_count() or 1)
+
+
+def make_executor(workers: int) -> ProcessPoolExecutor:
+    """
+    Returns a process pool for search workers, with the platform's default start method
+    (forking a process which initialized SDL isn't safe on macOS, and main.py only starts the game as __main__).
+    The workers are started at once, so call this from the main thread (not from a thread waiting on a search).
+    """
+    resource_tracker.ensure_running() # Workers share it, so shared memory they attach to isn't reported as leaked.
+    executor = ProcessPoolExecutor(max_workers=workers)
+    executor.submit(os.getpid) # Forking pools start every worker on the first submit.
+    return executor
+
+
+def serialize_board(board) -> bytes:
+    """
+    Compact picklable state of a board (see Board.get_state).
+    """
+    return pickle.dumps((board.get_state(), board.controlled_factions), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def deserialize_board(data: bytes) -> object:
+    """
+    Rebuilds a board from serialize_board data, and makes it the global board of this process.
+    """
+    from chess.board import Board
+    state, controlled_factions = pickle.loads(data)
+    board = Board(state, controlled_factions=controlled_factions)
+    OBJREF.BOARD = board
+    board.update()
+    return board
+
+
+def root_moves(board) -> Dict[int, Tuple[object, MoveRecord]]:
+    """
+    {code: (tile, outcome)} of the faction to move, from the outcomes the board already generated.
+    Best codes found by workers are looked up here, so nothing touches the board while they search.
+    """
+    return {encode_move(board, oc): (tile, oc) for p in board.loyal_pieces() for tile, oc in p.outcomes.items()}
+
+
+# # #
+# Worker process
+_worker: Dict[str, object] = {}     # Rebuilt board, its search and root outcomes (per position and parameters)
+
+
+def worker_setup(data: bytes, key: Tuple, params: Tuple) -> Search:
+    """
+    Returns the worker's search for a position, rebuilding the board if the position changed.
+    """
+    if _worker.get('key') == key:
+        return _worker['search']
+    
+    strategy, piece_values, tt_size_mb, qs_depth, auto_width = params
+    tt = _worker.get('tt', None)
+    if tt_size_mb > 0 and (tt is None or _worker.get('tt_size_mb') != tt_size_mb):
+        tt = TranspositionTable(tt_size_mb)
+    
+    board = deserialize_board(data)
+    search = SEARCH_STRATEGIES[strategy](board, board.current_turn, piece_values, 1, None,
+                                         tt if tt_size_mb > 0 else None, qs_depth=qs_depth, auto_width=auto_width)
+    search.start()
+    _worker.update(key=key, search=search, tt=tt, tt_size_mb=tt_size_mb,
+                   moves={encode_move(board, oc): (t, oc) for t, oc in search.root_outcomes()})
+    return search
+
+
+def worker_codes(data: bytes, key: Tuple, params: Tuple) -> Tuple[List[int], float]:
+    """
+    Returns the ordered root codes of a position (best first) and its static evaluation.
+    """
+    search = worker_setup(data, key, params)
+    board = search.board
+    return [encode_move(board, oc) for _t, oc in search.ordered_root_outcomes()], search.evaluate()
+
+
+def worker_search(data: bytes, key: Tuple, params: Tuple, codes: List[int],
+                  depth: int, alpha: float, beta: float, deadline: Optional[float]) -> Tuple[float, int, int, int, bool]:
+    """
+    Searches some root outcomes of a position (by code) within a window.
+    Returns (score, best code, nodes, quiescence nodes, completed).
+    """
+    search = worker_setup(data, key, params)
+    search.nodes = 0
+    search.qnodes = 0
+    search.ply = 0
+    search.deadline = time.perf_counter() + (deadline - time.time()) if deadline is not None else INF
+    
+    moves = _worker['moves']
+    try:
+        score, i = search.search_root([moves[c] for c in codes], depth, alpha, beta)
+    except SearchTimeout:
+        return -INF, NO_MOVE, search.nodes, search.qnodes, False
+    return score, codes[i], search.nodes, search.qnodes, True
+#
+# # #
+
+
+class ParallelSearch:
+    """
+    Root-splitting parallel search, with the same result as Search.run.
+    """
+    
+    board: object
+    loyalty: Loyalty
+    piece_values: Dict[PieceType, float]
+    max_depth: int
+    time_limit: Optional[float]     # Seconds per decision, None for no limit
+    workers: int
+    strategy: str
+    tt_size_mb: float               # Per worker
+    qs_depth: int
+    auto_width: int
+    executor: ProcessPoolExecutor
+    preview: Optional[PreviewChannel]   # Receives the best root outcome after every completed iteration
+    
+    nodes: int
+    qnodes: int
+    
+    def __init__(self,
+                 board: object,
+                 loyalty: Loyalty,
+                 piece_values: Dict[PieceType, float],
+                 max_depth: int = 4,
+                 time_limit: Optional[float] = 2.0,
+                 workers: Optional[int] = None,
+                 strategy: str = 'paranoid',
+                 tt_size_mb: float = DEFAULT_SIZE_MB,
+                 qs_depth: int = QS_MAX_DEPTH,
+                 auto_width: int = AUTO_WIDTH,
+                 executor: Optional[ProcessPoolExecutor] = None):
+        if strategy not in SEARCH_STRATEGIES:
+            raise ValueError(f"ParallelSearch: Unknown search strategy {strategy}, expected one of {tuple(SEARCH_STRATEGIES)}.")
+        self.board = board
+        self.loyalty = loyalty
+        self.piece_values = piece_values
+        self.max_depth = max_depth
+        self.time_limit = time_limit
+        self.workers = workers if workers is not None else default_workers()
+        self.strategy = strategy
+        self.tt_size_mb = tt_size_mb
+        self.qs_depth = qs_depth
+        self.auto_width = auto_width
+        self.executor = executor if executor is not None else make_executor(self.workers)
+        self.nodes = 0
+        self.qnodes = 0
+        self.preview = None
+    
+    def search_chunks(self, chunks: List[List[int]], depth: int, alpha: float, beta: float,
+                      job: Tuple, deadline: Optional[float]) -> Optional[List[Tuple[float, int]]]:
+        """
+        Searches every chunk of root codes in the pool, returns (score, best code) per chunk or None on timeout.
+        """
+        futures = [self.executor.submit(worker_search, *job, chunk, depth, alpha, beta, deadline) for chunk in chunks]
+        results = []
+        completed = True
+        for f in futures:
+            score, code, nodes, qnodes, done = f.result()
+            self.nodes += nodes
+            self.qnodes += qnodes
+            completed &= done
+            results.append((score, code))
+        return results if completed else None
+    
+    def run(self, data: Optional[bytes] = None, key: Optional[int] = None,
+            by_code: Optional[Dict[int, Tuple[object, MoveRecord]]] = None) -> SearchResult:
+        """
+        Iteratively deepens in parallel until the maximum depth or the deadline.
+        The position (serialize_board data, zobrist key and root_moves) can be passed in,
+        so the board isn't touched (e.g. from a background thread). A worker generates and orders the root outcomes.
+        """
+        t = time.perf_counter()
+        deadline = time.time() + self.time_limit if self.time_limit is not None else None
+        self.nodes = 0
+        self.qnodes = 0
+        
+        if data is None:
+            board = self.board
+            data, key, by_code = serialize_board(board), board.zobrist_key, root_moves(board)
+        params = (self.strategy, self.piece_values, self.tt_size_mb, self.qs_depth, self.auto_width)
+        job = (data, (key, params), params)
+        codes, evaluation = self.executor.submit(worker_codes, *job).result()
+        codes = [c for c in codes if c in by_code]
+        if not codes:
+            return SearchResult(None, None, evaluation, 0, 0, time.perf_counter() - t)
+        n = min(self.workers, len(codes))
+        aspiration = self.strategy == 'paranoid'
+        
+        best_code, best_score, completed = codes[0], -INF, 0
+        for depth in range(1, self.max_depth + 1):
+            chunks = [codes[i::n] for i in range(n)]
+            alpha, beta = -INF, INF
+            if aspiration and completed and not is_mate(best_score):
+                alpha, beta = best_score - ASPIRATION_WINDOW, best_score + ASPIRATION_WINDOW
+            
+            results = self.search_chunks(chunks, depth, alpha, beta, job, deadline)
+            if results is not None:
+                score = max(r[0] for r in results)
+                if score <= alpha or score >= beta: # Aspiration failed, search again with a full window.
+                    results = self.search_chunks(chunks, depth, -INF, INF, job, deadline)
+            if results is None: break
+            
+            # Best score wins, ties go to the outcome ordered first.
+            score, code = max(results, key=lambda r: (r[0], -codes.index(r[1])))
+            best_score, best_code, completed = score, code, depth
+            if self.preview is not None:
+                self.preview.publish(key, depth, score, (code,))
+            codes.remove(code)
+            codes.insert(0, code) # Search the best outcome first in the next iteration.
+            if len(codes) == 1 or is_mate(score): break
+        
+        tile, oc = by_code[best_code]
+        return SearchResult(oc, tile, best_score, completed, self.nodes, time.perf_counter() - t, self.qnodes)
+    
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
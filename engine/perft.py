@@ -0,0 +1,129 @@
+import os
+import sys
+import json
+import time
+import argparse
+from typing import Optional, Dict, List
+
+from globalref import OBJREF
+
+
+# PERFT:
+#   Counts every outcome reachable in N plies (following the full turn order, including auto factions).
+#   Leaf outcomes are tallied by type, so rule changes show up as a count mismatch.
+#   Positions are walked with Board.apply/undo, no copies are made.
+#
+#   Run from the repository root:
+#       python -m engine.perft standard zombie --depth 3
+#       python -m engine.perft --check        (compare with stored reference counts)
+#       python -m engine.perft --update       (store current counts as the reference)
+
+
+STATE_DIRECTORY = '_saved_states'
+REFERENCE_FILE = os.path.join('engine', 'perft_counts.json')
+DEFAULT_DEPTH = 3
+
+
+def scenarios() -> List[str]:
+    """
+    Names of every saved scenario.
+    """
+    return sorted(f[:-len('.json')] for f in os.listdir(STATE_DIRECTORY) if f.endswith('.json'))
+
+
+def load_board(scenario: str) -> object:
+    """
+    Loads a scenario and makes it the global board.
+    """
+    from chess.board import Board
+    board = Board(os.path.join(STATE_DIRECTORY, scenario + '.json'))
+    OBJREF.BOARD = board
+    board.update()
+    return board
+
+
+def perft(board, depth: int, counts: Optional[Dict[str, int]] = None) -> int:
+    """
+    Returns the number of leaf outcomes at the given depth, tallying leaf outcome types into counts.
+    """
+    if depth <= 0: return 1
+    if counts is None: counts = {}
+    outcomes = [oc for p in board.loyal_pieces() for oc in list(p.outcomes.values())]
+    if depth == 1:
+        for oc in outcomes:
+            counts[oc.name] = counts.get(oc.name, 0) + 1
+        return len(outcomes)
+    
+    nodes = 0
+    for oc in outcomes:
+        record = board.apply(oc)
+        nodes += perft(board, depth - 1, counts)
+        board.undo(record)
+    return nodes
+
+
+def run_perft(scenario: str, depth: int) -> Dict[str, object]:
+    """
+    Runs perft on a scenario, returns nodes, leaf type counts and timing.
+    """
+    board = load_board(scenario)
+    counts = {}
+    t = time.perf_counter()
+    nodes = perft(board, depth, counts)
+    seconds = time.perf_counter() - t
+    return {'nodes': nodes,
+            'types': dict(sorted(counts.items())),
+            'seconds': seconds,
+            'nps': nodes / seconds if seconds > 0 else 0.0}
+
+
+def read_reference(path: str = REFERENCE_FILE) -> Dict[str, Dict[str, Dict]]:
+    if not os.path.exists(path): return {}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def write_reference(reference: Dict[str, Dict[str, Dict]], path: str = REFERENCE_FILE) -> None:
+    with open(path, 'w') as f:
+        json.dump(reference, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Count outcomes to a fixed depth over saved scenarios.')
+    parser.add_argument('scenarios', nargs='*', help='Scenario names (default: all saved states).')
+    parser.add_argument('-d', '--depth', type=int, default=DEFAULT_DEPTH, help='Maximum depth (every depth up to it is run).')
+    parser.add_argument('--check', action='store_true', help='Compare counts with the reference file.')
+    parser.add_argument('--update', action='store_true', help='Write counts to the reference file.')
+    parser.add_argument('--reference', default=REFERENCE_FILE, help='Reference counts file.')
+    args = parser.parse_args(argv)
+    
+    reference = read_reference(args.reference)
+    failed = False
+    for scenario in (args.scenarios or scenarios()):
+        for depth in range(1, args.depth + 1):
+            result = run_perft(scenario, depth)
+            line = f"{scenario:<12} depth {depth}  nodes {result['nodes']:>9}  {result['nps']:>10.0f} nodes/s  {result['types']}"
+            
+            expected = reference.get(scenario, {}).get(str(depth), None)
+            if args.check:
+                if expected is None:
+                    line += '  (no reference)'
+                elif expected['nodes'] == result['nodes'] and expected['types'] == result['types']:
+                    line += '  OK'
+                else:
+                    line += f"  MISMATCH expected {expected['nodes']} {expected['types']}"
+                    failed = True
+            print(line)
+            
+            if args.update:
+                reference.setdefault(scenario, {})[str(depth)] = {'nodes': result['nodes'], 'types': result['types']}
+    
+    if args.update:
+        write_reference(reference, args.reference)
+        print(f'Reference counts written to {args.reference}')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
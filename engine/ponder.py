@@ -0,0 +1,72 @@
+from typing import List, Tuple
+
+from utils.chess_types import Loyalty
+from chess.actions.outcome import MoveRecord
+
+from engine.search import Search, SearchTimeout, INF, is_auto
+from engine.transposition import encode_move
+from engine.lazy_smp import smp_setup
+
+
+# PONDERING:
+#   A bot thinks during the turn of the faction before it (usually a human player), in a worker process.
+#   The worker predicts the likely replies of the faction to move with a shallow search (best first),
+#   then plays each reply and searches the bot's position, until the pondering is stopped:
+#       every result is stored in the bot's shared transposition table (see SharedTranspositionTable),
+#       so when a predicted reply is realized, the bot finds its root (and subtree) already searched.
+#   AUTO factions moving between the reply and the bot (e.g. the bot's zombies) play their best ordered outcome,
+#   replies after which another faction moves before the bot are skipped.
+#
+#   Every ponder job has a number, and the main process stops it by changing the table's ponder job word,
+#   which every search in the worker checks (so stopping doesn't wait, and doesn't touch the stop flag of other searches).
+
+
+PREDICT_DEPTH: int = 1      # Depth of the search ranking the replies (plus quiescence).
+
+
+def predict_replies(search: Search) -> List[MoveRecord]:
+    """
+    Returns the outcomes of the faction to move, ordered by a shallow search (likeliest first).
+    Ties are ordered by move code, so every process predicts the same order whatever its piece order.
+    """
+    board = search.board
+    search.start()
+    moves = search.ordered_root_outcomes()
+    keys = [(search.child_score(oc, 1, PREDICT_DEPTH - 1, -INF, INF), -encode_move(board, oc)) for _t, oc in moves]
+    return [moves[i][1] for i in sorted(range(len(moves)), key=keys.__getitem__, reverse=True)]
+
+
+def ponder_worker(data: bytes, key: int, params: Tuple, tt_name: str, loyalty: Loyalty, max_depth: int, job: int) -> int:
+    """
+    Searches the bot's position after each predicted reply, until the job is stopped or every reply is searched.
+    Returns the number of replies searched to max_depth.
+    """
+    board, tt = smp_setup(data, key, tt_name)
+    piece_values, qs_depth, auto_width = params
+    stopped = lambda: tt.ponder_job != job
+    
+    predictor = Search(board, board.current_turn, piece_values, PREDICT_DEPTH, None, None, qs_depth=qs_depth, auto_width=auto_width)
+    predictor.abort = stopped
+    try:
+        replies = predict_replies(predictor)
+    except SearchTimeout:
+        return 0
+    
+    pondered = 0
+    for oc in replies:
+        if stopped(): break
+        records = [board.apply(oc)]
+        try:
+            while board.current_turn != loyalty and is_auto(board.current_turn):
+                autos = predictor.node_outcomes()
+                if not autos: break
+                records.append(board.apply(autos[0]))
+            if board.current_turn != loyalty: continue
+            search = Search(board, loyalty, piece_values, max_depth, None, tt, qs_depth=qs_depth, auto_width=auto_width)
+            search.abort = stopped
+            if search.run().depth >= max_depth:
+                pondered += 1
+        finally:
+            for record in reversed(records):
+                board.undo(record)
+    return pondered
@@ -0,0 +1,111 @@
+import numpy as np
+from typing import Optional, Tuple, Sequence, NamedTuple
+from multiprocessing import shared_memory
+
+
+# SEARCH PREVIEW:
+#   A running search publishes its current best line after every completed iteration, and the UI polls it every frame
+#   (to show the outcome the bot prefers so far, updated as it thinks longer).
+#   The channel is a small record in shared memory, so searches in worker processes publish to it too.
+#
+#   Words: sequence number, position key, depth, score, line length, then up to MAX_PV move codes (see encode_move).
+#   Writes bump the sequence number before and after (odd while a write is in progress),
+#   readers retry on the next frame if the sequence number was odd or moved while they read.
+#   Only changes are published, so an idle channel costs a poll one read.
+#   One search writes at a time (the bot's current decision), any number of threads and processes may read.
+
+
+MAX_PV: int = 8
+HEADER_WORDS: int = 5
+
+
+class SearchPreview(NamedTuple):
+    key: int                # Position the search started from (Board.zobrist_key)
+    depth: int              # Completed depth (0 while nothing was found yet)
+    score: float
+    pv: Tuple[int, ...]     # Move codes of the best line, the root outcome first
+
+
+class PreviewChannel:
+    """
+    Shared-memory channel for the best line of a running search.
+    The creating process owns the memory, others attach to it by name.
+    """
+    
+    shm: shared_memory.SharedMemory
+    owner: bool
+    words: np.ndarray       # uint64 view of the record
+    scores: np.ndarray      # float64 view of the record (score word)
+    seen: int               # Sequence number of the last preview returned by poll
+    
+    def __init__(self, name: Optional[str] = None):
+        self.owner = name is None
+        size = (HEADER_WORDS + MAX_PV) * 8
+        self.shm = shared_memory.SharedMemory(name=name, create=self.owner, size=size if self.owner else 0)
+        self.words = np.ndarray((HEADER_WORDS + MAX_PV,), dtype=np.uint64, buffer=self.shm.buf)
+        self.scores = np.ndarray((HEADER_WORDS + MAX_PV,), dtype=np.float64, buffer=self.shm.buf)
+        if self.owner:
+            self.words[:] = 0
+        self.seen = 0
+    
+    @property
+    def name(self) -> str:
+        return self.shm.name
+    
+    def _read(self) -> Tuple[int, Optional[SearchPreview]]:
+        """
+        Returns the sequence number and the preview, which is None if it is being written (or nothing was published).
+        """
+        words = self.words
+        seq = int(words[0])
+        if seq == 0 or seq & 1: return seq, None
+        n = int(words[4])
+        preview = SearchPreview(int(words[1]), int(words[2]), float(self.scores[3]),
+                                tuple(int(c) - 1 for c in words[HEADER_WORDS:HEADER_WORDS + n]))
+        return seq, preview if int(words[0]) == seq else None
+    
+    def read(self) -> Optional[SearchPreview]:
+        return self._read()[1]
+    
+    def poll(self) -> Optional[SearchPreview]:
+        """
+        Returns the preview if it changed since the last poll, else None.
+        """
+        if int(self.words[0]) == self.seen: return None
+        seq, preview = self._read()
+        if preview is not None:
+            self.seen = seq
+        return preview
+    
+    def publish(self, key: int, depth: int, score: float, pv: Sequence[int]) -> bool:
+        """
+        Publishes a search's best line, returns False (without writing) if it didn't change.
+        """
+        pv = tuple(pv[:MAX_PV])
+        if self.read() == SearchPreview(key, depth, score, pv): return False
+        words = self.words
+        seq = int(words[0])
+        words[0] = seq + 1
+        words[1] = key
+        words[2] = depth
+        self.scores[3] = score
+        words[4] = len(pv)
+        words[HEADER_WORDS:HEADER_WORDS + len(pv)] = [c + 1 for c in pv]
+        words[0] = seq + 2
+        return True
+    
+    def clear(self, key: int) -> bool:
+        """
+        Publishes an empty line for a new search of a position.
+        """
+        return self.publish(key, 0, 0.0, ())
+    
+    def close(self) -> None:
+        """
+        Detaches from the shared memory, and frees it if this channel created it.
+        """
+        self.words = None
+        self.scores = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
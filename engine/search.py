@@ -0,0 +1,464 @@
+import sys
+import math
+import time
+import argparse
+from typing import Optional, Callable, Dict, List, Tuple, NamedTuple
+
+from utils.chess_types import Loyalty, PieceType
+from chess.actions.outcome import MoveRecord
+
+from engine.legal import legal_outcomes
+from engine.transposition import TranspositionTable, encode_move, NO_MOVE, DEFAULT_SIZE_MB
+from engine.transposition import BOUND_EXACT, BOUND_LOWER, BOUND_UPPER
+from engine.move_ordering import MoveOrdering
+from engine.preview import PreviewChannel, MAX_PV
+
+
+# SEARCH:
+#   Alpha-beta negamax with iterative deepening, walking positions with Board.apply/undo.
+#
+#   The turn order holds several factions, which are grouped into teams:
+#       a faction and its AUTO faction (e.g. WHITE and WHITE_AUTO) play for the same team.
+#   Scores are from the point of view of the team to move and only change sign when the team changes,
+#   so consecutive moves by one team (auto turns, outcomes which don't end the turn) are maximized together.
+#   Every other team is assumed to play against the searching team (paranoid, see engine/multi_search.py for max-n).
+#   AUTO factions are played by bots, so only their AUTO_WIDTH best ordered outcomes are expanded.
+#
+#   Empty factions (and factions without outcomes) are skipped by Board.next_turn, so every ply is a real outcome.
+#
+#   With a transposition table, results are stored by position key and reused (cutoffs and best move first).
+#   Mate scores are stored relative to the node (plies to mate), and converted back when probed.
+#   Outcomes are ordered by engine/move_ordering.py, which learns from cutoffs (killers and history).
+#
+#   Leaves are extended by a quiescence search through capturing outcomes only
+#   (Capture, MultiCapture, and ambushes which don't end the turn) until the position is quiet:
+#       stand-pat : the team to move may decline every capture and keep the static evaluation.
+#       delta     : captures which can't raise the score to alpha (even with a margin) are skipped.
+#   Quiescence stops after QS_MAX_DEPTH plies, and is checked against the deadline like any other node.
+#
+#   Run from the repository root:
+#       python -m engine.search standard zombie --depth 3 --time 5
+
+
+INF: float = float('inf')
+MATE_SCORE: float = 1e6             # Score of a position where a team lost its last leader (less the plies to reach it).
+MATE_BOUND: float = MATE_SCORE - 1000
+LEADERSHIP_VALUE: float = 0.25      # Value of a leadership point (in pawns).
+TIME_CHECK_NODES: int = 32          # Nodes between deadline checks.
+AUTO_WIDTH: int = 3                 # Outcomes expanded for AUTO factions (0 expands all).
+QS_MAX_DEPTH: int = 8               # Quiescence plies past the search depth.
+DELTA_MARGIN: float = 2.0           # Delta pruning margin (in pawns).
+
+
+def is_mate(score: float) -> bool:
+    return abs(score) >= MATE_BOUND
+
+
+def score_to_tt(score: float, ply: int) -> float:
+    if score >= MATE_BOUND: return score + ply
+    if score <= -MATE_BOUND: return score - ply
+    return score
+
+
+def score_from_tt(score: float, ply: int) -> float:
+    if score >= MATE_BOUND: return score - ply
+    if score <= -MATE_BOUND: return score + ply
+    return score
+
+
+def team(loyalty: Loyalty) -> int:
+    """
+    Returns the team of a faction, AUTO factions belong to the faction which summons them.
+    """
+    return math.ceil(loyalty.value)
+
+
+def is_auto(loyalty: Loyalty) -> bool:
+    return loyalty.value % 1 == 0.5
+
+
+def leader_teams(board) -> Tuple[int, ...]:
+    """
+    Teams which still have a leader on the board.
+    """
+    return tuple(sorted({team(l) for l in board.turn_order if board.loyal_leaders(l)}))
+
+
+class SearchTimeout(Exception):
+    """
+    Raised inside the search when the deadline passes, unwinding (and undoing) every open outcome.
+    """
+
+
+class SearchResult(NamedTuple):
+    outcome: Optional[MoveRecord]
+    tile: Optional[object]
+    score: float
+    depth: int          # Deepest completed iteration
+    nodes: int
+    seconds: float
+    qnodes: int = 0     # Nodes searched by quiescence (included in nodes)
+    
+    @property
+    def nps(self) -> float:
+        return self.nodes / self.seconds if self.seconds > 0 else 0.0
+
+
+class Search:
+    """
+    Alpha-beta search of a board for one faction.
+    """
+    
+    board: object
+    loyalty: Loyalty
+    piece_values: Dict[PieceType, float]
+    
+    max_depth: int
+    time_limit: Optional[float]     # Seconds, None for no limit
+    tt: Optional[TranspositionTable]
+    ordering: MoveOrdering
+    qs_depth: int                   # Quiescence plies (0 disables quiescence)
+    auto_width: int                 # Outcomes expanded for AUTO factions (0 expands all)
+    
+    nodes: int
+    qnodes: int
+    ply: int                        # Plies applied below the root
+    deadline: float
+    abort: Optional[Callable[[], bool]]     # Checked with the deadline, stops the search when it returns True
+    preview: Optional[PreviewChannel]       # Receives the best line after every completed iteration
+    _team: int
+    _teams: Tuple[int, ...]         # Teams which had leaders when the search started
+    
+    def __init__(self,
+                 board: object,
+                 loyalty: Loyalty,
+                 piece_values: Dict[PieceType, float],
+                 max_depth: int = 4,
+                 time_limit: Optional[float] = 2.0,
+                 tt: Optional[TranspositionTable] = None,
+                 ordering: Optional[MoveOrdering] = None,
+                 qs_depth: int = QS_MAX_DEPTH,
+                 auto_width: int = AUTO_WIDTH):
+        self.board = board
+        self.loyalty = loyalty
+        self.piece_values = piece_values
+        self.max_depth = max_depth
+        self.time_limit = time_limit
+        self.tt = tt
+        self.ordering = ordering if ordering is not None else MoveOrdering(board, piece_values)
+        self.qs_depth = qs_depth
+        self.auto_width = auto_width
+        self.nodes = 0
+        self.qnodes = 0
+        self.ply = 0
+        self.deadline = INF
+        self.abort = None
+        self.preview = None
+        self._team = team(loyalty)
+        self._teams = ()
+    
+    # # #
+    # Evaluation
+    def sign(self, loyalty: Loyalty) -> int:
+        """
+        +1 for the searching team, 0 for neutral pieces, -1 for everyone else.
+        """
+        t = team(loyalty)
+        if t == self._team: return 1
+        return 0 if t == 0 else -1
+    
+    def evaluate(self) -> float:
+        """
+        Material and leadership balance, from the point of view of the searching team.
+        """
+        board = self.board
+        values = self.piece_values
+        score = 0.0
+        for p in board.pieces:
+            score += self.sign(p.loyalty) * values.get(p.piece_type, 0.0)
+        for l, pts in board.leadership_pts.items():
+            score += self.sign(l) * LEADERSHIP_VALUE * pts
+        return score
+    
+    def leader_teams(self) -> Tuple[int, ...]:
+        return leader_teams(self.board)
+    
+    def game_over(self) -> Optional[float]:
+        """
+        Returns the score (for the searching team) if a team which had leaders has lost them all.
+        """
+        if not self._teams: return None
+        remaining = self.leader_teams()
+        if self._team in self._teams and self._team not in remaining:
+            return -MATE_SCORE + self.ply
+        if remaining and remaining != (self._team,):
+            return None
+        return MATE_SCORE - self.ply
+    #
+    # # #
+    
+    # # #
+    # Search
+    def outcomes(self) -> List[MoveRecord]:
+        """
+        Outcomes of the faction to move.
+        """
+        return [oc for p in self.board.loyal_pieces() for oc in p.outcomes.values()]
+    
+    def node_outcomes(self, tt_move: int = NO_MOVE) -> List[MoveRecord]:
+        """
+        Ordered outcomes to expand for the faction to move (only the best few for AUTO factions).
+        """
+        outcomes = self.ordering.order(self.outcomes(), self.ply, tt_move)
+        if self.auto_width and is_auto(self.board.current_turn):
+            del outcomes[self.auto_width:]
+        return outcomes
+    
+    def root_outcomes(self) -> List[Tuple[object, MoveRecord]]:
+        """
+        (tile, outcome) pairs which don't leave a leader capturable (falling back to every outcome).
+        """
+        board = self.board
+        legal = legal_outcomes(board, self.loyalty)
+        if not any(legal.values()):
+            legal = {p: p.outcomes for p in board.loyal_pieces(self.loyalty)}
+        return [(t, oc) for ocs in legal.values() for t, oc in ocs.items()]
+    
+    def tick(self) -> None:
+        self.nodes += 1
+        if self.nodes % TIME_CHECK_NODES == 0 and (time.perf_counter() > self.deadline or (self.abort is not None and self.abort())):
+            raise SearchTimeout()
+    
+    def negamax(self, depth: int, alpha: float, beta: float) -> float:
+        """
+        Returns the score of the current position for the team to move.
+        """
+        self.tick()
+        board = self.board
+        side = self.sign(board.current_turn) or -1
+        
+        over = self.game_over()
+        if over is not None:
+            return side * over
+        if depth <= 0:
+            return self.quiesce(side, depth, alpha, beta)
+        
+        tt = self.tt
+        tt_move = NO_MOVE
+        if tt is not None:
+            key = board.zobrist_key
+            entry = tt.probe(key)
+            if entry is not None:
+                e_depth, bound, score, tt_move = entry
+                if e_depth >= depth:
+                    score = score_from_tt(score, self.ply)
+                    if bound == BOUND_EXACT \
+                            or (bound == BOUND_LOWER and score >= beta) \
+                            or (bound == BOUND_UPPER and score <= alpha):
+                        return score
+        
+        outcomes = self.node_outcomes(tt_move)
+        if not outcomes:
+            return side * self.evaluate()
+        
+        alpha_start = alpha
+        best, best_oc = -INF, None
+        for oc in outcomes:
+            score = self.child_score(oc, side, depth - 1, alpha, beta)
+            if score > best:
+                best, best_oc = score, oc
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        self.ordering.cutoff(oc, self.ply, depth)
+                        break
+        
+        if tt is not None:
+            bound = BOUND_UPPER if best <= alpha_start else BOUND_LOWER if best >= beta else BOUND_EXACT
+            tt.store(key, depth, bound, score_to_tt(best, self.ply), encode_move(board, best_oc))
+        return best
+    
+    def quiesce(self, side: int, depth: int, alpha: float, beta: float) -> float:
+        """
+        Extends a leaf through capturing outcomes until it is quiet (depth counts down from 0).
+        """
+        self.qnodes += 1
+        stand_pat = side * self.evaluate()
+        if stand_pat >= beta or depth <= -self.qs_depth:
+            return stand_pat
+        if stand_pat > alpha:
+            alpha = stand_pat
+        
+        ordering = self.ordering
+        outcomes = [oc for p in self.board.loyal_pieces() for oc in p.capture_outcomes.values()]
+        best = stand_pat
+        for oc in ordering.order(outcomes, self.ply):
+            if stand_pat + ordering.capture_gain(oc) + DELTA_MARGIN <= alpha:
+                continue # Delta pruning, this capture can't recover the deficit.
+            score = self.child_score(oc, side, depth - 1, alpha, beta)
+            if score > best:
+                best = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta: break
+        return best
+    
+    def child_score(self, oc: MoveRecord, side: int, depth: int, alpha: float, beta: float) -> float:
+        """
+        Applies an outcome and returns its score for the side which played it.
+        """
+        board = self.board
+        record = board.apply(oc)
+        self.ply += 1
+        try:
+            if (self.sign(board.current_turn) or -1) == side:
+                return self.negamax(depth, alpha, beta)
+            return -self.negamax(depth, -beta, -alpha)
+        finally:
+            self.ply -= 1
+            board.undo(record)
+    
+    def search_root(self, moves: List[Tuple[object, MoveRecord]], depth: int, alpha: float = -INF, beta: float = INF) -> Tuple[float, int]:
+        """
+        Searches root outcomes to the given depth, within the (alpha, beta) window.
+        Returns the best score and the index of the best outcome (fail-soft, the score may be outside the window).
+        """
+        best, best_i = -INF, 0
+        for i, (t, oc) in enumerate(moves):
+            score = self.child_score(oc, 1, depth - 1, alpha, beta)
+            if score > best:
+                best, best_i = score, i
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta: break
+        return best, best_i
+    
+    def principal_variation(self, first: MoveRecord, length: int = MAX_PV) -> List[int]:
+        """
+        Move codes of the best line: the first outcome, then the stored best moves (as long as the table has them).
+        """
+        board = self.board
+        codes = []
+        records = []
+        oc = first
+        try:
+            while oc is not None and len(codes) < min(length, MAX_PV):
+                codes.append(encode_move(board, oc))
+                records.append(board.apply(oc))
+                entry = self.tt.probe(board.zobrist_key) if self.tt is not None else None
+                if entry is None or entry[3] == NO_MOVE: break
+                oc = next((o for o in self.outcomes() if encode_move(board, o) == entry[3]), None)
+        finally:
+            for record in reversed(records):
+                board.undo(record)
+        return codes
+    
+    def start(self) -> None:
+        """
+        Resets the node counters and the deadline, and starts a new search generation.
+        """
+        self.nodes = 0
+        self.qnodes = 0
+        self.ply = 0
+        self.deadline = time.perf_counter() + self.time_limit if self.time_limit is not None else INF
+        self._teams = self.leader_teams()
+        if self.tt is not None:
+            self.tt.new_search()
+        self.ordering.new_search()
+    
+    def ordered_root_outcomes(self) -> List[Tuple[object, MoveRecord]]:
+        """
+        Root (tile, outcome) pairs, the stored best move first (from an earlier search or pondering), then by move ordering.
+        """
+        moves = self.root_outcomes()
+        tt_move = NO_MOVE
+        if self.tt is not None:
+            entry = self.tt.probe(self.board.zobrist_key)
+            if entry is not None:
+                tt_move = entry[3]
+        scores = self.ordering.scores([oc for _t, oc in moves], 0, tt_move)
+        return [moves[i] for i in sorted(range(len(moves)), key=scores.__getitem__, reverse=True)]
+    
+    def run(self, first_depth: int = 1, skew: int = 0) -> SearchResult:
+        """
+        Iteratively deepens from first_depth until the maximum depth or the time limit is reached.
+        A skew rotates the root outcomes after the first one (so parallel searches start on different outcomes).
+        """
+        board = self.board
+        tt = self.tt
+        t = time.perf_counter()
+        self.start()
+        
+        moves = self.ordered_root_outcomes()
+        if not moves:
+            return SearchResult(None, None, self.evaluate(), 0, 0, time.perf_counter() - t)
+        if skew and len(moves) > 2:
+            k = 1 + skew % (len(moves) - 1)
+            moves[1:] = moves[k:] + moves[1:k]
+        
+        key = board.zobrist_key
+        best_tile, best_oc = moves[0]
+        best_score, completed = -INF, 0
+        for depth in range(max(1, min(first_depth, self.max_depth)), self.max_depth + 1):
+            try:
+                score, i = self.search_root(moves, depth)
+            except SearchTimeout:
+                break
+            best_score, completed = score, depth
+            best_tile, best_oc = moves[i]
+            moves.insert(0, moves.pop(i)) # Search the best outcome first in the next iteration.
+            if tt is not None:
+                tt.store(key, depth, BOUND_EXACT, score_to_tt(score, 0), encode_move(board, best_oc))
+            if self.preview is not None:
+                self.preview.publish(key, depth, score, self.principal_variation(best_oc, depth))
+            if len(moves) == 1 or is_mate(score): break
+        
+        return SearchResult(best_oc, best_tile, best_score, completed, self.nodes, time.perf_counter() - t, self.qnodes)
+    #
+    # # #
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from engine.perft import scenarios, load_board
+    from engine.bots.bot import Bot
+    from engine.multi_search import SEARCH_STRATEGIES
+    from engine.parallel_search import ParallelSearch
+    from engine.lazy_smp import LazySMPSearch
+    
+    parser = argparse.ArgumentParser(description='Search saved scenarios for the faction to move.')
+    parser.add_argument('scenarios', nargs='*', help='Scenario names (default: all saved states).')
+    parser.add_argument('-d', '--depth', type=int, default=4, help='Maximum depth.')
+    parser.add_argument('-t', '--time', type=float, default=None, help='Time limit in seconds (default: none).')
+    parser.add_argument('--tt', type=float, default=DEFAULT_SIZE_MB, help='Transposition table size in MB (0 to disable).')
+    parser.add_argument('--qs', type=int, default=QS_MAX_DEPTH, help='Quiescence depth (0 to disable).')
+    parser.add_argument('--auto-width', type=int, default=AUTO_WIDTH, help='Outcomes expanded for AUTO factions (0 for all).')
+    parser.add_argument('-s', '--strategy', choices=tuple(SEARCH_STRATEGIES), default='paranoid')
+    parser.add_argument('-w', '--workers', type=int, default=1, help='Worker processes for a parallel root search.')
+    parser.add_argument('--smp', action='store_true', help='Parallel search with Lazy SMP (shared table) instead of a root split.')
+    args = parser.parse_args(argv)
+    
+    for scenario in (args.scenarios or scenarios()):
+        board = load_board(scenario)
+        if args.workers > 1 and args.smp:
+            search = LazySMPSearch(board, board.current_turn, Bot.piece_values, args.depth, args.time, args.workers,
+                                   tt_size_mb=args.tt or DEFAULT_SIZE_MB, qs_depth=args.qs, auto_width=args.auto_width)
+        elif args.workers > 1:
+            search = ParallelSearch(board, board.current_turn, Bot.piece_values, args.depth, args.time, args.workers, args.strategy,
+                                    args.tt, qs_depth=args.qs, auto_width=args.auto_width)
+        else:
+            tt = TranspositionTable(args.tt) if args.tt > 0 else None
+            search = SEARCH_STRATEGIES[args.strategy](board, board.current_turn, Bot.piece_values, args.depth, args.time, tt,
+                                                      qs_depth=args.qs, auto_width=args.auto_width)
+        r = search.run()
+        print(f"{scenario:<12} depth {r.depth}  score {r.score:>8.2f}  nodes {r.nodes:>8} ({r.qnodes} quiescence)  {r.seconds:>6.2f}s  {r.nps:>7.0f} nodes/s  {r.outcome}")
+        if args.workers > 1 and args.smp:
+            print(f"{'':<12} nodes per worker {search.worker_nodes}, depths {search.worker_depths}, tt {search.tt.stats()['filled']:.1%} filled")
+        if args.workers > 1:
+            search.shutdown()
+        elif search.tt is not None:
+            print(f"{'':<12} tt {search.tt.stats()}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,333 @@
+import struct
+import numpy as np
+from typing import Optional, Tuple, Dict
+from multiprocessing import shared_memory
+
+from chess.actions.outcome import MoveRecord, OutcomeKind
+
+
+# TRANSPOSITION TABLE:
+#   Fixed-size table of searched positions, keyed by Board.zobrist_key.
+#   Entries live in preallocated numpy arrays, so memory stays flat however long the game runs.
+#
+#   The table is split into buckets of two slots:
+#       slot 0 : depth-preferred, only replaced by a deeper (or equal) search, or by any search once it is stale.
+#       slot 1 : always-replace, takes every store which does not go into slot 0.
+#   An entry is stale when it was stored during an older search (see new_search).
+#
+#   Best moves are stored as int codes (see encode_move), which are matched against the outcomes of the position.
+#
+#   SharedTranspositionTable keeps the same buckets in multiprocessing shared memory, for searches in several processes.
+#   Slots are written without locks as two 64-bit words (key ^ data, data):
+#       data packs score (float32), move, depth, bound and age,
+#       a slot whose words come from two different writes fails the xor check, and reads as a miss.
+
+
+BUCKET_SIZE: int = 2
+ENTRY_BYTES: int = 8 + 8 + 4 + 1 + 1 + 1   # key, score, move, depth, bound, age
+DEFAULT_SIZE_MB: float = 16.0
+
+# Bound types
+BOUND_NONE: int = 0     # Empty slot
+BOUND_EXACT: int = 1
+BOUND_LOWER: int = 2    # Score is at least the stored score (fail high)
+BOUND_UPPER: int = 3    # Score is at most the stored score (fail low)
+
+NO_MOVE: int = -1
+
+
+def target_square(board, oc: MoveRecord) -> int:
+    """
+    Returns the square an outcome targets (the rook for a castle), or -1 if it has no single target.
+    """
+    target = oc.data.position if oc.kind == OutcomeKind.CASTLE else oc.target
+    return board.geometry.square(target) if target is not None else -1
+
+
+def encode_move(board, oc: MoveRecord) -> int:
+    """
+    Returns an int identifying an outcome within its position (piece square, kind, target square).
+    """
+    geometry = board.geometry
+    n = geometry.width * geometry.height
+    return (geometry.square(oc.piece.position) * len(OutcomeKind) + oc.kind) * (n + 1) + target_square(board, oc) + 1
+
+
+def decode_move(board, code: int) -> Tuple[int, OutcomeKind, int]:
+    """
+    Returns the (piece square, kind, target square) of a move code, the target is -1 if it has none (see encode_move).
+    """
+    geometry = board.geometry
+    rest, target = divmod(code, geometry.width * geometry.height + 1)
+    sq, kind = divmod(rest, len(OutcomeKind))
+    return sq, OutcomeKind(kind), target - 1
+
+
+class TranspositionTable:
+    """
+    Preallocated, array-backed transposition table with a depth-preferred/always-replace bucket policy.
+    """
+    
+    n_buckets: int
+    keys: np.ndarray        # uint64 position keys
+    scores: np.ndarray      # float64
+    moves: np.ndarray       # int32 move codes (NO_MOVE if none)
+    depths: np.ndarray      # int8
+    bounds: np.ndarray      # int8 bound types (BOUND_NONE = empty)
+    ages: np.ndarray        # uint8 search generation
+    
+    age: int
+    hits: int
+    misses: int
+    stores: int
+    overwrites: int         # Stores which replaced a different position
+    
+    def __init__(self, size_mb: float = DEFAULT_SIZE_MB):
+        n = max(1, int(size_mb * 1024 * 1024) // (ENTRY_BYTES * BUCKET_SIZE))
+        self.n_buckets = 1 << (n.bit_length() - 1) # Power of two, buckets are indexed with a mask.
+        n_slots = self.n_buckets * BUCKET_SIZE
+        self.keys = np.zeros(n_slots, dtype=np.uint64)
+        self.scores = np.zeros(n_slots, dtype=np.float64)
+        self.moves = np.full(n_slots, NO_MOVE, dtype=np.int32)
+        self.depths = np.zeros(n_slots, dtype=np.int8)
+        self.bounds = np.zeros(n_slots, dtype=np.int8)
+        self.ages = np.zeros(n_slots, dtype=np.uint8)
+        self.age = 0
+        self.reset_stats()
+    
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.overwrites = 0
+    
+    def clear(self) -> None:
+        self.keys.fill(0)
+        self.moves.fill(NO_MOVE)
+        self.bounds.fill(BOUND_NONE)
+        self.age = 0
+        self.reset_stats()
+    
+    def new_search(self) -> None:
+        """
+        Starts a new search generation, entries from older searches become replaceable.
+        """
+        self.age = (self.age + 1) & 0xFF
+    
+    def _slot(self, key: int) -> int:
+        return (key & (self.n_buckets - 1)) * BUCKET_SIZE
+    
+    def probe(self, key: int) -> Optional[Tuple[int, int, float, int]]:
+        """
+        Returns (depth, bound, score, move) stored for a position key, or None.
+        """
+        i = self._slot(key)
+        for s in range(i, i + BUCKET_SIZE):
+            if self.bounds[s] != BOUND_NONE and int(self.keys[s]) == key:
+                self.hits += 1
+                return int(self.depths[s]), int(self.bounds[s]), float(self.scores[s]), int(self.moves[s])
+        self.misses += 1
+        return None
+    
+    def store(self, key: int, depth: int, bound: int, score: float, move: int = NO_MOVE) -> None:
+        """
+        Stores a search result, following the bucket replacement policy.
+        """
+        i = self._slot(key)
+        deep, last = i, i + 1
+        if self.bounds[deep] == BOUND_NONE or int(self.keys[deep]) == key \
+                or depth >= self.depths[deep] or self.ages[deep] != self.age:
+            s = deep
+        else:
+            s = last
+        
+        if self.bounds[s] != BOUND_NONE:
+            if int(self.keys[s]) != key:
+                self.overwrites += 1
+            elif move == NO_MOVE:
+                move = int(self.moves[s]) # Keep the best move found by an earlier search of the position.
+        self.stores += 1
+        self.keys[s] = key
+        self.depths[s] = max(-128, min(depth, 127))
+        self.bounds[s] = bound
+        self.scores[s] = score
+        self.moves[s] = move
+        self.ages[s] = self.age
+    
+    @property
+    def filled(self) -> int:
+        return int(np.count_nonzero(self.bounds))
+    
+    @property
+    def nbytes(self) -> int:
+        return self.keys.nbytes + self.scores.nbytes + self.moves.nbytes + self.depths.nbytes + self.bounds.nbytes + self.ages.nbytes
+    
+    def stats(self) -> Dict[str, float]:
+        probes = self.hits + self.misses
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / probes if probes else 0.0,
+                'stores': self.stores,
+                'overwrites': self.overwrites,
+                'filled': self.filled / (self.n_buckets * BUCKET_SIZE)}
+
+
+# # #
+# Shared table
+#   Header words: bucket count, search age, stop flag (set to stop every search using the table),
+#   ponder job (a ponder search stops once this no longer holds its number, see engine/ponder.py).
+HEADER_WORDS: int = 4
+MOVE_BITS: int = 20
+AGE_MASK: int = 0b11
+_FLOAT = struct.Struct('<f')
+_UINT = struct.Struct('<I')
+
+
+def pack_entry(score: float, move: int, depth: int, bound: int, age: int) -> int:
+    """
+    Packs an entry into 64 bits: score (32) | move + 1 (20) | depth + 128 (8) | bound (2) | age (2).
+    """
+    if not 0 <= move + 1 < (1 << MOVE_BITS): move = NO_MOVE
+    return (_UINT.unpack(_FLOAT.pack(score))[0]
+            | (move + 1) << 32
+            | (max(-128, min(depth, 127)) + 128) << 52
+            | bound << 60
+            | (age & AGE_MASK) << 62)
+
+
+def unpack_entry(data: int) -> Tuple[int, int, float, int, int]:
+    """
+    Returns (depth, bound, score, move, age) of packed entry data.
+    """
+    return (((data >> 52) & 0xFF) - 128,
+            (data >> 60) & 0b11,
+            _FLOAT.unpack(_UINT.pack(data & 0xFFFFFFFF))[0],
+            ((data >> 32) & ((1 << MOVE_BITS) - 1)) - 1,
+            (data >> 62) & AGE_MASK)
+
+
+class SharedTranspositionTable(TranspositionTable):
+    """
+    Transposition table in shared memory, written by several processes without locks (xor-verified slots).
+    The creating process owns the memory, others attach to it by name.
+    """
+    
+    shm: shared_memory.SharedMemory
+    owner: bool
+    words: np.ndarray       # Header words, then (key ^ data, data) per slot
+    
+    def __init__(self, size_mb: float = DEFAULT_SIZE_MB, name: Optional[str] = None):
+        self.owner = name is None
+        if self.owner:
+            n = max(1, int(size_mb * 1024 * 1024) // (16 * BUCKET_SIZE))
+            n_buckets = 1 << (n.bit_length() - 1)
+            self.shm = shared_memory.SharedMemory(create=True, size=(HEADER_WORDS + 2 * n_buckets * BUCKET_SIZE) * 8)
+            self.words = np.ndarray((HEADER_WORDS + 2 * n_buckets * BUCKET_SIZE,), dtype=np.uint64, buffer=self.shm.buf)
+            self.words[:] = 0
+            self.words[0] = n_buckets
+        else:
+            # NOTE: Pool workers share their parent's resource tracker, so attaching doesn't make them free the memory.
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.words = np.ndarray((self.shm.size // 8,), dtype=np.uint64, buffer=self.shm.buf)
+        self.n_buckets = int(self.words[0])
+        self.reset_stats()
+    
+    @property
+    def name(self) -> str:
+        return self.shm.name
+    
+    @property
+    def age(self) -> int:
+        return int(self.words[1]) & AGE_MASK
+    
+    @property
+    def stopped(self) -> bool:
+        return bool(self.words[2])
+    
+    @stopped.setter
+    def stopped(self, value: bool):
+        self.words[2] = 1 if value else 0
+    
+    @property
+    def ponder_job(self) -> int:
+        return int(self.words[3])
+    
+    @ponder_job.setter
+    def ponder_job(self, value: int):
+        self.words[3] = value
+    
+    def new_search(self) -> None:
+        """
+        Starts a new search generation (only the owner does, so attached searches share its age).
+        """
+        if self.owner:
+            self.words[1] = (int(self.words[1]) + 1) & AGE_MASK
+    
+    def clear(self) -> None:
+        self.words[HEADER_WORDS:] = 0
+        self.reset_stats()
+    
+    def _slot(self, key: int) -> int:
+        return HEADER_WORDS + (key & (self.n_buckets - 1)) * BUCKET_SIZE * 2
+    
+    def _read(self, w: int, key: int) -> Optional[int]:
+        """
+        Returns the data of a slot if it holds key (and wasn't torn), else None.
+        """
+        words = self.words
+        data = int(words[w + 1])
+        if data and int(words[w]) ^ data == key:
+            return data
+        return None
+    
+    def probe(self, key: int) -> Optional[Tuple[int, int, float, int]]:
+        i = self._slot(key)
+        for w in range(i, i + 2 * BUCKET_SIZE, 2):
+            data = self._read(w, key)
+            if data is not None:
+                self.hits += 1
+                return unpack_entry(data)[:4]
+        self.misses += 1
+        return None
+    
+    def store(self, key: int, depth: int, bound: int, score: float, move: int = NO_MOVE) -> None:
+        words = self.words
+        age = self.age
+        deep, last = self._slot(key), self._slot(key) + 2
+        
+        d_data = int(words[deep + 1])
+        d_depth, _, _, _, d_age = unpack_entry(d_data)
+        if not d_data or int(words[deep]) ^ d_data == key or depth >= d_depth or d_age != age:
+            w = deep
+        else:
+            w = last
+        
+        old = int(words[w + 1])
+        if old:
+            if int(words[w]) ^ old != key:
+                self.overwrites += 1
+            elif move == NO_MOVE:
+                move = unpack_entry(old)[3] # Keep the best move found by an earlier search of the position.
+        data = pack_entry(score, move, depth, bound, age)
+        self.stores += 1
+        words[w] = key ^ data
+        words[w + 1] = data
+    
+    @property
+    def filled(self) -> int:
+        return int(np.count_nonzero(self.words[HEADER_WORDS + 1::2]))
+    
+    @property
+    def nbytes(self) -> int:
+        return self.shm.size
+    
+    def close(self) -> None:
+        """
+        Detaches from the shared memory, and frees it if this table created it.
+        """
+        self.words = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+#
+# # #
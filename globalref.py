@@ -27,6 +27,8 @@ class GlobalAccessObject:
     """
     Generic superclass for objects which need access to global references.
     """
+    __slots__ = () # Keeps subclasses with __slots__ free of an instance __dict__.
+    
     OBJREF: GlobalReferenceObject = OBJREF
     
     @property
@@ -20,43 +20,46 @@ controlled_factions = (Loyalty.WHITE,
 from globalref import OBJREF
 
 
-# INITIALIZE ASSET LOADER
-from utils.asset_loader import AssetLoader
-asset_loader = AssetLoader()
-OBJREF.AL = asset_loader
+# Worker processes of the search bots import this module too (where they don't fork), only the main process starts the game.
+if __name__ == '__main__':
+    
+    # INITIALIZE ASSET LOADER
+    from utils.asset_loader import AssetLoader
+    asset_loader = AssetLoader()
+    OBJREF.AL = asset_loader
 
 
-# INITIALIZE BOARD
-from chess.board import Board
-# state_file = 'standard.json'
-# state_file = 'obstacle.json'
-# state_file = 'void.json'
-state_file = 'summoners.json'
-# state_file = 'zombie.json'
-JSON_STATE = os.path.join('_saved_states', state_file)
-board = Board(state_json=JSON_STATE,
-            #   controlled_factions=controlled_factions
-              )
-OBJREF.BOARD = board
+    # INITIALIZE BOARD
+    from chess.board import Board
+    # state_file = 'standard.json'
+    # state_file = 'obstacle.json'
+    # state_file = 'void.json'
+    state_file = 'summoners.json'
+    # state_file = 'zombie.json'
+    JSON_STATE = os.path.join('_saved_states', state_file)
+    board = Board(state_json=JSON_STATE,
+                #   controlled_factions=controlled_factions
+                  )
+    OBJREF.BOARD = board
 
 
-# INITIALIZE UI INSTANCE
-from ui.chess_ui import ChessUI
-ui = ChessUI.from_config()
-OBJREF.UI = ui
-ui.init_regions()
+    # INITIALIZE UI INSTANCE
+    from ui.chess_ui import ChessUI
+    ui = ChessUI.from_config()
+    OBJREF.UI = ui
+    ui.init_regions()
 
 
-# INITIALIZE INPUT HANDLER
-from ui.input_handler import InputHandler
-ih = InputHandler()
-OBJREF.IH = ih
+    # INITIALIZE INPUT HANDLER
+    from ui.input_handler import InputHandler
+    ih = InputHandler()
+    OBJREF.IH = ih
 
 
-# INITIALIZE GAME MANAGER
-from engine.game_manager import GameManager
-gm = GameManager(bots=debug_bots)
-OBJREF.GM = gm
+    # INITIALIZE GAME MANAGER
+    from engine.game_manager import GameManager
+    gm = GameManager(bots=debug_bots)
+    OBJREF.GM = gm
 
 
-gm.run()
+    gm.run()
@@ -10,13 +10,15 @@ from globalref import GlobalAccessObject
 import utils.chess_types as ct
 from utils.chess_types import Loyalty, PieceType, TileType
 from utils.chess_types import Position, Vector
-from utils.chess_types import DirCls as D
+from utils.chess_types import DirCls as D, vsub
 
 from chess.actions.action import Action
-from chess.actions.outcome import Outcome, Capture
+from chess.actions.outcome import MoveRecord, OutcomeKind
 from chess.tiles.tile import Tile
 from chess.units.piece import ChessPiece
 
+from engine.transposition import decode_move
+
 from utils.ui_utils import sprite_transform, UIClickable, UIRegion
 
 from ui.sidebar_ui import LeftSidebar
@@ -58,6 +60,12 @@ class ChessUI(GlobalAccessObject):
     # Hovered tile
     h_tile: Optional[Tile]
     
+    # Search preview (piece, target tile and outcome the thinking bot currently prefers)
+    p_tile: Optional[Tile]
+    p_target: Optional[Tile]
+    p_oc: Optional[MoveRecord]
+    p_key: Optional[int] # Position of the preview (Board.zobrist_key)
+    
     # Frame counter
     frame: int
     _hide_cursor: bool = False
@@ -101,6 +109,7 @@ class ChessUI(GlobalAccessObject):
         # TODO: property for protected field?
         self.s_tile: Optional[Tile] = None
         self.h_tile: Optional[Tile] = None
+        self.clear_preview()
         self.frame: int = 0
         
         self.left_ui = None
@@ -114,6 +123,7 @@ class ChessUI(GlobalAccessObject):
                                               size=(self.b_size[0], self.height - (self.b_origin[1] + self.b_size[1])))
         
     def draw(self):
+        self.update_preview()
         self.draw_background()
         
         # Board and pieces
@@ -146,9 +156,56 @@ class ChessUI(GlobalAccessObject):
             self.b_blit(img, t.position)
         
     def draw_tile_effects(self):
+        self.draw_search_preview()
         self.draw_selected()
         self.draw_hover()
     
+    def update_preview(self):
+        """
+        Poll the preview channel of the bot to move (see engine/preview.py), and find the tiles of a changed preview.
+        The move is looked up in the bot's preview_moves, so no outcomes are generated while the bot thinks.
+        """
+        board = self.board
+        if self.p_key is not None and self.p_key != board.zobrist_key:
+            self.clear_preview() # The position changed since the preview.
+        
+        bot = self.gm.bots.get(board.current_turn, None)
+        channel = bot.preview if bot is not None else None
+        if channel is None: return
+        preview = channel.poll()
+        if preview is None: return # Nothing changed.
+        
+        self.clear_preview()
+        if preview.key != board.zobrist_key or not preview.pv: return
+        code = preview.pv[0]
+        move = bot.preview_moves.get(code, None)
+        if move is None: return
+        sq, _kind, _target = decode_move(board, code)
+        self.p_tile = board.get_tile(board.geometry.positions[sq])
+        self.p_target, self.p_oc = move
+        self.p_key = preview.key
+    
+    def clear_preview(self):
+        self.p_tile = None
+        self.p_target = None
+        self.p_oc = None
+        self.p_key = None
+    
+    def draw_search_preview(self):
+        # Draw effects on the piece and target the thinking bot currently prefers
+        if self.p_tile is None or self.p_tile is self.s_tile: return
+        
+        img = self.al.tile_effect_sprites['selected']
+        img = sprite_transform(img=img,
+                               rotate_by=self.frame//(self.fps//4),
+                               size=self.tile_size)
+        self.b_blit(img, self.p_tile.position)
+        
+        if self.p_target is not None:
+            img = self.outcome_hover_effect(self.p_oc)
+            if img is not None:
+                self.b_blit(img, self.p_target.position)
+    
     def draw_selected(self):
         # Draw effects on selected + outcome tiles
         
@@ -167,13 +224,32 @@ class ChessUI(GlobalAccessObject):
         
         # Draw outcome tile effects
         for t, oc in preview_piece.outcomes.items():
-            img = oc.get_effect()
+            img = self.outcome_effect(oc)
             if img is not None:
                 self.b_blit(img, t.position)
             else:
                 print(f'TILE_EFFECT: No effect for outcome:', oc.name)
                 continue
             
+    def outcome_effect(self, oc: MoveRecord) -> Optional[Surface]:
+        """
+        Get the tile effect sprite for an outcome.
+        """
+        img = self.al.tile_effect_sprites.get(oc.effect, None) if oc.effect is not None else None
+        if img is None: return None
+        return sprite_transform(img=img,
+                                rotate_by=self.frame//(self.fps//4),
+                                size=self.tile_size)
+    
+    def outcome_hover_effect(self, oc: MoveRecord) -> Optional[Surface]:
+        """
+        Get the hovered tile effect sprite for an outcome.
+        """
+        imgs = self.al.tile_effect_sprites['blinds'].get(oc.effect, None) if oc.effect is not None else None
+        if imgs is None: return None
+        img = imgs[self.frame//(self.fps//4)%len(imgs)]
+        return sprite_transform(img=img, size=self.tile_size)
+    
     def draw_hover(self):
         # Draw effects on hovered tile (scrolling effect on hovered outcomes)
         if self.h_tile is None: return
@@ -182,8 +258,8 @@ class ChessUI(GlobalAccessObject):
         # Draw outcome hover effects
         if self.s_piece is not None and self.h_tile in self.s_piece.outcomes.keys():
             if self.h_tile in self.s_piece.outcomes:
-                oc: Outcome = self.s_piece.outcomes[self.h_tile]
-                img = oc.get_hover_effect()
+                oc: MoveRecord = self.s_piece.outcomes[self.h_tile]
+                img = self.outcome_hover_effect(oc)
                 if img is not None:
                     self.b_blit(img, self.h_pos)
                 else:
@@ -223,7 +299,7 @@ class ChessUI(GlobalAccessObject):
         capture_anim = moodle_sprites['capture']
         if self.s_piece is not None:
             h_oc = self.s_piece.outcomes.get(self.h_tile, None)
-            if h_oc is not None and isinstance(h_oc, Capture):
+            if h_oc is not None and h_oc.kind == OutcomeKind.CAPTURE:
                 img = capture_anim[self.frame//(self.fps//4)%len(capture_anim)]
                 img = sprite_transform(img, size=self.tile_size)
                 for p in h_oc.captured:
@@ -377,12 +453,12 @@ class ChessUI(GlobalAccessObject):
             
             # Draw an edge for the tile above
             if t.tiletype == TileType.VOID:
-                t1 = self.board.get_tile(t.position - D.f)
+                t1 = self.board.get_tile(vsub(t.position, D.f))
                 if t1 is not None and t1.tiletype != TileType.VOID:
-                    flt = self.board.get_tile(t.position - D.f_l)
-                    lt = self.board.get_tile(t.position - D.l)
-                    frt = self.board.get_tile(t.position - D.f_r)
-                    rt = self.board.get_tile(t.position - D.r)
+                    flt = self.board.get_tile(vsub(t.position, D.f_l))
+                    lt = self.board.get_tile(vsub(t.position, D.l))
+                    frt = self.board.get_tile(vsub(t.position, D.f_r))
+                    rt = self.board.get_tile(vsub(t.position, D.r))
                     # print(t.tiletype, t1.tiletype, flt.tiletype, lt.tiletype, frt.tiletype, rt.tiletype)
                     cont_left = flt is not None and flt.tiletype != TileType.VOID and (lt is None or lt.tiletype == TileType.VOID)
                     cont_right = frt is not None and frt.tiletype != TileType.VOID and (rt is None or rt.tiletype == TileType.VOID)
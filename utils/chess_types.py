@@ -6,8 +6,8 @@ from typing import TypeAlias, Tuple, Dict
 # Aliases for type hints
 # PieceType: TypeAlias = object # TODO: Deprecate w/ class reference
 # ChessObject: TypeAlias = object # TODO: Depreceate w/ class reference
-Vector: TypeAlias = Tuple[int, int]     # TODO: Use numpy array
-Position: TypeAlias = Tuple[int, int]   # TODO: Use numpy array
+Vector: TypeAlias = Tuple[int, int]     # (x, y) or relative (forward, right) int tuple
+Position: TypeAlias = Tuple[int, int]   # (x, y) int tuple
 # # #
 
 
@@ -73,52 +73,48 @@ InitFacing: Dict[Loyalty, Direction] = {
 }
 
 
-# Utility, allows class properties
-class classproperty(property):
-    def __get__(self, owner_self, owner_cls):
-        return self.fget(owner_cls)
+# # #
+# Tuple vector math
+#   Positions and vectors are immutable int tuples, so they can be shared and used as dict keys.
+def vadd(a: Vector, b: Vector) -> Vector:
+    return (a[0] + b[0], a[1] + b[1])
+
+def vsub(a: Vector, b: Vector) -> Vector:
+    return (a[0] - b[0], a[1] - b[1])
+
+def vscale(a: Vector, k: int) -> Vector:
+    return (a[0] * k, a[1] * k)
+
+def orient(vector: Vector, facing: Vector) -> Vector:
+    """
+    Orients a facing-relative vector [forward/backward, right/left] into board coords [x, y].
+    """
+    return (vector[0] * facing[1] + vector[1] * facing[0],
+            vector[1] * facing[1] + vector[0] * facing[0])
+# # #
 
 
-# TODO: Replace with simple dirvec (dv) namespace?
-#       This seems inane.
 class DirCls:
     """
-    Utility class for directional 2D numpy vectors.  
+    Utility class for directional 2D vectors (int tuples).
     """
+    f: Vector = Direction.NORTH.value
+    b: Vector = Direction.SOUTH.value
+    l: Vector = Direction.WEST.value
+    r: Vector = Direction.EAST.value
     
-    @classproperty
-    def f(cls) -> Vector:
-        return np.asarray(Direction.NORTH.value)
-    @classproperty
-    def b(cls) -> Vector:
-        return np.asarray(Direction.SOUTH.value)
-    @classproperty
-    def l(cls) -> Vector:
-        return np.asarray(Direction.WEST.value)
-    @classproperty
-    def r(cls) -> Vector:
-        return np.asarray(Direction.EAST.value)
-    
-    @classproperty
-    def f_l(cls) -> Vector:
-        return cls.f + cls.l
-    @classproperty
-    def f_r(cls) -> Vector:
-        return cls.f + cls.r
-    @classproperty
-    def b_l(cls) -> Vector:
-        return cls.b + cls.l
-    @classproperty
-    def b_r(cls) -> Vector:
-        return cls.b + cls.r
-    
-    @classproperty
-    def cardinal(cls) -> list[Vector]:
-        return (cls.f, cls.b, cls.l, cls.r)
-    @classproperty
-    def diagonal(cls) -> list[Vector]:
-        return (cls.f_l, cls.f_r, cls.b_l, cls.b_r)
+    f_l: Vector = vadd(f, l)
+    f_r: Vector = vadd(f, r)
+    b_l: Vector = vadd(b, l)
+    b_r: Vector = vadd(b, r)
     
-    @classproperty # HAHA rename this though jesus christ
-    def cardiagonal(cls) -> list[Vector]:
-        return cls.cardinal + cls.diagonal
+    cardinal: Tuple[Vector, ...] = (f, b, l, r)
+    diagonal: Tuple[Vector, ...] = (f_l, f_r, b_l, b_r)
+    cardiagonal: Tuple[Vector, ...] = cardinal + diagonal # HAHA rename this though jesus christ
+
+
+# Oriented direction constants, facing -> relative vector -> board vector.
+ORIENTED: Dict[Vector, Dict[Vector, Vector]] = {
+    facing: {v: orient(v, facing) for v in DirCls.cardiagonal}
+    for facing in (*(d.value for d in Direction), (0, 0))
+}
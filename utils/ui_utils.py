@@ -6,14 +6,32 @@ from utils.chess_types import Position, Vector
 from globalref import GlobalAccessObject
 
 # TODO: Relocate?
-pg.font.init()
-MHEADER_FONT = pg.font.Font("assets/fonts/merlin-16x16-monospaced.ttf", 16)
-MSTANDARD_FONT = pg.font.Font("assets/fonts/merlin-8x8-monospaced.ttf", 8)
-MTHIN_FONT = pg.font.Font("assets/fonts/merlin-light-8x8-monospaced.ttf", 8)
+# Fonts are loaded on first use (e.g. `from utils.ui_utils import STANDARD_FONT`), not at import.
+FONT_FILES: Dict[str, Tuple[str, int]] = {
+    'MHEADER_FONT': ("assets/fonts/merlin-16x16-monospaced.ttf", 16),
+    'MSTANDARD_FONT': ("assets/fonts/merlin-8x8-monospaced.ttf", 8),
+    'MTHIN_FONT': ("assets/fonts/merlin-light-8x8-monospaced.ttf", 8),
+    
+    'HEADER_FONT': ("assets/fonts/merlin-16x16.ttf", 16),
+    'STANDARD_FONT': ("assets/fonts/merlin-8x8.ttf", 8),
+    'THIN_FONT': ("assets/fonts/merlin-light-8x8.ttf", 8),
+}
+_fonts: Dict[str, pg.font.Font] = {}
+
+def get_font(name: str) -> pg.font.Font:
+    """
+    Returns a font from FONT_FILES, loading it on first use.
+    """
+    font = _fonts.get(name, None)
+    if font is None:
+        if not pg.font.get_init(): pg.font.init()
+        font = _fonts[name] = pg.font.Font(*FONT_FILES[name])
+    return font
 
-HEADER_FONT = pg.font.Font("assets/fonts/merlin-16x16.ttf", 16)
-STANDARD_FONT = pg.font.Font("assets/fonts/merlin-8x8.ttf", 8)
-THIN_FONT = pg.font.Font("assets/fonts/merlin-light-8x8.ttf", 8)
+def __getattr__(name: str):
+    if name in FONT_FILES:
+        return get_font(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # TODO: Add render_text args:
@@ -22,12 +40,13 @@ THIN_FONT = pg.font.Font("assets/fonts/merlin-light-8x8.ttf", 8)
 #       
 
 def render_text(text: str,
-                font: pg.font.Font = STANDARD_FONT,
+                font: Optional[pg.font.Font] = None,
                 color: Union[pg.Color, Tuple[int, int, int]] = (255, 255, 255),
                 scale: Optional[int] = None) -> pg.Surface:
     """
     Render text to a surface.
     """
+    if font is None: font = get_font('STANDARD_FONT')
     
     text_surface = font.render(text, True, color)
     if scale is not None: